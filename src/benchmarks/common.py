@@ -0,0 +1,136 @@
+# src/benchmarks/common.py
+
+"""
+Helpers shared by the benchmark scripts: latency summaries, the environment
+a run was made in, and result files that can be compared between commits.
+"""
+
+import json
+import os
+import platform
+import subprocess
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from src.utils import get_config
+
+PROJECT_ROOT = get_config.get_project_root()
+RESULTS_DIR = PROJECT_ROOT / "benchmark_results"
+
+
+def latency_summary(seconds: Sequence[float]) -> Dict[str, Optional[float]]:
+    """Mean, p50, p95, p99 and max of a list of durations, in milliseconds."""
+    if len(seconds) == 0:
+        return {"mean": None, "p50": None, "p95": None, "p99": None, "max": None}
+    milliseconds = np.asarray(seconds) * 1000
+    p50, p95, p99 = np.percentile(milliseconds, [50, 95, 99])
+    return {
+        "mean": round(float(milliseconds.mean()), 3),
+        "p50": round(float(p50), 3),
+        "p95": round(float(p95), 3),
+        "p99": round(float(p99), 3),
+        "max": round(float(milliseconds.max()), 3)
+    }
+
+
+def git_commit() -> Dict[str, Optional[str]]:
+    """Commit the tree is at, and whether it has uncommitted changes."""
+    def git(*args):
+        return subprocess.run(["git", *args], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True).stdout
+
+    try:
+        return {"commit": git("rev-parse", "HEAD").strip(), "dirty": bool(git("status", "--porcelain", "--untracked-files=no").strip())}
+    except (OSError, subprocess.CalledProcessError):
+        return {"commit": None, "dirty": None}
+
+
+def environment() -> Dict:
+    """Machine and interpreter a run was made on."""
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpu_count": os.cpu_count()
+    }
+
+
+def save_results(benchmark: str, settings: Dict, results: List[Dict], path: Optional[Path] = None) -> Path:
+    """
+    Write a run to a JSON file.
+
+    Args:
+        benchmark: Name of the benchmark, used in the default file name
+        settings: Parameters of the run
+        results: One dictionary per measurement
+        path: Output file (default benchmark_results/<benchmark>-<commit>-<timestamp>.json)
+
+    Returns:
+        The path written
+    """
+    revision = git_commit()
+    timestamp = time.strftime("%Y%m%dT%H%M%S")
+    if path is None:
+        path = RESULTS_DIR / f"{benchmark}-{(revision['commit'] or 'nogit')[:8]}-{timestamp}.json"
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    with open(path, "w") as file:
+        json.dump({
+            "benchmark": benchmark,
+            "created_at": timestamp,
+            **revision,
+            "environment": environment(),
+            "settings": settings,
+            "results": results
+        }, file, indent=2)
+    return path
+
+
+def load_results(path: Path) -> Dict:
+    with open(path, "r") as file:
+        return json.load(file)
+
+
+def format_table(rows: List[Dict], columns: Iterable[str]) -> str:
+    """Plain-text table of `rows` with one column per key in `columns`."""
+    columns = list(columns)
+    cells = [[("-" if row.get(column) is None else str(row.get(column))) for column in columns] for row in rows]
+    widths = [max([len(column)] + [len(line[i]) for line in cells]) for i, column in enumerate(columns)]
+    lines = ["  ".join(column.ljust(width) for column, width in zip(columns, widths)),
+             "  ".join("-" * width for width in widths)]
+    lines += ["  ".join(cell.rjust(width) for cell, width in zip(line, widths)) for line in cells]
+    return "\n".join(lines)
+
+
+def compare_results(previous: Dict, current: Dict, key: Sequence[str], metrics: Sequence[str]) -> str:
+    """
+    Table of `metrics` of two runs side by side, matching measurements on the
+    fields in `key` (e.g. endpoint and concurrency), with the relative change.
+    """
+    def flatten(result):
+        flat = dict(result)
+        for name, value in result.items():
+            if isinstance(value, dict):
+                flat.update({f"{name}.{inner}": inner_value for inner, inner_value in value.items()})
+        return flat
+
+    before = {tuple(flatten(result).get(field) for field in key): flatten(result) for result in previous["results"]}
+    rows = []
+    for result in map(flatten, current["results"]):
+        match = before.get(tuple(result.get(field) for field in key))
+        if match is None:
+            continue
+        row = {field: result.get(field) for field in key}
+        for metric in metrics:
+            old, new = match.get(metric), result.get(metric)
+            row[metric] = f"{old} -> {new}"
+            if old and new is not None:
+                row[metric] += f" ({(new - old) / old:+.1%})"
+        rows.append(row)
+
+    header = (f"{(previous.get('commit') or '?')[:8]} ({previous.get('created_at')}) -> "
+              f"{(current.get('commit') or '?')[:8]} ({current.get('created_at')})")
+    return header + "\n" + format_table(rows, list(key) + list(metrics))
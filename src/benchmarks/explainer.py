@@ -0,0 +1,202 @@
+# src/benchmarks/explainer.py
+
+"""
+Cost of the explainer backends of `explain.build_explainer`: the native
+booster contributions and shap.TreeExplainer.
+
+Each tree model (LightGBM, XGBoost, CatBoost) is trained like in the
+model_inference benchmark, whose artifacts in models/benchmark/ it shares.
+Every (model, backend) pair is then measured in a fresh process, so the
+backend pays its imports as a serving process would:
+    - startup: building the explainer, including importing shap for the
+      'shap' backend (the framework is already imported by loading the model)
+    - shap_values latency (p50/p95/p99 per call) and rows per second at each batch size
+    - agreement: largest absolute difference from shap's values and base value
+
+Usage:
+    python -m src.benchmarks.explainer
+    python -m src.benchmarks.explainer --models lightgbm --batch-sizes 1,1000 --min-seconds 1
+"""
+
+import argparse
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+
+from . import common
+from .model_inference import ARTIFACT_DIR, HOLDOUT_SAMPLE, _in_fresh_process, synthetic_matrix, train_artifact
+
+TREE_MODELS = ["lightgbm", "xgboost", "catboost"]
+BACKENDS = ["native", "shap"]
+BATCH_SIZES = [1, 10, 100, 1000]
+# Rows whose values are compared between backends
+AGREEMENT_ROWS = 100
+
+
+def _time_calls(explainer, batch, min_seconds: float, min_calls: int = 3, max_calls: int = 10000) -> List[float]:
+    explainer.shap_values(batch)
+    timings = []
+    started = time.perf_counter()
+    while len(timings) < max_calls and (len(timings) < min_calls or time.perf_counter() - started < min_seconds):
+        call_started = time.perf_counter()
+        explainer.shap_values(batch)
+        timings.append(time.perf_counter() - call_started)
+    return timings
+
+
+def measure_explainer(path: Path, backend: str, batch_sizes: List[int], seed: int, min_seconds: float) -> Dict:
+    """
+    Load an artifact, build its explainer and time `shap_values`; meant to run in a fresh process.
+
+    Returns:
+        Startup time, base value, the values of the first AGREEMENT_ROWS rows,
+        and one result per batch size
+    """
+    import joblib
+    from src.model import explain
+
+    X, _ = synthetic_matrix(max(max(batch_sizes), AGREEMENT_ROWS), seed, HOLDOUT_SAMPLE)
+    model = joblib.load(path)
+
+    started = time.perf_counter()
+    explainer = explain.build_explainer(model.model, backend)
+    startup_seconds = time.perf_counter() - started
+
+    values = np.asarray(explainer.shap_values(X.iloc[:AGREEMENT_ROWS]))
+    if values.ndim == 3:
+        values = values[:, :, 1]
+    expected_value = explainer.expected_value
+    if isinstance(expected_value, (list, np.ndarray)):
+        expected_value = np.ravel(expected_value)[-1]
+
+    batch_results = []
+    for size in batch_sizes:
+        timings = _time_calls(explainer, X.iloc[:size], min_seconds)
+        batch_results.append({
+            "batch_size": size,
+            "calls": len(timings),
+            "latency_ms": common.latency_summary(timings),
+            "rows_per_second": round(size * len(timings) / sum(timings), 1)
+        })
+
+    return {
+        "explainer": type(explainer).__name__,
+        "startup_seconds": round(startup_seconds, 3),
+        "expected_value": float(expected_value),
+        "values": values,
+        "batches": batch_results
+    }
+
+
+def benchmark_model(model_name: str, batch_sizes: List[int], train_rows: int, seed: int,
+                    min_seconds: float, retrain: bool) -> List[Dict]:
+    """Train (or reuse) one model and measure every backend on it; failures are recorded rather than raised."""
+    path = ARTIFACT_DIR / f"{model_name}.joblib"
+    try:
+        if retrain or not path.exists():
+            print(f"Training {model_name} on {train_rows} synthetic rows...")
+            _in_fresh_process(train_artifact, model_name, path, train_rows, seed)
+    except Exception as e:
+        print(f"{model_name} failed: {type(e).__name__}: {e}")
+        return [{"model": model_name, "backend": backend, "error": f"{type(e).__name__}: {e}"} for backend in BACKENDS]
+
+    results = []
+    for backend in BACKENDS:
+        result = {"model": model_name, "backend": backend}
+        try:
+            print(f"Measuring {model_name} with the {backend} explainer...")
+            result.update(_in_fresh_process(measure_explainer, path, backend, batch_sizes, seed, min_seconds))
+        except Exception as e:
+            print(f"{model_name} ({backend}) failed: {type(e).__name__}: {e}")
+            result["error"] = f"{type(e).__name__}: {e}"
+        results.append(result)
+
+    # Agreement with shap, the reference implementation
+    values = {result["backend"]: result.pop("values") for result in results if "values" in result}
+    reference = next((result for result in results if result["backend"] == "shap" and "error" not in result), None)
+    for result in results:
+        if reference is not None and result["backend"] in values:
+            result["max_abs_difference"] = float(np.max(np.abs(values[result["backend"]] - values["shap"])))
+            result["base_value_difference"] = abs(result["expected_value"] - reference["expected_value"])
+    return results
+
+
+def summary_tables(results: List[Dict], batch_sizes: List[int]) -> str:
+    """Startup and agreement per (model, backend), then p50 latency and throughput per batch size."""
+    overview, latency, throughput = [], [], []
+    for result in results:
+        row = {name: result.get(name) for name in
+               ["model", "backend", "explainer", "startup_seconds", "max_abs_difference", "base_value_difference"]}
+        if "error" in result:
+            row["explainer"] = "failed"
+        overview.append(row)
+
+        by_size = {batch["batch_size"]: batch for batch in result.get("batches", [])}
+        key = {"model": result["model"], "backend": result["backend"]}
+        latency.append({**key, **{
+            f"b={size}": by_size[size]["latency_ms"]["p50"] if size in by_size else None for size in batch_sizes
+        }})
+        throughput.append({**key, **{
+            f"b={size}": f"{by_size[size]['rows_per_second']:,.0f}" if size in by_size else None for size in batch_sizes
+        }})
+
+    columns = ["model", "backend"] + [f"b={size}" for size in batch_sizes]
+    return "\n\n".join([
+        common.format_table(overview, overview[0].keys()),
+        "shap_values p50 latency (ms) by batch size\n" + common.format_table(latency, columns),
+        "shap_values rows per second by batch size\n" + common.format_table(throughput, columns)
+    ])
+
+
+def main(args) -> Path:
+    model_names = args.models or TREE_MODELS
+    unknown = [name for name in model_names if name not in TREE_MODELS]
+    if unknown:
+        raise ValueError(f"Unknown models {unknown}. Available models: {TREE_MODELS}")
+
+    results = []
+    for name in model_names:
+        results += benchmark_model(name, args.batch_sizes, args.train_rows, args.seed, args.min_seconds, args.retrain)
+    print()
+    print(summary_tables(results, args.batch_sizes))
+
+    settings = {
+        "models": model_names,
+        "batch_sizes": args.batch_sizes,
+        "train_rows": args.train_rows,
+        "seed": args.seed,
+        "min_seconds": args.min_seconds
+    }
+    # One result per (model, backend, batch size), so runs compare like for like
+    flat = [
+        {**{key: value for key, value in result.items() if key != "batches"}, **batch}
+        for result in results for batch in result.get("batches", [{}])
+    ]
+    path = common.save_results("explainer", settings, flat, args.output)
+    print(f"\nResults saved to {path}")
+
+    if args.compare:
+        print(common.compare_results(
+            common.load_results(args.compare), common.load_results(path), ["model", "backend", "batch_size"],
+            ["latency_ms.p50", "rows_per_second", "startup_seconds"]
+        ))
+    return path
+
+
+if __name__ == "__main__":
+    def integers(value):
+        return [int(item) for item in value.split(",")]
+
+    parser = argparse.ArgumentParser(description="Benchmark the native and shap explainer backends.")
+    parser.add_argument("--models", type=lambda value: value.split(","), default=None,
+                        help="comma-separated tree models (default: lightgbm,xgboost,catboost)")
+    parser.add_argument("--batch-sizes", type=integers, default=BATCH_SIZES, help="comma-separated batch sizes")
+    parser.add_argument("--train-rows", type=int, default=20000, help="rows of the synthetic training matrix")
+    parser.add_argument("--min-seconds", type=float, default=0.5, help="minimum timing per batch size")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the synthetic matrices")
+    parser.add_argument("--retrain", action="store_true", help="train again even if an artifact exists")
+    parser.add_argument("--output", type=Path, default=None, help="result file (default benchmark_results/)")
+    parser.add_argument("--compare", type=Path, default=None, help="earlier result file to compare this run with")
+    main(parser.parse_args())
@@ -0,0 +1,336 @@
+# src/benchmarks/http_load.py
+
+"""
+HTTP load test of the API.
+
+The app is started in this process against a fresh SQLite database in a
+temporary directory, and generated credit applications are replayed at each
+requested concurrency against:
+
+    POST /predict/new_applicant     (scoring, SHAP and three inserts)
+    GET  /track/users/{user_id}     (users created by the run)
+    GET  /track/portfolio           (grows as the run adds users)
+
+For every endpoint and concurrency level the run reports throughput and
+p50/p95/p99 latency, and the results are saved as JSON (with the commit they
+were measured on) so runs can be compared between commits.
+
+With `--server uvicorn` (the default) requests go over a loopback socket to
+uvicorn running in a thread; `--server asgi` calls the app directly through
+httpx's ASGI transport, which leaves out the HTTP server. The client shares
+the interpreter with the app in both cases, so absolute throughput is lower
+than against a separate server process; compare runs made with the same
+settings on the same machine. SQL echo and httpx's per-request logging are
+turned off for the run.
+
+The run records whether the model or mock predictions were served, with the
+model and artifact versions. Without a model in models/ the app serves mock
+predictions, which are not comparable with model runs, so the run stops
+unless `--allow-mock` is given.
+
+Payloads are generated from the CreditApplication defaults, or cycled from a
+template file of applications (`--template`, JSONL as accepted by the bulk
+import) with fresh user IDs.
+
+Usage:
+    python -m src.benchmarks.http_load --requests 500 --concurrency 1,8,32
+    python -m src.benchmarks.http_load --compare benchmark_results/http_load-<commit>-<time>.json
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import logging
+import os
+import socket
+import tempfile
+import threading
+import time
+import typing
+from collections import Counter
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+import numpy as np
+
+from src.interface.schemas.credit_application import CreditApplication
+from . import common
+
+USER_FIELDS = ["user_id", "full_name", "email", "phone"]
+CATEGORIES = {
+    "NAME_EDUCATION_TYPE": ["Higher education", "Secondary / secondary special", "Incomplete higher",
+                            "Lower secondary", "Academic degree"],
+    "NAME_SELLER_INDUSTRY": ["Consumer electronics", "Connectivity", "Furniture", "Construction", "Clothing",
+                             "Industry", "Auto technology", "Jewelry", "XNA"],
+    "TRUECALR_FLAG": ["Red", "Blue", "Golden"]
+}
+
+# (method, url, json body or None)
+Request = Tuple[str, str, Optional[Dict]]
+
+
+def _base_type(annotation):
+    if typing.get_origin(annotation) is typing.Union:
+        return next(arg for arg in typing.get_args(annotation) if arg is not type(None))
+    return annotation
+
+
+def generate_applications(n: int, seed: int = 0, template: Optional[List[Dict]] = None,
+                          id_prefix: str = "LOAD") -> List[Dict]:
+    """
+    Build `n` CreditApplication payloads with unique user IDs.
+
+    Args:
+        n: Number of payloads
+        seed: Seed of the random values, so runs send the same data
+        template: Applications to cycle through instead of generated values
+        id_prefix: Prefix of the user IDs
+
+    Returns:
+        List of JSON-ready dictionaries
+    """
+    rng = np.random.default_rng(seed)
+    features = {name: field for name, field in CreditApplication.model_fields.items() if name not in USER_FIELDS}
+    applications = []
+    for i in range(n):
+        if template:
+            application = {name: value for name, value in template[i % len(template)].items()
+                           if name not in USER_FIELDS}
+        else:
+            application = {}
+            for name, field in features.items():
+                field_type, default = _base_type(field.annotation), field.default
+                if name in CATEGORIES:
+                    application[name] = str(rng.choice(CATEGORIES[name]))
+                elif field_type is float:
+                    # Spread around the default; zero defaults (rare drawings, revenue) stay mostly zero
+                    value = default * rng.lognormal(0, 0.5) if default else rng.exponential(100) * (rng.random() < 0.2)
+                    application[name] = round(float(value), 2)
+                elif field_type is int:
+                    application[name] = int(rng.integers(0, 2 * default + 2))
+                else:
+                    application[name] = default
+        user_id = f"{id_prefix}{i:07d}"
+        application.update({
+            "user_id": user_id,
+            "full_name": f"Load Test {i}",
+            "email": f"{user_id.lower()}@example.com",
+            "phone": None
+        })
+        applications.append(application)
+    return applications
+
+
+def _read_template(path: Path) -> List[Dict]:
+    with open(path, "r") as file:
+        return [json.loads(line) for line in file if line.strip()]
+
+
+async def run_requests(client: httpx.AsyncClient, requests: List[Request], concurrency: int) -> Dict:
+    """
+    Send `requests` with `concurrency` of them in flight at a time.
+
+    Returns:
+        Request count, errors (non-2xx responses and transport failures),
+        status counts, elapsed seconds, throughput, latency summary, and the
+        indices of the requests that succeeded
+    """
+    latencies = []
+    statuses = Counter()
+    succeeded = []
+    pending = iter(enumerate(requests))
+
+    async def worker():
+        for index, (method, url, body) in pending:
+            started = time.perf_counter()
+            try:
+                response = await client.request(method, url, json=body)
+                status = response.status_code
+            except httpx.HTTPError as e:
+                status = type(e).__name__
+            latencies.append(time.perf_counter() - started)
+            statuses[str(status)] += 1
+            if isinstance(status, int) and status < 400:
+                succeeded.append(index)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    return {
+        "requests": len(requests),
+        "errors": len(requests) - len(succeeded),
+        "statuses": dict(statuses),
+        "seconds": round(elapsed, 3),
+        "throughput_rps": round(len(requests) / elapsed, 2) if elapsed else None,
+        "latency_ms": common.latency_summary(latencies),
+        "succeeded": succeeded
+    }
+
+
+def served_model() -> Dict:
+    """Prediction mode, model version and artifact version of the app started in this process."""
+    from src.interface.services import credit_service
+    readiness = credit_service.get_readiness() or {}
+    return {key: readiness.get(key) for key in ["prediction_mode", "model_version", "artifact_version"]}
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@asynccontextmanager
+async def serve(app, server: str, timeout: float):
+    """An HTTP client talking to `app`, started (lifespan included) for the duration of the block."""
+    limits = httpx.Limits(max_connections=None, max_keepalive_connections=None)
+    if server == "asgi":
+        async with app.router.lifespan_context(app):
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://benchmark", timeout=timeout,
+                                         limits=limits) as client:
+                yield client
+        return
+
+    import uvicorn
+
+    port = _free_port()
+    uvicorn_server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    thread = threading.Thread(target=uvicorn_server.run, daemon=True, name="uvicorn")
+    thread.start()
+    try:
+        while not uvicorn_server.started:
+            if not thread.is_alive():
+                raise RuntimeError("uvicorn failed to start")
+            await asyncio.sleep(0.05)
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", timeout=timeout, limits=limits) as client:
+            yield client
+    finally:
+        uvicorn_server.should_exit = True
+        thread.join()
+
+
+async def run_benchmark(app, concurrency_levels: List[int], requests: int, portfolio_requests: int,
+                        warmup: int, server: str, timeout: float, seed: int,
+                        template: Optional[List[Dict]], allow_mock: bool = False) -> Tuple[Dict, List[Dict]]:
+    """
+    Run every endpoint at every concurrency level.
+
+    Returns:
+        The model served (see `served_model`), and one result per (endpoint, concurrency)
+    """
+    results = []
+    created = []
+    rng = np.random.default_rng(seed)
+    batches = itertools.count()
+
+    def new_applicants(n):
+        applications = generate_applications(n, seed + len(created), template, id_prefix=f"LOAD{next(batches)}_")
+        return [("POST", "/predict/new_applicant", application) for application in applications]
+
+    def user_details(n):
+        return [("GET", f"/track/users/{user_id}", None) for user_id in rng.choice(created, size=n)]
+
+    async with serve(app, server, timeout) as client:
+        serving = served_model()
+        print(f"Serving {serving['prediction_mode']} predictions (model {serving['model_version']})")
+        if serving["prediction_mode"] != "model" and not allow_mock:
+            raise RuntimeError("The app serves mock predictions (no model in models/); "
+                               "pass --allow-mock to load test them anyway")
+
+        # Warm-up: first requests pay for imports, connection setup and caches
+        warmup_requests = new_applicants(warmup)
+        outcome = await run_requests(client, warmup_requests, max(concurrency_levels))
+        created.extend(warmup_requests[i][2]["user_id"] for i in outcome["succeeded"])
+        if not created:
+            raise RuntimeError(f"Every warm-up request failed: {outcome['statuses']}")
+        await run_requests(client, user_details(warmup) + [("GET", "/track/portfolio", None)], 1)
+
+        for concurrency in concurrency_levels:
+            # Built lazily: user lookups draw from the users the applicant phase just created
+            phases = [
+                ("POST /predict/new_applicant", lambda: new_applicants(requests)),
+                ("GET /track/users/{user_id}", lambda: user_details(requests)),
+                ("GET /track/portfolio", lambda: [("GET", "/track/portfolio", None)] * portfolio_requests)
+            ]
+            for endpoint, build_requests in phases:
+                phase_requests = build_requests()
+                outcome = await run_requests(client, phase_requests, concurrency)
+                if endpoint.startswith("POST"):
+                    created.extend(phase_requests[i][2]["user_id"] for i in outcome["succeeded"])
+                del outcome["succeeded"]
+
+                result = {"endpoint": endpoint, "concurrency": concurrency, "portfolio_users": len(created), **outcome}
+                results.append(result)
+                latency = result["latency_ms"]
+                print(f"{endpoint:<30} c={concurrency:<4} {result['throughput_rps']:>8} req/s  "
+                      f"p50 {latency['p50']} ms  p95 {latency['p95']} ms  p99 {latency['p99']} ms  "
+                      f"errors {result['errors']}")
+    return serving, results
+
+
+def main(args) -> Path:
+    database_dir = Path(tempfile.mkdtemp(prefix="credit-load-"))
+    # Read by the database module on import, so it has to be set before the app is imported
+    os.environ["DATABASE_URL"] = f"sqlite:///{database_dir / 'load_test.db'}"
+
+    from src.interface.app import app
+    from src.interface.database import connection
+    connection.engine.echo = False
+    # httpx logs every request at INFO, which would be written inside the timed window
+    for logger_name in ["httpx", "httpcore"]:
+        logging.getLogger(logger_name).setLevel(logging.WARNING)
+
+    template = _read_template(args.template) if args.template else None
+    print(f"Load testing with the {args.server} server, database in {database_dir}")
+    serving, results = asyncio.run(run_benchmark(
+        app, args.concurrency, args.requests, args.portfolio_requests, args.warmup,
+        args.server, args.timeout, args.seed, template, args.allow_mock
+    ))
+
+    settings = {
+        "server": args.server,
+        "concurrency": args.concurrency,
+        "requests": args.requests,
+        "portfolio_requests": args.portfolio_requests,
+        "warmup": args.warmup,
+        "seed": args.seed,
+        "template": str(args.template) if args.template else None,
+        **serving
+    }
+    path = common.save_results("http_load", settings, results, args.output)
+    print(f"Results saved to {path}")
+
+    if args.compare:
+        previous = common.load_results(args.compare)
+        previous_mode = previous["settings"].get("prediction_mode")
+        if previous_mode != serving["prediction_mode"]:
+            print(f"Warning: comparing {previous_mode or 'unrecorded'} predictions with {serving['prediction_mode']} ones")
+        print(common.compare_results(
+            previous, common.load_results(path), ["endpoint", "concurrency"],
+            ["throughput_rps", "latency_ms.p50", "latency_ms.p95", "latency_ms.p99"]
+        ))
+    return path
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load test the credit risk API in-process.")
+    parser.add_argument("--concurrency", type=lambda value: [int(level) for level in value.split(",")],
+                        default=[1, 8, 32], help="comma-separated concurrency levels (default 1,8,32)")
+    parser.add_argument("--requests", type=int, default=500, help="requests per level to the applicant and user endpoints")
+    parser.add_argument("--portfolio-requests", type=int, default=50, help="requests per level to /track/portfolio")
+    parser.add_argument("--warmup", type=int, default=20, help="unrecorded requests sent first")
+    parser.add_argument("--server", choices=["uvicorn", "asgi"], default="uvicorn",
+                        help="uvicorn on a loopback port, or the app called directly over ASGI")
+    parser.add_argument("--timeout", type=float, default=60.0, help="per-request timeout in seconds")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the generated payloads")
+    parser.add_argument("--template", type=Path, default=None, help="JSONL applications to replay instead of generated ones")
+    parser.add_argument("--allow-mock", action="store_true",
+                        help="run even if no model is loaded and mock predictions are served")
+    parser.add_argument("--output", type=Path, default=None, help="result file (default benchmark_results/)")
+    parser.add_argument("--compare", type=Path, default=None, help="earlier result file to compare this run with")
+    main(parser.parse_args())
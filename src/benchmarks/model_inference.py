@@ -0,0 +1,316 @@
+# src/benchmarks/model_inference.py
+
+"""
+Inference cost of every model wrapper built by `train.get_model`.
+
+Each model is trained (with its factory defaults) on a fixed synthetic matrix
+with the columns of clean_train_data.csv: the numerical features after
+scaling and the one-hot encoded categorical modes, without `drop_cols`.
+Trained artifacts are kept in models/benchmark/ and reused by later runs
+unless `--retrain` is given.
+
+Every artifact is then measured in a fresh process, so backend imports and
+memory are those a serving process would pay:
+    - load time: importing the model framework and unpickling the artifact
+    - model memory: resident memory added by loading it
+    - peak memory: highest resident memory above the baseline while predicting
+    - predict_proba latency (p50/p95/p99 per call) and rows per second at each batch size
+    - PR AUC and ROC AUC on held-out rows of the training distribution, to weigh cost against quality
+
+Usage:
+    python -m src.benchmarks.model_inference
+    python -m src.benchmarks.model_inference --models lightgbm,xgboost --batch-sizes 1,100,10000 --threads 1
+"""
+
+import argparse
+import gc
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.utils import artifacts, get_config
+from . import common
+
+config = get_config.read_yaml()
+
+ARTIFACT_DIR = artifacts.model_path("benchmark")
+BATCH_SIZES = [1, 10, 100, 1000, 10000, 100000]
+# Samples of `synthetic_matrix`: rows to train on, and held-out rows to measure on
+TRAIN_SAMPLE = 1
+HOLDOUT_SAMPLE = 2
+# Held-out rows PR AUC and ROC AUC are computed on
+EVAL_ROWS = 20000
+
+# Categories of the one-hot encoded modes, as they appear in the Home Credit data
+CATEGORIES = {
+    "NAME_EDUCATION_TYPE_mode": ["Academic degree", "Higher education", "Incomplete higher", "Lower secondary",
+                                 "Missing", "Secondary / secondary special"],
+    "NAME_SELLER_INDUSTRY_mode": ["Auto technology", "Clothing", "Connectivity", "Construction",
+                                  "Consumer electronics", "Furniture", "Industry", "Jewelry", "MLM partners",
+                                  "Missing", "Tourism", "XNA"],
+    "TRUECALR_FLAG": ["Blue", "Golden", "Red"]
+}
+
+
+def feature_columns() -> List[str]:
+    """Model input columns of clean_train_data.csv, in order."""
+    drop_cols = set(config['data']['drop_cols'])
+    columns = list(config['data']['numerical_final'])
+    for column in config['data']['categorical_final']:
+        columns += [f"{column}_{category}" for category in CATEGORIES[column]]
+    return [column for column in columns if column not in drop_cols]
+
+
+def synthetic_matrix(n_rows: int, seed: int, sample: int = TRAIN_SAMPLE) -> Tuple[pd.DataFrame, pd.Series]:
+    """
+    Scaled numerical features, one-hot modes and a TARGET with the default
+    rate of the real data (1 in 1 + zero_to_one_ratio).
+
+    TARGET is the same function of the features for every sample and row
+    count: its weights and threshold come from a generator of their own,
+    seeded with `seed` only, while each `sample` draws its rows from another.
+    A model trained on TRAIN_SAMPLE can thus be evaluated on HOLDOUT_SAMPLE.
+
+    The matrix is filled column by column into one float64 block, so building
+    it takes little more memory than the result.
+    """
+    rng = np.random.default_rng([seed, sample])
+    columns = feature_columns()
+    numerical = [c for c in columns if c in set(config['data']['numerical_final'])]
+    values = np.empty((n_rows, len(columns)))
+
+    for i in range(len(numerical)):
+        values[:, i] = rng.standard_normal(n_rows)
+    position = len(numerical)
+    for column in config['data']['categorical_final']:
+        encoded = [c for c in columns if c.startswith(f"{column}_")]
+        if not encoded:
+            continue
+        chosen = rng.integers(0, len(encoded), n_rows)
+        values[:, position:position + len(encoded)] = chosen[:, None] == np.arange(len(encoded))
+        position += len(encoded)
+
+    # Default risk driven by a handful of features, plus noise
+    target_rng = np.random.default_rng([seed, 0])
+    drivers = min(12, len(numerical))
+    weights = np.zeros(len(columns))
+    weights[target_rng.choice(len(numerical), size=drivers, replace=False)] = target_rng.normal(0, 1.0, drivers)
+    # The drivers are standard normal, so the score's distribution, and the
+    # threshold giving the default rate, depend on the weights alone
+    rate = 1 / (1 + config['data']['zero_to_one_ratio'])
+    reference = target_rng.normal(0, np.linalg.norm(weights), 200000) + target_rng.logistic(size=200000)
+    threshold = np.quantile(reference, 1 - rate)
+
+    score = values @ weights + rng.logistic(size=n_rows)
+    target = (score > threshold).astype(int)
+
+    return pd.DataFrame(values, columns=columns), pd.Series(target, name=config['data']['target'])
+
+
+def _resident_bytes() -> int:
+    import psutil
+    return psutil.Process().memory_info().rss
+
+
+def _peak_resident_bytes() -> int:
+    """Highest resident memory of this process so far."""
+    try:
+        import resource
+    except ImportError:
+        # Windows
+        import psutil
+        return psutil.Process().memory_info().peak_wset
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def train_artifact(model_name: str, path: Path, train_rows: int, seed: int) -> Dict:
+    """Train `model_name` with its default parameters and save it to `path`."""
+    from src.model import train
+
+    X, y = synthetic_matrix(train_rows, seed)
+    started = time.perf_counter()
+    model = train.get_model(model_name, None).fit(X, y)
+    train_seconds = time.perf_counter() - started
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    model.save(path)
+    return {"train_seconds": round(train_seconds, 3)}
+
+
+def _time_calls(model, batch: pd.DataFrame, min_seconds: float, min_calls: int = 3, max_calls: int = 10000) -> List[float]:
+    model.predict_proba(batch)
+    timings = []
+    started = time.perf_counter()
+    while len(timings) < max_calls and (len(timings) < min_calls or time.perf_counter() - started < min_seconds):
+        call_started = time.perf_counter()
+        model.predict_proba(batch)
+        timings.append(time.perf_counter() - call_started)
+    return timings
+
+
+def measure_artifact(path: Path, batch_sizes: List[int], seed: int, min_seconds: float,
+                     eval_rows: int = EVAL_ROWS) -> Dict:
+    """
+    Load an artifact and time `predict_proba`; meant to run in a fresh process.
+
+    Returns:
+        Load time, memory, quality on `eval_rows` held-out rows, and one result per batch size
+    """
+    from sklearn.metrics import average_precision_score, roc_auc_score
+
+    # Quality is measured on its own matrix, so it does not change with the batch sizes
+    X_eval, y_eval = synthetic_matrix(eval_rows, seed, HOLDOUT_SAMPLE)
+    X, _ = synthetic_matrix(max(batch_sizes), seed, HOLDOUT_SAMPLE)
+    batches = {size: X.iloc[:size] for size in batch_sizes}
+    gc.collect()
+    baseline = _resident_bytes()
+
+    started = time.perf_counter()
+    import joblib
+    model = joblib.load(path)
+    load_seconds = time.perf_counter() - started
+    model_bytes = _resident_bytes() - baseline
+
+    probabilities = model.predict_proba(X_eval)[:, 1]
+    batch_results = []
+    for size in batch_sizes:
+        timings = _time_calls(model, batches[size], min_seconds)
+        batch_results.append({
+            "batch_size": size,
+            "calls": len(timings),
+            "latency_ms": common.latency_summary(timings),
+            "rows_per_second": round(size * len(timings) / sum(timings), 1)
+        })
+
+    return {
+        "load_seconds": round(load_seconds, 3),
+        "model_mb": round(model_bytes / 2 ** 20, 1),
+        "peak_mb": round((_peak_resident_bytes() - baseline) / 2 ** 20, 1),
+        "pr_auc": round(float(average_precision_score(y_eval, probabilities)), 4),
+        "roc_auc": round(float(roc_auc_score(y_eval, probabilities)), 4),
+        "batches": batch_results
+    }
+
+
+def _in_fresh_process(function, *args):
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+        return executor.submit(function, *args).result()
+
+
+def benchmark_model(model_name: str, batch_sizes: List[int], train_rows: int, seed: int,
+                    min_seconds: float, retrain: bool, eval_rows: int = EVAL_ROWS) -> Dict:
+    """Train (or reuse) and measure one model; failures are recorded rather than raised."""
+    path = ARTIFACT_DIR / f"{model_name}.joblib"
+    result = {"model": model_name}
+    try:
+        if retrain or not path.exists():
+            print(f"Training {model_name} on {train_rows} synthetic rows...")
+            result.update(_in_fresh_process(train_artifact, model_name, path, train_rows, seed))
+        result["artifact_mb"] = round(path.stat().st_size / 2 ** 20, 2)
+        print(f"Measuring {model_name}...")
+        result.update(_in_fresh_process(measure_artifact, path, batch_sizes, seed, min_seconds, eval_rows))
+    except Exception as e:
+        print(f"{model_name} failed: {type(e).__name__}: {e}")
+        result["error"] = f"{type(e).__name__}: {e}"
+    return result
+
+
+def summary_tables(results: List[Dict], batch_sizes: List[int]) -> str:
+    """Cost and quality per model, then p50 latency and throughput per batch size."""
+    overview, latency, throughput = [], [], []
+    for result in results:
+        row = {name: result.get(name) for name in
+               ["model", "pr_auc", "roc_auc", "train_seconds", "artifact_mb", "load_seconds", "model_mb", "peak_mb"]}
+        if "error" in result:
+            row["pr_auc"] = "failed"
+        overview.append(row)
+
+        by_size = {batch["batch_size"]: batch for batch in result.get("batches", [])}
+        latency.append({"model": result["model"], **{
+            f"b={size}": by_size[size]["latency_ms"]["p50"] if size in by_size else None for size in batch_sizes
+        }})
+        throughput.append({"model": result["model"], **{
+            f"b={size}": f"{by_size[size]['rows_per_second']:,.0f}" if size in by_size else None for size in batch_sizes
+        }})
+
+    columns = [f"b={size}" for size in batch_sizes]
+    return "\n\n".join([
+        common.format_table(overview, overview[0].keys()),
+        "predict_proba p50 latency (ms) by batch size\n" + common.format_table(latency, ["model"] + columns),
+        "predict_proba rows per second by batch size\n" + common.format_table(throughput, ["model"] + columns)
+    ])
+
+
+def main(args) -> Path:
+    from src.model import train
+
+    if args.threads:
+        # Inherited by the measuring processes: OpenMP (LightGBM, XGBoost), BLAS and torch
+        for variable in ["OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS"]:
+            os.environ[variable] = str(args.threads)
+
+    model_names = args.models or list(train.MODELS)
+    unknown = [name for name in model_names if name not in train.MODELS]
+    if unknown:
+        raise ValueError(f"Unknown models {unknown}. Available models: {list(train.MODELS)}")
+
+    print(f"Matrix of {len(feature_columns())} features; batch sizes {args.batch_sizes}")
+    results = [
+        benchmark_model(name, args.batch_sizes, args.train_rows, args.seed, args.min_seconds, args.retrain,
+                        args.eval_rows)
+        for name in model_names
+    ]
+    print()
+    print(summary_tables(results, args.batch_sizes))
+
+    settings = {
+        "models": model_names,
+        "batch_sizes": args.batch_sizes,
+        "train_rows": args.train_rows,
+        "eval_rows": args.eval_rows,
+        "features": len(feature_columns()),
+        "seed": args.seed,
+        "min_seconds": args.min_seconds,
+        "threads": args.threads
+    }
+    # One result per (model, batch size), so runs compare like for like
+    flat = [
+        {**{key: value for key, value in result.items() if key != "batches"}, **batch}
+        for result in results for batch in result.get("batches", [{}])
+    ]
+    path = common.save_results("model_inference", settings, flat, args.output)
+    print(f"\nResults saved to {path}")
+
+    if args.compare:
+        print(common.compare_results(
+            common.load_results(args.compare), common.load_results(path), ["model", "batch_size"],
+            ["latency_ms.p50", "rows_per_second", "load_seconds", "peak_mb"]
+        ))
+    return path
+
+
+if __name__ == "__main__":
+    def integers(value):
+        return [int(item) for item in value.split(",")]
+
+    parser = argparse.ArgumentParser(description="Benchmark predict_proba of every model wrapper.")
+    parser.add_argument("--models", type=lambda value: value.split(","), default=None,
+                        help="comma-separated model names (default: all of train.get_model)")
+    parser.add_argument("--batch-sizes", type=integers, default=BATCH_SIZES, help="comma-separated batch sizes")
+    parser.add_argument("--train-rows", type=int, default=20000, help="rows of the synthetic training matrix")
+    parser.add_argument("--eval-rows", type=int, default=EVAL_ROWS, help="held-out rows PR AUC and ROC AUC are computed on")
+    parser.add_argument("--min-seconds", type=float, default=0.5, help="minimum timing per batch size")
+    parser.add_argument("--threads", type=int, default=None, help="limit framework threads (default: library default)")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the synthetic matrices")
+    parser.add_argument("--retrain", action="store_true", help="train again even if an artifact exists")
+    parser.add_argument("--output", type=Path, default=None, help="result file (default benchmark_results/)")
+    parser.add_argument("--compare", type=Path, default=None, help="earlier result file to compare this run with")
+    main(parser.parse_args())
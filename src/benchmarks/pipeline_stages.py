@@ -0,0 +1,395 @@
+# src/benchmarks/pipeline_stages.py
+
+"""
+Per-stage cost of the data pipeline (`main.process_data`) as the data grows.
+
+For each requested number of applicants a fresh process writes synthetic
+Kaggle tables (application_train, previous_application and
+credit_card_balance, see `write_raw_tables`) to a temporary directory,
+points the pipeline's raw, processed and model directories there (the real
+data and the saved preprocessor are never touched) and runs merge_data,
+fabricate_features, engineer_features, split_data and the three clean calls
+without prompting. Every stage records:
+
+    - wall time and CPU time (all threads of the process)
+    - peak resident memory while it ran
+    - bytes read and written through file system calls
+
+Together the sizes give a scaling curve: time and memory of each stage
+against the number of applicants, with the growth exponent between the
+smallest and largest size (1 is linear). A size that crashes, or exceeds
+`--memory-limit-mb`, is reported with the stage it failed in, which shows
+the first stage to break as the data grows.
+
+Usage:
+    python -m src.benchmarks.pipeline_stages --rows 1000,10000,100000
+    python -m src.benchmarks.pipeline_stages --rows 10000,100000,1000000 --memory-limit-mb 4096 --plot scaling.png
+"""
+
+import argparse
+import contextlib
+import json
+import math
+import multiprocessing
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+import psutil
+
+from src.data_processing import fabricate
+from src.utils import get_config
+from . import common
+
+config = get_config.read_yaml()
+
+STAGES = ["merge_data", "fabricate_features", "engineer_features", "split_data",
+          "clean_train", "clean_val", "clean_test"]
+DEFAULT_ROWS = [1000, 10000, 100000]
+
+
+class PeakMemory:
+    """
+    Highest resident memory while the block runs: exact on Linux (the
+    kernel's high-water mark, reset on entry), elsewhere sampled every 5 ms.
+    """
+
+    def __enter__(self):
+        self.peak = 0
+        self._exact = self._reset_high_water_mark()
+        if not self._exact:
+            self._stop = threading.Event()
+            self._sampler = threading.Thread(target=self._sample, daemon=True)
+            self._sampler.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        if self._exact:
+            self.peak = self._high_water_mark()
+        else:
+            self._stop.set()
+            self._sampler.join()
+
+    @staticmethod
+    def _reset_high_water_mark() -> bool:
+        try:
+            with open("/proc/self/clear_refs", "w") as file:
+                file.write("5")
+            return True
+        except OSError:
+            return False
+
+    @staticmethod
+    def _high_water_mark() -> int:
+        with open("/proc/self/status") as file:
+            for line in file:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+        return 0
+
+    def _sample(self):
+        process = psutil.Process()
+        while not self._stop.is_set():
+            self.peak = max(self.peak, process.memory_info().rss)
+            self._stop.wait(0.005)
+        self.peak = max(self.peak, process.memory_info().rss)
+
+
+def _io_chars(process) -> Optional[Dict[str, int]]:
+    """Bytes passed to read/write calls (page cache included), or None where the platform has no counters."""
+    try:
+        counters = process.io_counters()
+    except (AttributeError, psutil.Error):
+        return None
+    return {
+        "read": getattr(counters, "read_chars", counters.read_bytes),
+        "written": getattr(counters, "write_chars", counters.write_bytes)
+    }
+
+
+class StageRecorder:
+    """
+    Measures the stages of one pipeline run. Progress is also appended to a
+    JSONL file, so the stage a crashed run died in is known to the parent.
+    """
+
+    def __init__(self, progress_path: Path):
+        self.progress_path = progress_path
+        self.results = []
+        self._process = psutil.Process()
+
+    def _log(self, entry: Dict):
+        with open(self.progress_path, "a") as file:
+            file.write(json.dumps(entry) + "\n")
+
+    @contextlib.contextmanager
+    def stage(self, name: str):
+        self._log({"stage": name, "status": "started"})
+        io_before = _io_chars(self._process)
+        cpu_started = time.process_time()
+        started = time.perf_counter()
+        with PeakMemory() as memory:
+            yield
+        io_after = _io_chars(self._process)
+
+        result = {
+            "stage": name,
+            "wall_seconds": round(time.perf_counter() - started, 3),
+            "cpu_seconds": round(time.process_time() - cpu_started, 3),
+            "peak_rss_mb": round(memory.peak / 2 ** 20, 1),
+            "read_mb": round((io_after["read"] - io_before["read"]) / 2 ** 20, 2) if io_before else None,
+            "written_mb": round((io_after["written"] - io_before["written"]) / 2 ** 20, 2) if io_before else None,
+        }
+        self.results.append(result)
+        self._log({**result, "status": "completed"})
+
+
+def write_raw_tables(directory: Path, n_applicants: int, seed: int) -> Dict[str, int]:
+    """
+    Write synthetic versions of the three Kaggle tables merge_data reads,
+    with the columns of `cols_to_use` and the distributions the applicant
+    generator in `fabricate` uses.
+
+    Returns:
+        Rows written per file
+    """
+    rng = np.random.default_rng(seed)
+    directory.mkdir(parents=True, exist_ok=True)
+    ids = np.arange(100000, 100000 + n_applicants)
+
+    application = {config['data']['id']: ids}
+    for feature in fabricate.APPLICATION_DEFINITIONS:
+        values, probabilities = feature['params']
+        application[feature['short_name']] = rng.choice(values, size=n_applicants, p=probabilities)
+    education, probabilities = fabricate.MODE_DEFINITIONS['NAME_EDUCATION_TYPE']
+    application['NAME_EDUCATION_TYPE'] = rng.choice(education, size=n_applicants, p=probabilities)
+    rate = 1 / (1 + config['data']['zero_to_one_ratio'])
+    application[config['data']['target']] = (rng.random(n_applicants) < rate).astype(int)
+
+    # Previous applications, several per applicant
+    previous_counts = np.where(rng.random(n_applicants) < fabricate.NO_PREVIOUS_SHARE, 0,
+                               1 + rng.poisson(fabricate.MEAN_PREVIOUS_APPLICATIONS - 1, n_applicants))
+    n_previous = int(previous_counts.sum())
+    industry, probabilities = fabricate.MODE_DEFINITIONS['NAME_SELLER_INDUSTRY']
+    previous = {
+        config['data']['id']: np.repeat(ids, previous_counts),
+        'NAME_SELLER_INDUSTRY': rng.choice(industry, size=n_previous, p=probabilities),
+        'SELLERPLACE_AREA': np.where(rng.random(n_previous) < fabricate.SELLERPLACE_AREA_UNKNOWN_SHARE, -1,
+                                     np.round(rng.lognormal(5, 1.5, n_previous))).astype(int)
+    }
+
+    # Credit card balance, one row per month of card holders
+    months = np.where(rng.random(n_applicants) < fabricate.CARD_HOLDER_SHARE,
+                      1 + rng.poisson(fabricate.MEAN_CARD_MONTHS - 1, n_applicants), 0)
+    owner = np.repeat(np.arange(n_applicants), months)
+    card = {config['data']['id']: ids[owner]}
+    totals = {'AMT': 0.0, 'CNT': 0.0}
+    for channel, definition in fabricate.DRAWING_CHANNELS.items():
+        draws = (rng.random(n_applicants) >= definition['zero_share'])[owner]
+        amount = np.where(draws, fabricate._lognormal(rng, *definition['params'], len(owner)), 0.0).round(2)
+        count = np.round(amount / definition['ticket'])
+        card[f'AMT_DRAWINGS_{channel}_CURRENT'] = amount
+        card[f'CNT_DRAWINGS_{channel}_CURRENT'] = count
+        totals['AMT'] = totals['AMT'] + amount
+        totals['CNT'] = totals['CNT'] + count
+    card['AMT_DRAWINGS_CURRENT'] = totals['AMT']
+    card['CNT_DRAWINGS_CURRENT'] = totals['CNT']
+
+    tables = {"application_train.csv": application, "previous_application.csv": previous,
+              "credit_card_balance.csv": card}
+    for filename, columns in tables.items():
+        pd.DataFrame(columns).to_csv(directory / filename, index=False)
+    return {filename: len(next(iter(columns.values()))) for filename, columns in tables.items()}
+
+
+@contextlib.contextmanager
+def redirected_paths(workdir: Path):
+    """Point the data and model directories of the pipeline modules into `workdir`."""
+    from src.data_processing import feature_engineer, merge, preprocess, split
+    from src.utils import artifacts, read_file
+
+    # Joined as strings by some modules, so keep the trailing slash
+    paths = {
+        'raw_data_directory': f"{workdir / 'raw_data'}/",
+        'processed_data_directory': f"{workdir / 'processed_data'}/",
+        'model_data_directory': f"{workdir / 'models'}/",
+    }
+    for path in paths.values():
+        Path(path).mkdir(parents=True, exist_ok=True)
+
+    modules = [merge, fabricate, feature_engineer, split, preprocess, read_file, artifacts]
+    saved = [dict(module.config['paths']) for module in modules]
+    for module in modules:
+        module.config['paths'].update(paths)
+    try:
+        yield paths
+    finally:
+        for module, original in zip(modules, saved):
+            module.config['paths'].clear()
+            module.config['paths'].update(original)
+
+
+def run_pipeline(n_applicants: int, seed: int, workdir: Path, memory_limit_mb: Optional[int],
+                 verbose: bool) -> Dict:
+    """
+    Generate inputs for `n_applicants` and run the pipeline on them;
+    meant to run in a fresh process.
+
+    Returns:
+        Rows per input file, input generation time, and one result per stage
+    """
+    from src import main
+
+    if memory_limit_mb:
+        import resource
+        limit = memory_limit_mb * 2 ** 20
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+    recorder = StageRecorder(workdir / "progress.jsonl")
+    log = open(workdir / "pipeline.log", "w")
+    with log, redirected_paths(workdir) as paths, \
+            contextlib.redirect_stdout(sys.stdout if verbose else log):
+        started = time.perf_counter()
+        input_rows = write_raw_tables(Path(paths['raw_data_directory']), n_applicants, seed)
+        input_seconds = time.perf_counter() - started
+        main.process_data(download=False, stage=recorder.stage)
+
+    return {"input_rows": input_rows, "input_seconds": round(input_seconds, 3), "stages": recorder.results}
+
+
+def _read_progress(path: Path) -> List[Dict]:
+    if not path.exists():
+        return []
+    with open(path) as file:
+        return [json.loads(line) for line in file if line.strip()]
+
+
+def benchmark_size(n_applicants: int, seed: int, memory_limit_mb: Optional[int], keep: bool,
+                   verbose: bool) -> Dict:
+    """Run one size in a fresh process; a crash is recorded with the stage it happened in."""
+    workdir = Path(tempfile.mkdtemp(prefix=f"pipeline-{n_applicants}-"))
+    print(f"Running the pipeline on {n_applicants} applicants in {workdir}")
+    run = {"rows": n_applicants}
+    try:
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            run.update(executor.submit(run_pipeline, n_applicants, seed, workdir, memory_limit_mb, verbose).result())
+    except Exception as e:
+        progress = _read_progress(workdir / "progress.jsonl")
+        run["stages"] = [{k: v for k, v in entry.items() if k != "status"}
+                         for entry in progress if entry["status"] == "completed"]
+        started = [entry["stage"] for entry in progress if entry["status"] == "started"]
+        run["failed_stage"] = started[-1] if len(started) > len(run["stages"]) else "inputs"
+        run["error"] = f"{type(e).__name__}: {e}"
+        print(f"  failed in {run['failed_stage']}: {run['error']}")
+    finally:
+        if not keep:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    for result in run.get("stages", []):
+        print(f"  {result['stage']:<20} {result['wall_seconds']:>9.2f}s wall {result['cpu_seconds']:>9.2f}s cpu "
+              f"{result['peak_rss_mb']:>9.1f} MB peak {result['read_mb']} MB read {result['written_mb']} MB written")
+    return run
+
+
+def _growth(sizes: List[int], values: List[Optional[float]]) -> Optional[float]:
+    """Exponent k of value ~ rows^k between the smallest and largest size that have a value."""
+    points = [(size, value) for size, value in zip(sizes, values) if value]
+    if len(points) < 2 or points[0][0] == points[-1][0]:
+        return None
+    (size_first, first), (size_last, last) = points[0], points[-1]
+    return round(math.log(last / first) / math.log(size_last / size_first), 2)
+
+
+def scaling_tables(runs: List[Dict]) -> str:
+    """Wall time and peak memory of every stage against rows, with their growth exponents."""
+    sizes = [run["rows"] for run in runs]
+    by_size = [{result["stage"]: result for result in run.get("stages", [])} for run in runs]
+
+    tables = []
+    for metric, title in [("wall_seconds", "wall time (s)"), ("peak_rss_mb", "peak resident memory (MB)")]:
+        rows = []
+        for stage in STAGES:
+            values = [stages[stage][metric] if stage in stages else None for stages in by_size]
+            row = {"stage": stage}
+            for run, value in zip(runs, values):
+                row[f"{run['rows']:,}"] = "FAILED" if run.get("failed_stage") == stage else value
+            row["growth"] = _growth(sizes, values)
+            rows.append(row)
+        tables.append(f"{title} by number of applicants\n" +
+                      common.format_table(rows, ["stage"] + [f"{size:,}" for size in sizes] + ["growth"]))
+    return "\n\n".join(tables)
+
+
+def plot_scaling(runs: List[Dict], path: Path):
+    """Log-log plot of wall time and peak memory of every stage against rows."""
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    figure, axes = plt.subplots(1, 2, figsize=(12, 5))
+    for stage in STAGES:
+        points = [(run["rows"], result) for run in runs for result in run.get("stages", []) if result["stage"] == stage]
+        if not points:
+            continue
+        rows = [size for size, _ in points]
+        axes[0].plot(rows, [result["wall_seconds"] for _, result in points], marker="o", label=stage)
+        axes[1].plot(rows, [result["peak_rss_mb"] for _, result in points], marker="o", label=stage)
+    for axis, label in zip(axes, ["wall time (s)", "peak resident memory (MB)"]):
+        axis.set_xscale("log")
+        axis.set_yscale("log")
+        axis.set_xlabel("applicants")
+        axis.set_ylabel(label)
+        axis.grid(True, which="both", alpha=0.3)
+    axes[0].legend()
+    figure.tight_layout()
+    figure.savefig(path)
+    print(f"Scaling curve saved to {path}")
+
+
+def main(args) -> Path:
+    runs = [benchmark_size(rows, args.seed, args.memory_limit_mb, args.keep, args.verbose) for rows in sorted(args.rows)]
+    print()
+    print(scaling_tables(runs))
+    if args.plot:
+        plot_scaling(runs, args.plot)
+
+    settings = {"rows": sorted(args.rows), "seed": args.seed, "memory_limit_mb": args.memory_limit_mb}
+    # One result per (rows, stage); failures keep their own entry
+    results = []
+    for run in runs:
+        common_fields = {key: run[key] for key in ["rows", "input_rows", "input_seconds"] if key in run}
+        results += [{**common_fields, **result} for result in run.get("stages", [])]
+        if "failed_stage" in run:
+            results.append({**common_fields, "stage": run["failed_stage"], "error": run["error"]})
+    path = common.save_results("pipeline_stages", settings, results, args.output)
+    print(f"\nResults saved to {path}")
+
+    if args.compare:
+        print(common.compare_results(
+            common.load_results(args.compare), common.load_results(path), ["rows", "stage"],
+            ["wall_seconds", "cpu_seconds", "peak_rss_mb"]
+        ))
+    return path
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the stages of the data pipeline at growing input sizes.")
+    parser.add_argument("--rows", type=lambda value: [int(size) for size in value.split(",")], default=DEFAULT_ROWS,
+                        help="comma-separated numbers of applicants (default 1000,10000,100000)")
+    parser.add_argument("--memory-limit-mb", type=int, default=None,
+                        help="address space limit of each run (POSIX), to find the stage that fails first")
+    parser.add_argument("--seed", type=int, default=42, help="seed of the synthetic inputs")
+    parser.add_argument("--plot", type=Path, default=None, help="save the scaling curve as an image")
+    parser.add_argument("--keep", action="store_true", help="keep the working directories of the runs")
+    parser.add_argument("--verbose", action="store_true", help="show the pipeline's output (default: pipeline.log)")
+    parser.add_argument("--output", type=Path, default=None, help="result file (default benchmark_results/)")
+    parser.add_argument("--compare", type=Path, default=None, help="earlier result file to compare this run with")
+    main(parser.parse_args())
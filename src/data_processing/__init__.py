@@ -3,14 +3,15 @@ Data processing package for the credit risk model.
 This package handles data downloading, fabrication, and preprocessing.
 """
 
-from .fabricate import fabricate_features
-from .preprocess import clean
+from .fabricate import fabricate_features, generate_applicants, write_applicants
+from .preprocess import clean, transform
 from .merge import merge_data
 from .download_data import download_and_unzip_kaggle_dataset
 
 __all__ = [
     "fabricate_features",
     "clean",
+    "transform",
     "merge_data",
     "download_data"
 ]
@@ -19,8 +20,8 @@ Data processing package for the credit risk model.
 This package handles data downloading, fabrication, and preprocessing.
 """
 
-from .fabricate import fabricate_features
-from .preprocess import clean
+from .fabricate import fabricate_features, generate_applicants, write_applicants
+from .preprocess import clean, transform
 from .merge import merge_data
 from .download_data import download_and_unzip_kaggle_dataset
 
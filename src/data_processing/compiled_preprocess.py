@@ -0,0 +1,139 @@
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import StandardScaler, MinMaxScaler
+
+
+class CompiledPreprocessor:
+    """
+    Single-pass NumPy version of `preprocess.apply_pipeline` (with encoding).
+
+    The fitted objects saved by `preprocess_pipeline` are flattened once into
+    plain arrays: per-column imputation stats, one category lookup index per
+    categorical column and the scaler's parameters. `transform` then writes
+    imputed, scaled and one-hot encoded values straight into one preallocated
+    float32 matrix instead of copying the DataFrame at every step.
+
+    The output layout matches `apply_pipeline`: the input columns (minus the
+    categorical ones) in their original order, followed by the encoded columns.
+    """
+
+    def __init__(self, fitted_objects):
+        self.numerical_cols = list(fitted_objects['numerical_cols'])
+        self.categorical_cols = list(fitted_objects['categorical_cols'])
+        self.encoded_cols = list(fitted_objects['encoded_columns'])
+        self._categorical_set = set(self.categorical_cols)
+
+        # --- Imputation stats as arrays aligned with numerical_cols ---
+        imputation_values = fitted_objects['imputation_values']
+        n_num = len(self.numerical_cols)
+        self.has_stats = np.zeros(n_num, dtype=bool)
+        self.impute_loc = np.full(n_num, np.nan)
+        self.impute_std = np.full(n_num, np.nan)
+        self.impute_min = np.full(n_num, np.nan)
+        self.impute_max = np.full(n_num, np.nan)
+        for i, col in enumerate(self.numerical_cols):
+            if col in imputation_values:
+                stats = imputation_values[col]
+                self.has_stats[i] = True
+                self.impute_loc[i] = stats['loc']
+                self.impute_std[i] = stats['std']
+                self.impute_min[i] = stats['min']
+                self.impute_max[i] = stats['max']
+
+        # --- Scaler parameters ---
+        scaler = fitted_objects['scaler']
+        if isinstance(scaler, StandardScaler):
+            self.scale_kind = 'standard'
+            self.scale_offset = scaler.mean_ if scaler.mean_ is not None else np.zeros(n_num)
+            self.scale_factor = scaler.scale_ if scaler.scale_ is not None else np.ones(n_num)
+        elif isinstance(scaler, MinMaxScaler):
+            self.scale_kind = 'minmax'
+            self.scale_offset = scaler.min_
+            self.scale_factor = scaler.scale_
+        else:
+            raise ValueError(f"Scaler '{scaler.__class__.__name__}' cannot be compiled.")
+        self.scale_offset = np.asarray(self.scale_offset, dtype=np.float64)
+        self.scale_factor = np.asarray(self.scale_factor, dtype=np.float64)
+
+        # --- Category -> encoded column lookup tables ---
+        encoder = fitted_objects['encoder']
+        self.category_lookups = []
+        self.category_offsets = []
+        offset = 0
+        for categories in encoder.categories_:
+            self.category_lookups.append(pd.Index(categories))
+            self.category_offsets.append(offset)
+            offset += len(categories)
+        if offset != len(self.encoded_cols):
+            raise ValueError("Encoder categories do not match the saved encoded columns.")
+
+    def get_feature_names_out(self, columns):
+        """Returns the output column names for an input with the given columns."""
+        passthrough = [col for col in columns if col not in self._categorical_set]
+        return passthrough + self.encoded_cols
+
+    def transform(self, data: pd.DataFrame, out: np.ndarray = None) -> np.ndarray:
+        """
+        Transforms `data` into a float32 matrix in one pass.
+
+        Args:
+            data (pd.DataFrame): Raw rows containing at least the numerical and categorical columns.
+            out (np.ndarray, optional): Preallocated (n_rows, n_outputs) float32 buffer to write into.
+
+        Returns:
+            np.ndarray: The transformed matrix (`out` if it was given).
+        """
+        n_rows = len(data)
+        passthrough = [col for col in data.columns if col not in self._categorical_set]
+        n_outputs = len(passthrough) + len(self.encoded_cols)
+
+        if out is None:
+            out = np.empty((n_rows, n_outputs), dtype=np.float32)
+        elif out.shape != (n_rows, n_outputs):
+            raise ValueError(f"Output buffer has shape {out.shape}, expected {(n_rows, n_outputs)}.")
+
+        # --- Passthrough columns, copied as they are ---
+        position = {col: j for j, col in enumerate(passthrough)}
+        numerical_set = set(self.numerical_cols)
+        for col in passthrough:
+            if col not in numerical_set:
+                out[:, position[col]] = data[col].to_numpy(dtype=np.float64, na_value=np.nan)
+
+        # --- Numerical columns: impute, scale and write ---
+        numerical = data[self.numerical_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+        missing = np.isnan(numerical)
+        for i in np.flatnonzero(missing.any(axis=0)):
+            if not self.has_stats[i]:
+                raise KeyError(self.numerical_cols[i])
+            rows = missing[:, i]
+            # Same draws, in the same column order, as apply_imputation
+            random_values = np.random.normal(loc=self.impute_loc[i], scale=self.impute_std[i], size=rows.sum())
+            numerical[rows, i] = np.clip(random_values, self.impute_min[i], self.impute_max[i])
+
+        if self.scale_kind == 'standard':
+            numerical -= self.scale_offset
+            numerical /= self.scale_factor
+        else:
+            numerical *= self.scale_factor
+            numerical += self.scale_offset
+        out[:, [position[col] for col in self.numerical_cols]] = numerical
+
+        # --- Categorical columns: one-hot through the lookup tables ---
+        encoded = out[:, len(passthrough):]
+        encoded[:] = 0
+        for col, lookup, offset in zip(self.categorical_cols, self.category_lookups, self.category_offsets):
+            values = data[col].to_numpy(dtype=object, copy=True)
+            values[pd.isna(values)] = 'Missing'
+            codes = lookup.get_indexer(values)
+            known = codes >= 0
+            encoded[np.flatnonzero(known), offset + codes[known]] = 1
+
+        return out
+
+    def transform_frame(self, data: pd.DataFrame) -> pd.DataFrame:
+        """Same as `transform`, wrapped in a DataFrame with the output column names."""
+        return pd.DataFrame(
+            self.transform(data),
+            index=data.index,
+            columns=self.get_feature_names_out(data.columns),
+        )
@@ -1,120 +1,155 @@
+import argparse
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+
 import numpy as np
 import pandas as pd
-from pathlib import Path
 from scipy.linalg import block_diag
 
 from src.utils import get_config
 
 config = get_config.read_yaml_from_package()
 
+# --- 💡 CUSTOMIZE HERE: Define features and their relationships ---
+FEATURE_DEFINITIONS = [
+    # --- Financial Group ---
+    {'name': "Recharge Frequency (per month)", 'short_name': 'RCHRG_FRQ', 'type': 'numeric',
+     'params': (1.426, 0.57, 0, 20), 'corr_group': 'financial'},
+    {'name': "Trading Accounts", 'short_name': 'TRD_ACC', 'type': 'numeric', 'params': (1.27, 0.9, 0, 10),
+     'corr_group': 'financial'},
+    # Anchored to cash flow
+    {'name': "Revenue from Consumer Apps", 'short_name': 'REV_FRM_CNSMR_APPS', 'type': 'numeric',
+     'params': (500, 200, 50, 2000), 'corr_group': 'financial', 'corr_with': 'AMT_DRAWINGS_CURRENT',
+     'corr_value': 0.3},
+    # Anchored to digital payment usage
+    {'name': "Number of Smart Cards", 'short_name': 'NO_OF_SMRT_CARD', 'type': 'numeric',
+     'params': (2.6, 0.9, 0, 6), 'corr_group': 'financial', 'corr_with': 'CNT_DRAWINGS_POS_CURRENT',
+     'corr_value': 0.35},
+    {'name': "Number of Account Types", 'short_name': 'NO_TYPE_OF_ACC', 'type': 'numeric',
+     'params': (2.05, 1.5, 0, 8), 'corr_group': 'financial'},
+
+    # --- Compliance Group ---
+    {'name': "Official Document Expiry (per year)", 'short_name': 'OFC_DOC_EXP', 'type': 'numeric',
+     'params': (3, 2, 0, 12), 'corr_group': 'compliance'},
+    # Anchored to regional risk
+    {'name': "Default in GST filing (per quarter)", 'short_name': 'GST_FIL_DEF', 'type': 'numeric',
+     'params': (0.39, 0.65, 0, 3), 'corr_group': 'compliance', 'corr_with': 'REGION_RATING_CLIENT',
+     'corr_value': 0.2},
+    # Anchored to regional risk
+    {'name': "Registered Vehicle Challans (per year)", 'short_name': 'REG_VEH_CHALLAN', 'type': 'numeric',
+     'params': (0.12, 0.5, 0, 100), 'corr_group': 'compliance', 'corr_with': 'REGION_RATING_CLIENT',
+     'corr_value': 0.25},
+
+    # --- Digital Group ---
+    # Anchored to client stability
+    {'name': "SIM Card Failures", 'short_name': 'SIM_CARD_FAIL', 'type': 'numeric', 'params': (1.2, 0.8, 0, 60),
+     'corr_group': 'digital', 'corr_with': 'REG_REGION_NOT_WORK_REGION', 'corr_value': 0.15},
+    # Anchored to digital payment usage
+    {'name': "E-commerce Shopping Returns (per month)", 'short_name': 'ECOM_SHOP_RETURN', 'type': 'numeric',
+     'params': (0.35, 0.7, 0, 25), 'corr_group': 'digital', 'corr_with': 'CNT_DRAWINGS_POS_CURRENT',
+     'corr_value': 0.3},
+    # Anchored to cash flow
+    {'name': "Utility Bills (per month)", 'short_name': 'UTILITY_BIL', 'type': 'numeric',
+     'params': (9500, 6500, 2500, 35000), 'corr_group': 'digital', 'corr_with': 'AMT_DRAWINGS_CURRENT',
+     'corr_value': 0.4},
+
+    # --- Standalone Features (can remain independent) ---
+    {'name': "LinkedIn Data (Presence)", 'short_name': 'LINKEDIN_DATA', 'type': 'binary',
+     'params': ((0, 1), (0.5, 0.5))},
+    {'name': "Truecaller Flag", 'short_name': 'TRUECALR_FLAG', 'type': 'categorical',
+     'params': (('Red', 'Blue', 'Golden'), (0.2, 0.75, 0.05))}
+]
+
+# Define correlation blocks
+corr_financial = np.array([
+    # Recharge Freq, Trading Acc, Revenue Apps, Smart Cards, Acc Types
+    [1.00, -0.15, 0.10, 0.05, -0.12],  # Recharge Frequency
+    [-0.15, 1.00, 0.20, 0.10, 0.35],  # Trading Accounts
+    [0.10, 0.20, 1.00, 0.15, 0.22],  # Revenue from Consumer Apps
+    [0.05, 0.10, 0.15, 1.00, 0.08],  # Number of Smart Cards
+    [-0.12, 0.35, 0.22, 0.08, 1.00]  # Number of Account Types
+])
+# Realistic compliance correlations
+corr_compliance = np.array([
+    # Doc Expiry, GST Default, Vehicle Challans
+    [1.00, -0.10, -0.12],  # Official Document Expiry
+    [-0.10, 1.00, 0.25],  # Default in GST filing
+    [-0.12, 0.25, 1.00]  # Registered Vehicle Challans
+])
+# Realistic digital correlations
+corr_digital = np.array([
+    # SIM Failures, E-comm Returns, Utility Bills
+    [1.00, -0.05, -0.28],  # SIM Card Failures
+    [-0.05, 1.00, 0.15],  # E-commerce Shopping Returns
+    [-0.28, 0.15, 1.00]  # Utility Bills
+])
+# Cholesky factor of the blocks, in FEATURE_DEFINITIONS order of the numeric features
+CORRELATION_FACTOR = np.linalg.cholesky(block_diag(corr_financial, corr_compliance, corr_digital))
+
+# --- Synthetic stand-ins for the Kaggle columns that merge_data aggregates ---
+# Application columns hold one value per applicant, repeated on each of its merged rows.
+APPLICATION_DEFINITIONS = [
+    {'short_name': 'REGION_RATING_CLIENT', 'params': ((1, 2, 3), (0.10, 0.74, 0.16))},
+    {'short_name': 'REG_REGION_NOT_LIVE_REGION', 'params': ((0, 1), (0.985, 0.015))},
+    {'short_name': 'REG_REGION_NOT_WORK_REGION', 'params': ((0, 1), (0.95, 0.05))},
+    {'short_name': 'LIVE_REGION_NOT_WORK_REGION', 'params': ((0, 1), (0.96, 0.04))},
+]
+# Credit card drawings vary by month. Per channel: share of card holders who never draw,
+# mean and std of the monthly amount of those who do, and the average amount per drawing.
+# AMT/CNT_DRAWINGS_CURRENT are the totals over the three channels.
+DRAWING_CHANNELS = {
+    'ATM': {'zero_share': 0.45, 'params': (9000, 12000), 'ticket': 19000},
+    'POS': {'zero_share': 0.5, 'params': (5000, 9000), 'ticket': 5300},
+    'OTHER': {'zero_share': 0.95, 'params': (4000, 8000), 'ticket': 70000},
+}
+CARD_HOLDER_SHARE = 0.3
+MEAN_CARD_MONTHS = 20
+# Previous applications: how many an applicant has, and the seller area (-1 when not available)
+NO_PREVIOUS_SHARE = 0.05
+MEAN_PREVIOUS_APPLICATIONS = 3.9
+SELLERPLACE_AREA_UNKNOWN_SHARE = 0.5
+# Categorical modes as in the Home Credit data
+MODE_DEFINITIONS = {
+    'NAME_EDUCATION_TYPE': (('Secondary / secondary special', 'Higher education', 'Incomplete higher',
+                             'Lower secondary', 'Academic degree'),
+                            (0.71, 0.243, 0.033, 0.0135, 0.0005)),
+    'NAME_SELLER_INDUSTRY': (('XNA', 'Consumer electronics', 'Connectivity', 'Furniture', 'Construction',
+                              'Clothing', 'Industry', 'Auto technology', 'Jewelry', 'MLM partners', 'Tourism'),
+                             (0.51, 0.24, 0.165, 0.035, 0.018, 0.014, 0.011, 0.003, 0.002, 0.001, 0.001)),
+}
+AGGREGATES = ['min', 'max', 'mean', 'sum', 'std']
+# Applicants drawn from one random stream; chunks are cut from these blocks,
+# so the data does not depend on how it is chunked
+BLOCK_ROWS = 10000
+
+
 # --- Helper for categorical distributions ---
-def create_categorical_distribution(categories, stats, n, nan_probability=0):
-    """Generates a series of categorical data."""
+def create_categorical_distribution(categories, stats, n, nan_probability=0, rng=None):
+    """Generates a series of categorical data, from `rng` if given, else NumPy's global random state."""
+    rng = np.random if rng is None else rng
     probs = np.array(stats) / np.sum(stats)
-    if np.random.rand() < nan_probability:
+    if rng.random() < nan_probability:
         return pd.Series([np.nan] * n)
-    return pd.Series(np.random.choice(categories, size=n, p=probs))
+    return pd.Series(rng.choice(categories, size=n, p=probs))
 
 
-# --- Main fabrication function ---
-def fabricate_features(merged_df, rng_seed=42):
-    """
-    Generates and adds synthetic features to the provided DataFrame.
-    Anchors synthetic numeric features to real columns where specified.
-    """
-    print("🚀 Starting feature fabrication...")
-    rng = np.random.default_rng(seed=rng_seed)
+def _fabricate_columns(merged_df, rng):
+    """The synthetic columns of FEATURE_DEFINITIONS for the rows of `merged_df`."""
     n_samples = len(merged_df)
-
     synthetic_df = pd.DataFrame(index=merged_df.index)
 
-    # --- 💡 CUSTOMIZE HERE: Define features and their relationships ---
-    # In fabricate.py, inside the fabricate_features function:
-
-    # --- 💡 CUSTOMIZE HERE: Define features and their relationships ---
-    feature_definitions = [
-        # --- Financial Group ---
-        {'name': "Recharge Frequency (per month)", 'short_name': 'RCHRG_FRQ', 'type': 'numeric',
-         'params': (1.426, 0.57, 0, 20), 'corr_group': 'financial'},
-        {'name': "Trading Accounts", 'short_name': 'TRD_ACC', 'type': 'numeric', 'params': (1.27, 0.9, 0, 10),
-         'corr_group': 'financial'},
-        # Anchored to cash flow
-        {'name': "Revenue from Consumer Apps", 'short_name': 'REV_FRM_CNSMR_APPS', 'type': 'numeric',
-         'params': (500, 200, 50, 2000), 'corr_group': 'financial', 'corr_with': 'AMT_DRAWINGS_CURRENT',
-         'corr_value': 0.3},
-        # Anchored to digital payment usage
-        {'name': "Number of Smart Cards", 'short_name': 'NO_OF_SMRT_CARD', 'type': 'numeric',
-         'params': (2.6, 0.9, 0, 6), 'corr_group': 'financial', 'corr_with': 'CNT_DRAWINGS_POS_CURRENT',
-         'corr_value': 0.35},
-        {'name': "Number of Account Types", 'short_name': 'NO_TYPE_OF_ACC', 'type': 'numeric',
-         'params': (2.05, 1.5, 0, 8), 'corr_group': 'financial'},
-
-        # --- Compliance Group ---
-        {'name': "Official Document Expiry (per year)", 'short_name': 'OFC_DOC_EXP', 'type': 'numeric',
-         'params': (3, 2, 0, 12), 'corr_group': 'compliance'},
-        # Anchored to regional risk
-        {'name': "Default in GST filing (per quarter)", 'short_name': 'GST_FIL_DEF', 'type': 'numeric',
-         'params': (0.39, 0.65, 0, 3), 'corr_group': 'compliance', 'corr_with': 'REGION_RATING_CLIENT',
-         'corr_value': 0.2},
-        # Anchored to regional risk
-        {'name': "Registered Vehicle Challans (per year)", 'short_name': 'REG_VEH_CHALLAN', 'type': 'numeric',
-         'params': (0.12, 0.5, 0, 100), 'corr_group': 'compliance', 'corr_with': 'REGION_RATING_CLIENT',
-         'corr_value': 0.25},
-
-        # --- Digital Group ---
-        # Anchored to client stability
-        {'name': "SIM Card Failures", 'short_name': 'SIM_CARD_FAIL', 'type': 'numeric', 'params': (1.2, 0.8, 0, 60),
-         'corr_group': 'digital', 'corr_with': 'REG_REGION_NOT_WORK_REGION', 'corr_value': 0.15},
-        # Anchored to digital payment usage
-        {'name': "E-commerce Shopping Returns (per month)", 'short_name': 'ECOM_SHOP_RETURN', 'type': 'numeric',
-         'params': (0.35, 0.7, 0, 25), 'corr_group': 'digital', 'corr_with': 'CNT_DRAWINGS_POS_CURRENT',
-         'corr_value': 0.3},
-        # Anchored to cash flow
-        {'name': "Utility Bills (per month)", 'short_name': 'UTILITY_BIL', 'type': 'numeric',
-         'params': (9500, 6500, 2500, 35000), 'corr_group': 'digital', 'corr_with': 'AMT_DRAWINGS_CURRENT',
-         'corr_value': 0.4},
-
-        # --- Standalone Features (can remain independent) ---
-        {'name': "LinkedIn Data (Presence)", 'short_name': 'LINKEDIN_DATA', 'type': 'binary',
-         'params': ((0, 1), (0.5, 0.5))},
-        {'name': "Truecaller Flag", 'short_name': 'TRUECALR_FLAG', 'type': 'categorical',
-         'params': (('Red', 'Blue', 'Golden'), (0.2, 0.75, 0.05))}
-    ]
     # --- Separate features by type ---
-    numeric_features = [f for f in feature_definitions if f['type'] == 'numeric']
-    categorical_features = [f for f in feature_definitions if f['type'] == 'categorical']
-    binary_features = [f for f in feature_definitions if f['type'] == 'binary']
+    numeric_features = [f for f in FEATURE_DEFINITIONS if f['type'] == 'numeric']
+    categorical_features = [f for f in FEATURE_DEFINITIONS if f['type'] == 'categorical']
+    binary_features = [f for f in FEATURE_DEFINITIONS if f['type'] == 'binary']
 
     # --- 1. Generate Correlated Numeric Features ---
-    print("Generating correlated numeric features...")
-    # (Your correlation matrices for financial, compliance, digital go here)
-    # Define correlation blocks
-    corr_financial = np.array([
-        # Recharge Freq, Trading Acc, Revenue Apps, Smart Cards, Acc Types
-        [1.00, -0.15, 0.10, 0.05, -0.12],  # Recharge Frequency
-        [-0.15, 1.00, 0.20, 0.10, 0.35],  # Trading Accounts
-        [0.10, 0.20, 1.00, 0.15, 0.22],  # Revenue from Consumer Apps
-        [0.05, 0.10, 0.15, 1.00, 0.08],  # Number of Smart Cards
-        [-0.12, 0.35, 0.22, 0.08, 1.00]  # Number of Account Types
-    ])
-    # Realistic compliance correlations
-    corr_compliance = np.array([
-        # Doc Expiry, GST Default, Vehicle Challans
-        [1.00, -0.10, -0.12],  # Official Document Expiry
-        [-0.10, 1.00, 0.25],  # Default in GST filing
-        [-0.12, 0.25, 1.00]  # Registered Vehicle Challans
-    ])
-    # Realistic digital correlations
-    corr_digital = np.array([
-        # SIM Failures, E-comm Returns, Utility Bills
-        [1.00, -0.05, -0.28],  # SIM Card Failures
-        [-0.05, 1.00, 0.15],  # E-commerce Shopping Returns
-        [-0.28, 0.15, 1.00]  # Utility Bills
-    ])
-    correlation_matrix = block_diag(corr_financial, corr_compliance, corr_digital)
-    L = np.linalg.cholesky(correlation_matrix)
     uncorrelated = rng.normal(size=(n_samples, len(numeric_features)))
-    correlated = uncorrelated @ L.T
+    correlated = uncorrelated @ CORRELATION_FACTOR.T
 
     # Scale, clip, and ANCHOR the data
     for i, feature in enumerate(numeric_features):
@@ -146,12 +181,26 @@ def fabricate_features(merged_df, rng_seed=42):
         synthetic_df[col_name] = col_data.astype('float32')
 
     # --- 2. Generate Categorical and Binary Features ---
-    print("Generating categorical and binary features...")
     all_other_features = categorical_features + binary_features
     for feature in all_other_features:
         col_name = feature['short_name']
         categories, stats = feature['params']
-        synthetic_df[col_name] = create_categorical_distribution(categories, stats, n_samples)
+        synthetic_df[col_name] = create_categorical_distribution(categories, stats, n_samples, rng=rng)
+
+    return synthetic_df
+
+
+# --- Main fabrication function ---
+def fabricate_features(merged_df, rng_seed=42):
+    """
+    Generates and adds synthetic features to the provided DataFrame.
+    Anchors synthetic numeric features to real columns where specified.
+    """
+    print("🚀 Starting feature fabrication...")
+    rng = np.random.default_rng(seed=rng_seed)
+
+    print("Generating correlated numeric, categorical and binary features...")
+    synthetic_df = _fabricate_columns(merged_df, rng)
 
     # --- 3. Finalize ---
     print("Combining fabricated features with merged data...")
@@ -162,4 +211,272 @@ def fabricate_features(merged_df, rng_seed=42):
     final_df.to_csv(output_path, index=False)
 
     print("✅ Fabrication successful!")
-    return final_df
\ No newline at end of file
+    return final_df
+
+
+# --- Synthetic applicants ---
+def _aggregate(level, spread, lower, upper, records, rows):
+    """
+    The min/max/mean/sum/std merge_data computes for a column, without
+    materializing the merged rows.
+
+    Args:
+        level: Per-applicant mean of the column's source records
+        spread: Per-applicant standard deviation of those records
+        lower, upper: Range of a single record
+        records: Distinct source records per applicant (0: none, all NaN)
+        rows: Merged rows per applicant, each record repeated rows / records times
+    """
+    mean = np.clip(level, lower, upper)
+    # Expected extremes of `records` draws
+    extreme = spread * np.sqrt(2 * np.log(np.maximum(records, 1)))
+    minimum = np.clip(mean - extreme, lower, mean)
+    maximum = np.clip(mean + extreme, mean, upper)
+    std = np.where(records > 1, spread, 0.0)
+
+    missing = records == 0
+    aggregates = {
+        'min': np.where(missing, np.nan, minimum),
+        'max': np.where(missing, np.nan, maximum),
+        'mean': np.where(missing, np.nan, mean),
+        # pandas sums an all-NaN group to 0
+        'sum': np.where(missing, 0.0, mean * rows),
+        # and takes no standard deviation of a single row
+        'std': np.where(missing | (rows < 2), np.nan, std),
+    }
+    return aggregates
+
+
+def _lognormal(rng, mean, std, size):
+    """Lognormal draws with the given mean and standard deviation."""
+    sigma2 = np.log(1 + (std / mean) ** 2)
+    return rng.lognormal(np.log(mean) - sigma2 / 2, np.sqrt(sigma2), size)
+
+
+def _calibrated_target(rng, score, rate):
+    """Bernoulli TARGET with P(default) = sigmoid(intercept + score), the intercept solved for `rate`."""
+    intercept = np.log(rate / (1 - rate))
+    for _ in range(20):
+        probability = 1 / (1 + np.exp(-(intercept + score)))
+        intercept -= (probability.mean() - rate) / max((probability * (1 - probability)).mean(), 1e-9)
+    return (rng.random(len(score)) < probability).astype('int64')
+
+
+def synthetic_merged_data(n_rows, rng=None, first_id=100000):
+    """
+    Synthetic stand-in for the output of `merge.merge_data`: one row per
+    applicant with SK_ID_CURR, the min/max/mean/sum/std of every
+    pre-existing numerical column, the count/nunique/mode of the categorical
+    ones, and TARGET.
+
+    Aggregates are consistent with the merged rows they summarize: applicants
+    have 0 to many previous applications and (30% of them) months of credit
+    card history, merged rows fan out as in the left joins of merge_data,
+    application columns are constant per applicant, and card or previous
+    application columns are NaN for applicants without any. TARGET depends
+    on regional risk, cash drawings and education, at the default rate of
+    the real data (1 in 1 + zero_to_one_ratio).
+
+    Args:
+        n_rows (int): Number of applicants.
+        rng (np.random.Generator, optional): Source of randomness.
+        first_id (int): SK_ID_CURR of the first applicant.
+
+    Returns:
+        pd.DataFrame: Columns in merge_data order.
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    n = n_rows
+    columns = {config['data']['id']: np.arange(first_id, first_id + n, dtype='int64')}
+
+    # --- Source records behind each applicant ---
+    previous = np.where(rng.random(n) < NO_PREVIOUS_SHARE, 0, 1 + rng.poisson(MEAN_PREVIOUS_APPLICATIONS - 1, n))
+    card_months = np.where(rng.random(n) < CARD_HOLDER_SHARE, 1 + rng.poisson(MEAN_CARD_MONTHS - 1, n), 0)
+    rows = np.maximum(previous, 1) * np.maximum(card_months, 1)
+    single = np.ones(n)
+
+    stats = {}
+    # --- Application columns ---
+    for feature in APPLICATION_DEFINITIONS:
+        values, probabilities = feature['params']
+        value = rng.choice(np.array(values, dtype=float), size=n, p=probabilities)
+        stats[feature['short_name']] = _aggregate(value, 0.0, min(values), max(values), single, rows)
+
+    # --- Credit card drawings, per channel and in total ---
+    totals = {'AMT': [np.zeros(n), np.zeros(n)], 'CNT': [np.zeros(n), np.zeros(n)]}
+    for channel, definition in DRAWING_CHANNELS.items():
+        draws = rng.random(n) >= definition['zero_share']
+        amount = np.where(draws, _lognormal(rng, *definition['params'], n), 0.0)
+        amount_spread = amount * rng.uniform(0.5, 1.5, n)
+        count = amount / (definition['ticket'] * rng.lognormal(0, 0.3, n))
+        count_spread = count * rng.uniform(0.5, 1.5, n)
+
+        stats[f'AMT_DRAWINGS_{channel}_CURRENT'] = _aggregate(amount, amount_spread, 0, np.inf, card_months, rows)
+        stats[f'CNT_DRAWINGS_{channel}_CURRENT'] = _aggregate(count, count_spread, 0, np.inf, card_months, rows)
+        for prefix, level, spread in [('AMT', amount, amount_spread), ('CNT', count, count_spread)]:
+            totals[prefix][0] += level
+            totals[prefix][1] += spread ** 2
+    for prefix, (level, variance) in totals.items():
+        stats[f'{prefix}_DRAWINGS_CURRENT'] = _aggregate(level, np.sqrt(variance), 0, np.inf, card_months, rows)
+
+    # --- Previous applications ---
+    area_unknown = rng.random(n) < SELLERPLACE_AREA_UNKNOWN_SHARE
+    area = np.where(area_unknown, -1.0, np.round(rng.lognormal(5, 1.5, n)))
+    area_spread = np.where(area_unknown, 0.0, area * rng.uniform(0.3, 1.2, n))
+    stats['SELLERPLACE_AREA'] = _aggregate(area, area_spread, -1, 4000000, previous, rows)
+
+    for column in config['data']['numerical_pre_existing']:
+        for aggregate in AGGREGATES:
+            columns[f'{column}_{aggregate}'] = stats[column][aggregate]
+
+    # --- Categorical modes ---
+    education, education_probabilities = MODE_DEFINITIONS['NAME_EDUCATION_TYPE']
+    education_mode = rng.choice(education, size=n, p=education_probabilities)
+    industry, industry_probabilities = MODE_DEFINITIONS['NAME_SELLER_INDUSTRY']
+    industry_mode = rng.choice(np.array(industry, dtype=object), size=n, p=industry_probabilities)
+    industry_mode[previous == 0] = None
+    modes = {
+        'NAME_EDUCATION_TYPE': (rows, single.astype('int64'), education_mode),
+        'NAME_SELLER_INDUSTRY': (
+            np.where(previous > 0, rows, 0),
+            np.minimum(np.where(previous > 0, 1 + rng.binomial(np.maximum(previous - 1, 0), 0.3), 0), len(industry)),
+            industry_mode
+        ),
+    }
+    for column in config['data']['categorical_pre_existing']:
+        count, nunique, mode = modes[column]
+        columns[f'{column}_count'] = count
+        columns[f'{column}_nunique'] = nunique
+        columns[f'{column}_mode'] = mode
+
+    # --- TARGET ---
+    cash_share = np.nan_to_num(stats['AMT_DRAWINGS_ATM_CURRENT']['mean'] /
+                               np.maximum(stats['AMT_DRAWINGS_CURRENT']['mean'], 1))
+    score = (0.45 * (stats['REGION_RATING_CLIENT']['mean'] - 2)
+             + 0.5 * stats['REG_REGION_NOT_LIVE_REGION']['mean']
+             + 0.3 * stats['REG_REGION_NOT_WORK_REGION']['mean']
+             + 0.3 * stats['LIVE_REGION_NOT_WORK_REGION']['mean']
+             + 0.6 * cash_share
+             + 0.4 * np.isin(education_mode, ['Secondary / secondary special', 'Lower secondary'])
+             - 0.3 * np.isin(education_mode, ['Higher education', 'Academic degree'])
+             + rng.normal(0, 0.5, n))
+    rate = 1 / (1 + config['data']['zero_to_one_ratio'])
+    columns[config['data']['target']] = _calibrated_target(rng, score, rate)
+
+    return pd.DataFrame(columns)
+
+
+def generate_applicants(n_rows, chunk_size=100000, seed=42, fabricate=True) -> Iterator[pd.DataFrame]:
+    """
+    Yields complete synthetic applicants in chunks: the columns of
+    `merge.merge_data` (see `synthetic_merged_data`) plus, with `fabricate`,
+    the fabricated features, i.e. what `fabricate_features` returns.
+
+    Rows are drawn in fixed blocks of BLOCK_ROWS applicants, each from its
+    own random stream derived from `seed` and the block's position, and
+    chunks are cut from these blocks. The same seed therefore always gives
+    the same applicants, whatever the chunk size, the number of workers of
+    `write_applicants`, or `n_rows` (a smaller dataset is a prefix of a
+    larger one). Memory stays bounded by one chunk however many rows are
+    generated; a chunk size that is a multiple of BLOCK_ROWS avoids
+    generating the blocks at chunk boundaries twice.
+
+    Args:
+        n_rows (int): Total number of applicants.
+        chunk_size (int): Applicants per yielded DataFrame.
+        seed (int): Seed of the whole dataset.
+        fabricate (bool): Add the fabricated features.
+
+    Example:
+        engineered_df = feature_engineer.engineer_features(pd.concat(generate_applicants(50000), ignore_index=True))
+    """
+    for chunk_number in range(-(-n_rows // chunk_size)):
+        yield _generate_chunk(chunk_number, n_rows, chunk_size, seed, fabricate)
+
+
+def _generate_block(block_number, seed, fabricate):
+    rng = np.random.default_rng([seed, block_number])
+    block = synthetic_merged_data(BLOCK_ROWS, rng, first_id=100000 + block_number * BLOCK_ROWS)
+    if fabricate:
+        block = pd.concat([block, _fabricate_columns(block, rng)], axis=1)
+    return block
+
+
+def _generate_chunk(chunk_number, n_rows, chunk_size, seed, fabricate):
+    start = chunk_number * chunk_size
+    end = min(start + chunk_size, n_rows)
+    blocks = range(start // BLOCK_ROWS, -(-end // BLOCK_ROWS))
+    chunk = pd.concat([_generate_block(number, seed, fabricate) for number in blocks], ignore_index=True)
+    offset = start - blocks.start * BLOCK_ROWS
+    return chunk.iloc[offset:offset + end - start].reset_index(drop=True)
+
+
+def _chunk_csv(chunk_number, n_rows, chunk_size, seed, fabricate):
+    return _generate_chunk(chunk_number, n_rows, chunk_size, seed, fabricate).to_csv(
+        index=False, header=chunk_number == 0
+    )
+
+
+def write_applicants(path, n_rows, chunk_size=100000, seed=42, fabricate=True, workers=1) -> Dict:
+    """
+    Write `generate_applicants` to a CSV file chunk by chunk.
+
+    Formatting CSV text costs far more than generating the data, so with
+    `workers` > 1 chunks are generated and formatted in that many processes
+    and appended in order; the file is identical either way.
+
+    Returns:
+        dict: Rows written, file size in bytes and elapsed seconds.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    n_chunks = -(-n_rows // chunk_size)
+    tasks = ((number, n_rows, chunk_size, seed, fabricate) for number in range(n_chunks))
+    started = time.perf_counter()
+
+    pool = ProcessPoolExecutor(workers) if workers > 1 else None
+    try:
+        if pool is None:
+            texts = (_chunk_csv(*task) for task in tasks)
+        else:
+            texts = _ordered_results(pool, tasks, window=2 * workers)
+        with open(path, 'w', newline='') as file:
+            for chunk_number, text in enumerate(texts):
+                file.write(text)
+                written = min((chunk_number + 1) * chunk_size, n_rows)
+                print(f"{written}/{n_rows} applicants written "
+                      f"({written / (time.perf_counter() - started):.0f} rows/s)")
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+    return {'rows': n_rows, 'bytes': path.stat().st_size, 'seconds': time.perf_counter() - started}
+
+
+def _ordered_results(pool, tasks, window):
+    """Results of `_chunk_csv` over `tasks` in order, with at most `window` chunks in flight."""
+    pending = deque()
+    for task in tasks:
+        pending.append(pool.submit(_chunk_csv, *task))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate synthetic applicants without the Kaggle data.")
+    parser.add_argument("--rows", type=int, required=True, help="number of applicants")
+    parser.add_argument("--output", type=Path,
+                        default=Path(config['paths']['processed_data_directory']) / 'merged_data_fabricated.csv',
+                        help="CSV file to write (default: the fabricate_features output)")
+    parser.add_argument("--chunk-size", type=int, default=100000, help="applicants generated and written at a time")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="processes formatting chunks")
+    parser.add_argument("--merged-only", action="store_true",
+                        help="only the merge_data columns, e.g. as input for fabricate_features")
+    args = parser.parse_args()
+
+    result = write_applicants(args.output, args.rows, args.chunk_size, args.seed,
+                              fabricate=not args.merged_only, workers=args.workers)
+    print(f"✅ {result['rows']} applicants written to {args.output} "
+          f"({result['bytes'] / 2 ** 20:.0f} MB in {result['seconds']:.1f}s)")
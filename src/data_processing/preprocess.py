@@ -4,7 +4,8 @@ import os
 import joblib
 from sklearn.preprocessing import StandardScaler, MinMaxScaler, OneHotEncoder
 
-from src.utils import get_config
+from src.utils import artifacts, get_config
+from src.data_processing.compiled_preprocess import CompiledPreprocessor
 
 config = get_config.read_yaml_from_package()
 
@@ -164,13 +165,13 @@ def preprocess_pipeline(
 
 
 def apply_pipeline(data: pd.DataFrame,
-    encode: bool = True
+    encode: bool = True,
+    verbose: bool = True
 ) -> pd.DataFrame:
-    print("--- Applying Inference Preprocessing Pipeline ---")
+    if verbose:
+        print("--- Applying Inference Preprocessing Pipeline ---")
 
-    preprocessor_path = config['paths']['model_data_directory'] + "preprocessor.joblib"
-    fitted_objects = joblib.load(preprocessor_path)
-    print(f"Preprocessor loaded successfully from {preprocessor_path}")
+    fitted_objects = artifacts.load_preprocessor()
 
     imputation_values = fitted_objects['imputation_values']
     scaler = fitted_objects['scaler']
@@ -199,9 +200,30 @@ def apply_pipeline(data: pd.DataFrame,
     # processed_df.to_csv(config['paths']['processed_data_directory'] + "/before_scaling_data.csv", index=False)
     final_df[numerical_cols] = scaler.transform(final_df[numerical_cols])
 
-    print("Inference Preprocessing Complete!")
+    if verbose:
+        print("Inference Preprocessing Complete!")
     return final_df
 
+def _compile_preprocessor(path):
+    return CompiledPreprocessor(joblib.load(path))
+
+def load_compiled_preprocessor() -> CompiledPreprocessor:
+    """Returns the saved fitted objects compiled into a single-pass NumPy transformer (cached)."""
+    return artifacts.registry.get(artifacts.model_path("preprocessor.joblib"), loader=_compile_preprocessor)
+
+def transform(data: pd.DataFrame, encode: bool = True) -> pd.DataFrame:
+    """
+    Applies the saved preprocessing pipeline entirely in memory.
+    Used on the serving path: nothing is printed and nothing is written to disk,
+    so concurrent requests never share a file. Use `clean` for the offline pipeline.
+
+    With encoding enabled this runs the compiled NumPy transformer, which gives
+    the same values as `apply_pipeline` as float32 columns.
+    """
+    if encode:
+        return load_compiled_preprocessor().transform_frame(data)
+    return apply_pipeline(data, encode=encode, verbose=False)
+
 def clean(
         data: pd.DataFrame,
         imputation_strategy: str = 'median',
@@ -1,16 +1,36 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Request, Form
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import HTMLResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-import shap
 
-from src.interface.routers import prediction_router, tracking_router, about_router, home_router
+from src.interface.routers import (
+    prediction_router, tracking_router, about_router, home_router, health_router, metrics_router
+)
+from src.interface.services import credit_service, metrics, profiling
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Load the model and warm up scoring before the port accepts traffic
+    await run_in_threadpool(credit_service.start_service)
+    yield
+    credit_service.stop_service()
+
 
 app = FastAPI(
     title="Finshield Credit Risk API",
-    description="API for predicting and explaining credit default risk."
+    description="API for predicting and explaining credit default risk.",
+    lifespan=lifespan
 )
 
+# Request counts and latencies by route, exposed on /metrics
+app.add_middleware(metrics.MetricsMiddleware)
+# Timing tree of requests an admin asks to profile (X-Profile header)
+app.add_middleware(profiling.ProfilingMiddleware)
+
 # Mount static files and templates
 app.mount("/static", StaticFiles(directory="src/interface/static"), name="static")
 templates = Jinja2Templates(directory="src/interface/templates")
@@ -21,6 +41,8 @@ app.include_router(prediction_router.router)
 app.include_router(tracking_router.router)
 app.include_router(about_router.router)
 app.include_router(home_router.router)
+app.include_router(health_router.router)
+app.include_router(metrics_router.router)
 # ============================
 
 # Change your root endpoint to this
@@ -1,4 +1,4 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import StaticPool
 import os
@@ -9,11 +9,15 @@ DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./web_user_data.db")
 
 # Create engine
 if DATABASE_URL.startswith("sqlite"):
+    # A single shared connection is only needed to keep an in-memory database alive;
+    # file databases get the default pool, so background threads (explanations,
+    # model watcher, shadow scoring) don't share a transaction with requests
+    pool_options = {"poolclass": StaticPool} if ":memory:" in DATABASE_URL else {}
     engine = create_engine(
         DATABASE_URL,
         connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-        echo=True  # Set to False in production
+        echo=True,  # Set to False in production
+        **pool_options
     )
 else:
     engine = create_engine(DATABASE_URL, echo=True)
@@ -47,6 +51,20 @@ def create_tables():
     from .models import Base
     Base.metadata.create_all(bind=engine)
 
+def missing_columns():
+    """Columns of the models that existing tables lack, by table (create_tables() never adds columns)"""
+    from .models import Base
+    inspector = inspect(engine)
+    missing = {}
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        columns = [column.name for column in table.columns if column.name not in existing]
+        if columns:
+            missing[table.name] = columns
+    return missing
+
 def drop_tables():
     """Drop all tables"""
     from .models import Base
@@ -1,20 +1,27 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, desc, or_
-from typing import Dict, List, Optional
+from sqlalchemy import and_, desc, func, or_, insert
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 import json
 
-from .models import User, UserFeature, RiskAssessment, FeatureHistory, RiskCategory, AssessmentType
+from .models import (User, UserFeature, RiskAssessment, FeatureHistory, ModelMetadata, ShadowPrediction,
+                     RiskCategory, AssessmentType)
+
+# Version recorded for predictions of artifacts that are not in the model registry
+UNREGISTERED_MODEL_VERSION = "v1.0"
 
 
 class UserCRUD:
     @staticmethod
-    def create_user(db: Session, user_data: Dict) -> User:
-        """Create a new user"""
+    def create_user(db: Session, user_data: Dict, commit: bool = True) -> User:
+        """Create a new user (only flushed into the caller's transaction if commit is False)"""
         db_user = User(**user_data)
         db.add(db_user)
-        db.commit()
-        db.refresh(db_user)
+        if commit:
+            db.commit()
+            db.refresh(db_user)
+        else:
+            db.flush()
         return db_user
 
     @staticmethod
@@ -41,8 +48,8 @@ class UserCRUD:
 
 class FeatureCRUD:
     @staticmethod
-    def create_user_features(db: Session, user_id: str, features: Dict) -> UserFeature:
-        """Create new user features"""
+    def create_user_features(db: Session, user_id: str, features: Dict, commit: bool = True) -> UserFeature:
+        """Create new user features (only flushed into the caller's transaction if commit is False)"""
         # Map the features to match database column names
         feature_data = {
             'user_id': user_id,
@@ -51,8 +58,11 @@ class FeatureCRUD:
 
         db_features = UserFeature(**feature_data)
         db.add(db_features)
-        db.commit()
-        db.refresh(db_features)
+        if commit:
+            db.commit()
+            db.refresh(db_features)
+        else:
+            db.flush()
         return db_features
 
     @staticmethod
@@ -112,40 +122,64 @@ class FeatureCRUD:
         return new_features
 
 
+def risk_category_for(probability: float) -> RiskCategory:
+    """Map a probability of default to its risk category"""
+    # --- UPDATED RISK CATEGORY LOGIC ---
+    if probability < 0.40:  # Less than 40% is Low Risk
+        return RiskCategory.low
+    elif probability < 0.75:  # Between 40% and 74.99% is Medium Risk
+        return RiskCategory.medium
+    else:  # 75% and above is High Risk
+        return RiskCategory.high
+    # --- END OF UPDATE ---
+
+
 class AssessmentCRUD:
     @staticmethod
     def create_assessment(db: Session, user_id: str, feature_id: int, assessment_data: Dict,
-                          assessment_type: str = "initial") -> RiskAssessment:
-        """Create a new risk assessment"""
+                          assessment_type: str = "initial", commit: bool = True) -> RiskAssessment:
+        """Create a new risk assessment (only flushed into the caller's transaction if commit is False)"""
 
         # Determine risk category based on probability
-        probability = assessment_data['prediction_probability']
-
-        # --- UPDATED RISK CATEGORY LOGIC ---
-        if probability < 0.40:  # Less than 40% is Low Risk
-            risk_category = RiskCategory.low
-        elif probability < 0.75:  # Between 40% and 74.99% is Medium Risk
-            risk_category = RiskCategory.medium
-        else:  # 75% and above is High Risk
-            risk_category = RiskCategory.high
-        # --- END OF UPDATE ---
+        risk_category = risk_category_for(assessment_data['prediction_probability'])
 
         db_assessment = RiskAssessment(
             user_id=user_id,
             feature_id=feature_id,
-            base_value=assessment_data['base_value'],
+            base_value=assessment_data.get('base_value'),
             prediction_probability=assessment_data['prediction_probability'],
             risk_category=risk_category,
-            feature_impacts=assessment_data['feature_impacts'],
+            feature_impacts=assessment_data.get('feature_impacts'),
             assessment_type=AssessmentType(assessment_type),
-            model_version="v1.0"
+            model_version=assessment_data.get('model_version', UNREGISTERED_MODEL_VERSION),
+            artifact_version=assessment_data.get('artifact_version')
         )
 
         db.add(db_assessment)
-        db.commit()
-        db.refresh(db_assessment)
+        if commit:
+            db.commit()
+            db.refresh(db_assessment)
+        else:
+            db.flush()
         return db_assessment
 
+    @staticmethod
+    def get_assessment(db: Session, assessment_id: int) -> Optional[RiskAssessment]:
+        """Get assessment by ID"""
+        return db.query(RiskAssessment).filter(RiskAssessment.assessment_id == assessment_id).first()
+
+    @staticmethod
+    def update_assessment_explanation(db: Session, assessment_id: int, base_value: float,
+                                      feature_impacts: Dict) -> bool:
+        """Fill in the SHAP explanation of an assessment stored without one"""
+        assessment = db.query(RiskAssessment).filter(RiskAssessment.assessment_id == assessment_id).first()
+        if assessment:
+            assessment.base_value = base_value
+            assessment.feature_impacts = feature_impacts
+            db.commit()
+            return True
+        return False
+
     @staticmethod
     def get_latest_assessment(db: Session, user_id: str) -> Optional[RiskAssessment]:
         """Get latest assessment for a user"""
@@ -234,4 +268,196 @@ class PortfolioCRUD:
             }
             portfolio_data.append(user_data)
 
-        return portfolio_data
\ No newline at end of file
+        return portfolio_data
+
+
+class BulkCRUD:
+    """Set-based operations for imports and batch jobs: one statement per table per chunk, no commits"""
+
+    @staticmethod
+    def get_existing_user_ids(db: Session, user_ids: List[str]) -> set:
+        """Return which of the given user IDs are already taken"""
+        if not user_ids:
+            return set()
+        return {row.user_id for row in db.query(User.user_id).filter(User.user_id.in_(user_ids)).all()}
+
+    @staticmethod
+    def get_existing_emails(db: Session, emails: List[str]) -> set:
+        """Return which of the given emails are already taken"""
+        if not emails:
+            return set()
+        return {row.email for row in db.query(User.email).filter(User.email.in_(emails)).all()}
+
+    @staticmethod
+    def get_current_features_page(db: Session, after_feature_id: int, limit: int) -> List[UserFeature]:
+        """
+        Next page of current feature rows of active users, in feature_id order
+        (keyset pagination: pass the last feature_id of the previous page)
+        """
+        return db.query(UserFeature).join(User, User.user_id == UserFeature.user_id).filter(
+            UserFeature.is_current == True,
+            User.status == "active",
+            UserFeature.feature_id > after_feature_id
+        ).order_by(UserFeature.feature_id).limit(limit).all()
+
+    @staticmethod
+    def get_latest_assessments(db: Session, user_ids: List[str]) -> Dict[str, Tuple[int, str]]:
+        """Map each given user with assessments to the (feature_id, artifact_version) of the latest one"""
+        if not user_ids:
+            return {}
+        latest = db.query(func.max(RiskAssessment.assessment_id)).filter(
+            RiskAssessment.user_id.in_(user_ids)
+        ).group_by(RiskAssessment.user_id)
+        rows = db.query(RiskAssessment.user_id, RiskAssessment.feature_id, RiskAssessment.artifact_version).filter(
+            RiskAssessment.assessment_id.in_(latest)
+        ).all()
+        return {row.user_id: (row.feature_id, row.artifact_version) for row in rows}
+
+    @staticmethod
+    def create_applicants(db: Session, users: List[Dict], features: List[Dict],
+                          assessments_data: List[Dict]) -> List[int]:
+        """
+        Insert new users with their current features and initial assessments.
+        The three lists are aligned; returns the new assessment IDs.
+        """
+        if not users:
+            return []
+
+        db.execute(insert(User), users)
+
+        feature_rows = [
+            {'user_id': user['user_id'], **{k.lower(): v for k, v in feature_data.items()}}
+            for user, feature_data in zip(users, features)
+        ]
+        feature_ids = db.scalars(
+            insert(UserFeature).returning(UserFeature.feature_id, sort_by_parameter_order=True),
+            feature_rows
+        ).all()
+
+        return BulkCRUD.create_assessments(
+            db,
+            [user['user_id'] for user in users],
+            feature_ids,
+            assessments_data,
+            "initial"
+        )
+
+    @staticmethod
+    def create_assessments(db: Session, user_ids: List[str], feature_ids: List[int],
+                           assessments_data: List[Dict], assessment_type: str) -> List[int]:
+        """Insert one assessment per (user, feature row, prediction); returns the new assessment IDs"""
+        if not user_ids:
+            return []
+
+        rows = [
+            {
+                'user_id': user_id,
+                'feature_id': feature_id,
+                'base_value': data.get('base_value'),
+                'prediction_probability': data['prediction_probability'],
+                'risk_category': risk_category_for(data['prediction_probability']),
+                'feature_impacts': data.get('feature_impacts'),
+                'assessment_type': AssessmentType(assessment_type),
+                'model_version': data.get('model_version', UNREGISTERED_MODEL_VERSION),
+                'artifact_version': data.get('artifact_version')
+            }
+            for user_id, feature_id, data in zip(user_ids, feature_ids, assessments_data)
+        ]
+        return db.scalars(
+            insert(RiskAssessment).returning(RiskAssessment.assessment_id, sort_by_parameter_order=True),
+            rows
+        ).all()
+
+
+class ModelCRUD:
+    @staticmethod
+    def create_model(db: Session, model_data: Dict) -> ModelMetadata:
+        """Record a registered model artifact (inactive until activated)"""
+        db_model = ModelMetadata(
+            model_id=model_data['model_id'],
+            model_name=model_data['model_name'],
+            model_version=model_data['model_version'],
+            model_type=model_data.get('model_type'),
+            performance_metrics=model_data.get('performance_metrics'),
+            is_active=False
+        )
+        db.add(db_model)
+        db.commit()
+        db.refresh(db_model)
+        return db_model
+
+    @staticmethod
+    def get_model(db: Session, model_id: str) -> Optional[ModelMetadata]:
+        """Get model metadata by ID"""
+        return db.query(ModelMetadata).filter(ModelMetadata.model_id == model_id).first()
+
+    @staticmethod
+    def get_active_model(db: Session) -> Optional[ModelMetadata]:
+        """Get the model currently selected for serving, if any"""
+        return db.query(ModelMetadata).filter(ModelMetadata.is_active == True).first()
+
+    @staticmethod
+    def list_models(db: Session) -> List[ModelMetadata]:
+        """All registered models, newest first"""
+        return db.query(ModelMetadata).order_by(desc(ModelMetadata.created_at)).all()
+
+    @staticmethod
+    def activate_model(db: Session, model_id: str) -> bool:
+        """Make a model the only active one"""
+        db_model = ModelCRUD.get_model(db, model_id)
+        if not db_model:
+            return False
+
+        db.query(ModelMetadata).filter(ModelMetadata.model_id != model_id).update({"is_active": False})
+        db_model.is_active = True
+        db_model.deployed_at = datetime.utcnow()
+        db.commit()
+        return True
+
+
+class ShadowCRUD:
+    @staticmethod
+    def create_shadow_predictions(db: Session, features_list: List[Dict], champion_results: List[Dict],
+                                  challenger_results: List[Dict]) -> int:
+        """Store champion and challenger scores of the same requests; returns the number of rows"""
+        rows = []
+        for features, champion, challenger in zip(features_list, champion_results, challenger_results):
+            champion_probability = champion['prediction_probability']
+            challenger_probability = challenger['prediction_probability']
+            rows.append({
+                'champion_version': champion.get('model_version'),
+                'challenger_version': challenger['model_version'],
+                'champion_probability': champion_probability,
+                'challenger_probability': challenger_probability,
+                'probability_difference': challenger_probability - champion_probability,
+                'champion_risk_category': risk_category_for(champion_probability),
+                'challenger_risk_category': risk_category_for(challenger_probability),
+                'features': json.loads(json.dumps(features, default=float))
+            })
+        if rows:
+            db.execute(insert(ShadowPrediction), rows)
+        return len(rows)
+
+    @staticmethod
+    def get_shadow_summary(db: Session, challenger_version: Optional[str] = None) -> Dict:
+        """Agreement of a challenger with the served model over its shadow scores"""
+        query = db.query(ShadowPrediction)
+        if challenger_version:
+            query = query.filter(ShadowPrediction.challenger_version == challenger_version)
+
+        count, mean_difference, mean_abs_difference = query.with_entities(
+            func.count(ShadowPrediction.shadow_id),
+            func.avg(ShadowPrediction.probability_difference),
+            func.avg(func.abs(ShadowPrediction.probability_difference))
+        ).one()
+        same_category = query.filter(
+            ShadowPrediction.champion_risk_category == ShadowPrediction.challenger_risk_category
+        ).count()
+
+        return {
+            'challenger_version': challenger_version,
+            'count': count,
+            'mean_difference': float(mean_difference) if mean_difference is not None else None,
+            'mean_abs_difference': float(mean_abs_difference) if mean_abs_difference is not None else None,
+            'category_agreement': same_category / count if count else None
+        }
@@ -0,0 +1,60 @@
+"""Composite indexes for the per-user tracking queries
+
+FeatureCRUD.get_current_features filters user_features on (user_id,
+is_current); AssessmentCRUD.get_latest_assessment and
+get_user_assessment_history filter risk_assessments on user_id and sort on
+assessed_at, and PortfolioCRUD groups it by user_id.
+
+Databases created by create_tables() after this revision already have the
+indexes, so only missing ones are created.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, index name, columns)
+INDEXES = [
+    ("user_features", "ix_user_features_user_id_is_current", ["user_id", "is_current"]),
+    ("risk_assessments", "ix_risk_assessments_user_id_assessed_at", ["user_id", "assessed_at"]),
+]
+
+
+def _existing_indexes(table: str):
+    """Names of the indexes of `table`, or None if the table does not exist yet."""
+    if op.get_context().as_sql:
+        # Offline (--sql): the database cannot be inspected, so emit every statement
+        return set()
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table(table):
+        return None
+    return {index["name"] for index in inspector.get_indexes(table)}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, name, columns in INDEXES:
+        existing = _existing_indexes(table)
+        # Tables not created yet get their indexes from create_tables()
+        if existing is not None and name not in existing:
+            op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, name, _ in INDEXES:
+        existing = _existing_indexes(table)
+        if existing is not None and (name in existing or op.get_context().as_sql):
+            op.drop_index(name, table_name=table)
@@ -0,0 +1,57 @@
+"""Record the model artifact of every assessment
+
+risk_assessments.artifact_version holds the model version plus the
+fingerprints of its files. Periodic rescoring compares it to skip users that
+were already scored by the served model, which model_version alone cannot
+tell apart from a model retrained in place under the same label.
+Assessments stored before this revision keep NULL and are rescored once.
+
+Databases created by create_tables() after this revision already have the
+column, so it is only added where missing.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, Sequence[str], None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLE = "risk_assessments"
+COLUMN = "artifact_version"
+
+
+def _existing_columns():
+    """Names of the columns of the table, or None if it does not exist yet."""
+    if op.get_context().as_sql:
+        # Offline (--sql): the database cannot be inspected, so emit every statement
+        return set()
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table(TABLE):
+        return None
+    return {column["name"] for column in inspector.get_columns(TABLE)}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    existing = _existing_columns()
+    # A table not created yet gets the column from create_tables()
+    if existing is not None and COLUMN not in existing:
+        op.add_column(TABLE, sa.Column(COLUMN, sa.String(length=128), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    existing = _existing_columns()
+    if existing is not None and (COLUMN in existing or op.get_context().as_sql):
+        with op.batch_alter_table(TABLE) as batch_op:
+            batch_op.drop_column(COLUMN)
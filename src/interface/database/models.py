@@ -1,4 +1,5 @@
-from sqlalchemy import Column, Integer, String, Text, TIMESTAMP, Boolean, DECIMAL, JSON, ForeignKey, Enum as SQLEnum
+from sqlalchemy import (Column, Integer, String, Text, TIMESTAMP, Boolean, DECIMAL, JSON, ForeignKey, Index,
+                        Enum as SQLEnum)
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -44,6 +45,10 @@ class User(Base):
 
 class UserFeature(Base):
     __tablename__ = "user_features"
+    __table_args__ = (
+        # Current features of a user (FeatureCRUD, portfolio join)
+        Index("ix_user_features_user_id_is_current", "user_id", "is_current"),
+    )
 
     feature_id = Column(Integer, primary_key=True, autoincrement=True)
     user_id = Column(String(50), ForeignKey("users.user_id", ondelete="CASCADE"), nullable=False)
@@ -92,6 +97,11 @@ class UserFeature(Base):
 
 class RiskAssessment(Base):
     __tablename__ = "risk_assessments"
+    __table_args__ = (
+        # Latest assessment and history of a user, newest first; also covers the
+        # per-user GROUP BY of the portfolio (assessment_id is the SQLite rowid)
+        Index("ix_risk_assessments_user_id_assessed_at", "user_id", "assessed_at"),
+    )
 
     assessment_id = Column(Integer, primary_key=True, autoincrement=True)
     user_id = Column(String(50), ForeignKey("users.user_id", ondelete="CASCADE"), nullable=False)
@@ -102,6 +112,8 @@ class RiskAssessment(Base):
     prediction_probability = Column(DECIMAL(10, 6))
     risk_category = Column(SQLEnum(RiskCategory))
     model_version = Column(String(50))
+    # model_version plus the fingerprints of its files, which tells apart a model retrained in place
+    artifact_version = Column(String(128))
 
     # SHAP Explanations
     feature_impacts = Column(JSON)
@@ -141,4 +153,24 @@ class ModelMetadata(Base):
     performance_metrics = Column(JSON)
     deployed_at = Column(TIMESTAMP)
     is_active = Column(Boolean, default=False)
-    created_at = Column(TIMESTAMP, default=datetime.utcnow)
\ No newline at end of file
+    created_at = Column(TIMESTAMP, default=datetime.utcnow)
+
+
+class ShadowPrediction(Base):
+    __tablename__ = "shadow_predictions"
+
+    shadow_id = Column(Integer, primary_key=True, autoincrement=True)
+
+    # Served (champion) and shadow (challenger) scores of the same request
+    champion_version = Column(String(50))
+    challenger_version = Column(String(50), nullable=False)
+    champion_probability = Column(DECIMAL(10, 6))
+    challenger_probability = Column(DECIMAL(10, 6))
+    probability_difference = Column(DECIMAL(10, 6))  # challenger - champion
+    champion_risk_category = Column(SQLEnum(RiskCategory))
+    challenger_risk_category = Column(SQLEnum(RiskCategory))
+
+    # Request features, for offline analysis of disagreements
+    features = Column(JSON)
+
+    scored_at = Column(TIMESTAMP, default=datetime.utcnow)
@@ -0,0 +1,140 @@
+"""
+Query-plan check of the hot tracking queries in crud.py.
+
+Each query is run through its CRUD method against a SQLite database, the SQL
+it sends is captured, and SQLite's EXPLAIN QUERY PLAN of every statement is
+checked. The check fails if a statement falls back to a full table scan, or
+if a per-user query sorts in a temporary B-tree instead of reading its index
+in order. A scan of a covering index (the per-user GROUP BY of the
+portfolio) is accepted: it reads the index, not the table rows.
+
+By default the database is an empty one created from the models. Pass an
+existing database to check that its schema is migrated
+(`alembic upgrade head`); the queries look up a user ID that does not exist,
+so its data is left unchanged.
+
+Usage:
+    python -m src.interface.database.query_plans
+    python -m src.interface.database.query_plans --database-url sqlite:///./web_user_data.db
+"""
+import argparse
+import re
+import sys
+from typing import Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from .crud import AssessmentCRUD, BulkCRUD, FeatureCRUD, PortfolioCRUD
+from .models import Base
+
+MISSING_USER = "__query_plan_check__"
+
+# (name, query, whether it must be sorted by an index)
+HOT_QUERIES: List[Tuple[str, Callable[[Session], object], bool]] = [
+    ("FeatureCRUD.get_current_features",
+     lambda db: FeatureCRUD.get_current_features(db, MISSING_USER), False),
+    ("FeatureCRUD.mark_features_as_historical",
+     lambda db: FeatureCRUD.mark_features_as_historical(db, MISSING_USER), False),
+    ("AssessmentCRUD.get_latest_assessment",
+     lambda db: AssessmentCRUD.get_latest_assessment(db, MISSING_USER), True),
+    ("AssessmentCRUD.get_user_assessment_history",
+     lambda db: AssessmentCRUD.get_user_assessment_history(db, MISSING_USER), True),
+    # The whole portfolio is sorted by assessed_at, so only scans are checked
+    ("PortfolioCRUD.get_portfolio_data",
+     lambda db: PortfolioCRUD.get_portfolio_data(db), False),
+    ("PortfolioCRUD.get_portfolio_data (filtered)",
+     lambda db: PortfolioCRUD.get_portfolio_data(db, {"risk_level": "high", "status": "active",
+                                                      "search": MISSING_USER}), False),
+    ("BulkCRUD.get_latest_assessments",
+     lambda db: BulkCRUD.get_latest_assessments(db, [MISSING_USER]), False),
+]
+
+SCAN = re.compile(r"^SCAN (\w+)")
+
+
+def explain(engine: Engine, query: Callable[[Session], object]) -> List[Tuple[str, List[str]]]:
+    """
+    Run `query` and return the EXPLAIN QUERY PLAN of every statement it sent.
+
+    Returns:
+        List of (SQL statement, plan details)
+    """
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if not statement.startswith("EXPLAIN"):
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    db = sessionmaker(bind=engine)()
+    try:
+        query(db)
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+        db.rollback()
+
+    plans = []
+    with engine.connect() as conn:
+        for statement, parameters in statements:
+            rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+            plans.append((statement, [row[-1] for row in rows]))
+    return plans
+
+
+def plan_problems(plan: List[str], tables: set, sorted_by_index: bool) -> List[str]:
+    """Full table scans in a query plan, and temporary sorts if the query must be sorted by an index."""
+    problems = []
+    for detail in plan:
+        match = SCAN.match(detail)
+        # Scans of subqueries (anon_1, ...) read rows the plan already produced
+        if match and match.group(1) in tables and "COVERING INDEX" not in detail:
+            problems.append(f"full scan: {detail}")
+        elif sorted_by_index and detail.startswith("USE TEMP B-TREE FOR ORDER BY"):
+            problems.append(f"sort not served by an index: {detail}")
+    return problems
+
+
+def check_query_plans(engine: Engine, verbose: bool = False) -> Dict[str, List[str]]:
+    """
+    Check the plans of HOT_QUERIES on `engine` (a SQLite database).
+
+    Returns:
+        Problems per query name; empty if every query uses its indexes
+    """
+    if engine.dialect.name != "sqlite":
+        raise ValueError(f"Query plans can only be checked on SQLite, not {engine.dialect.name}")
+
+    tables = set(Base.metadata.tables)
+    problems = {}
+    for name, query, sorted_by_index in HOT_QUERIES:
+        for statement, plan in explain(engine, query):
+            if verbose:
+                print(f"{name}\n  {' '.join(statement.split())}\n" + "".join(f"    {d}\n" for d in plan))
+            found = plan_problems(plan, tables, sorted_by_index)
+            if found:
+                problems.setdefault(name, []).extend(found)
+    return problems
+
+
+def main(database_url: Optional[str] = None, verbose: bool = False) -> bool:
+    engine = create_engine(database_url or "sqlite:///:memory:")
+    if not database_url:
+        Base.metadata.create_all(bind=engine)
+
+    problems = check_query_plans(engine, verbose)
+    for name, _, _ in HOT_QUERIES:
+        print(f"{'FAIL' if name in problems else 'ok':<5} {name}")
+        for problem in problems.get(name, []):
+            print(f"        {problem}")
+    return not problems
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fail if a hot tracking query falls back to a full table scan.")
+    parser.add_argument("--database-url", default=None,
+                        help="SQLite database to check (default: an empty one created from the models)")
+    parser.add_argument("--verbose", action="store_true", help="print every statement and its plan")
+    args = parser.parse_args()
+    sys.exit(0 if main(args.database_url, args.verbose) else 1)
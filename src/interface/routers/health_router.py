@@ -0,0 +1,51 @@
+# In: src/interface/routers/health_router.py
+
+from typing import Optional
+
+from fastapi import APIRouter, Header, HTTPException
+from fastapi.responses import JSONResponse
+
+from src.interface.services import credit_service, profiling
+
+# Create a new router
+router = APIRouter(
+    prefix="/health",
+    tags=["Health"]
+)
+
+
+@router.get("/ready")
+def readiness():
+    """
+    Reports whether the service is loaded and warmed up, how long that took,
+    and whether the real model or mock predictions are being served.
+    """
+    report = credit_service.get_readiness()
+    if report is None or report["status"] != "ready":
+        return JSONResponse(status_code=503, content=report or {"status": "starting"})
+    return report
+
+
+@router.get("/cache")
+def prediction_cache_stats():
+    """
+    Size, hit, miss, eviction and expiration counters of the prediction cache.
+    """
+    stats = credit_service.get_cache_stats()
+    if stats is None:
+        raise HTTPException(status_code=404, detail="Prediction cache is disabled")
+    return stats
+
+
+@router.get("/profiles/{profile_id}")
+def get_profile(profile_id: str, x_admin_token: Optional[str] = Header(default=None)):
+    """
+    Timing tree of a request profiled with the X-Profile header (admins only):
+    stages, preprocessing steps and SQL statements with their durations.
+    """
+    if not profiling.is_admin(x_admin_token):
+        raise HTTPException(status_code=403, detail="Admin token required")
+    trace = profiling.get_trace(profile_id)
+    if trace is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return trace
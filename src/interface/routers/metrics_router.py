@@ -0,0 +1,18 @@
+# In: src/interface/routers/metrics_router.py
+
+from fastapi import APIRouter
+from fastapi.responses import Response
+
+from src.interface.services import metrics
+
+router = APIRouter(tags=["Metrics"])
+
+
+@router.get("/metrics")
+def prometheus_metrics():
+    """
+    Prometheus exposition of per-stage latency histograms, request counters,
+    prediction and mock-fallback counts, and prediction cache statistics.
+    """
+    payload, content_type = metrics.render()
+    return Response(content=payload, media_type=content_type)
@@ -1,15 +1,18 @@
 from fastapi import APIRouter, HTTPException, Request, Depends
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import HTMLResponse
 from fastapi.templating import Jinja2Templates
 from sqlalchemy.orm import Session
 
 # Import the Pydantic schemas you created
-from src.interface.schemas.credit_application import CreditApplication
-from src.interface.schemas.prediction_result import PredictionResult
+from src.interface.schemas.credit_application import CreditApplication, BatchCreditApplication
+from src.interface.schemas.prediction_result import (
+    PredictionResult, BatchPredictionResult, DeferredPredictionResult, ExplanationResult
+)
 from src.interface.database.connection import get_database
 
 # Import your service module that contains the ML logic
-from src.interface.services import credit_service
+from src.interface.services import credit_service, metrics
 
 # Create a new router instance
 router = APIRouter(
@@ -30,11 +33,13 @@ def show_add_user_form(request: Request):
 
 
 @router.post("/new_applicant", response_model=PredictionResult)
-def predict_and_store_new_applicant(application: CreditApplication, db: Session = Depends(get_database)):
+async def predict_and_store_new_applicant(application: CreditApplication, db: Session = Depends(get_database)):
     """
-    Accepts new applicant data, creates a user record in the database,
-    runs the initial prediction, stores the assessment, and returns the results.
+    Accepts new applicant data, runs the prediction once, stores the user, their
+    features and the assessment in one transaction of the request's session,
+    and returns the stored assessment.
     """
+    metrics.observe_since_request_start("validation")
     try:
         # The Pydantic model now contains both user data and feature data.
         # We need to separate them for the service function.
@@ -51,19 +56,88 @@ def predict_and_store_new_applicant(application: CreditApplication, db: Session
         # The rest of the dictionary now only contains feature data.
         features_data = application_dict
 
-        # 2. Call the service function to create the user and get the initial prediction.
-        # This function will handle all the database operations and the prediction itself.
-        credit_service.create_new_user(user_data, features_data)
-
-        # 3. After creating, get the latest assessment to return the explanation.
-        # This ensures the data is consistent with what's in the DB.
-        prediction_result = credit_service.predict_and_explain(features_data)
+        # 2. Score the applicant off the event loop (in the scoring pool when enabled).
+        prediction_result = await credit_service.score(features_data)
 
-        return prediction_result
+        # 3. Create the user and store that same prediction as the initial assessment.
+        return await run_in_threadpool(
+            credit_service.create_new_user_with_assessment, user_data, features_data, prediction_result, db
+        )
 
     except ValueError as ve:
         # Handle cases where the user might already exist or data is invalid.
         raise HTTPException(status_code=400, detail=str(ve))
     except Exception as e:
         # Catch-all for other server errors.
-        raise HTTPException(status_code=500, detail=f"An internal error occurred: {str(e)}")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"An internal error occurred: {str(e)}")
+
+
+@router.post("/new_applicant/deferred", response_model=DeferredPredictionResult)
+async def predict_and_store_new_applicant_deferred(application: CreditApplication,
+                                                   db: Session = Depends(get_database)):
+    """
+    Same as /new_applicant, but returns as soon as the probability is stored.
+    The SHAP explanation is computed in the background; poll
+    /predict/explanations/{assessment_id} to fetch it.
+    """
+    metrics.observe_since_request_start("validation")
+    try:
+        application_dict = application.model_dump()
+
+        user_data = {
+            "user_id": application_dict.pop("user_id"),
+            "full_name": application_dict.pop("full_name"),
+            "email": application_dict.pop("email"),
+            "phone": application_dict.pop("phone")
+        }
+
+        prediction_result = await credit_service.score(application_dict, explain=False)
+        return await run_in_threadpool(
+            credit_service.create_new_user_with_deferred_explanation, user_data, application_dict, prediction_result, db
+        )
+
+    except ValueError as ve:
+        raise HTTPException(status_code=400, detail=str(ve))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"An internal error occurred: {str(e)}")
+
+
+@router.get("/explanations/{assessment_id}", response_model=ExplanationResult)
+def get_explanation(assessment_id: int):
+    """
+    Returns the explanation of a stored assessment with its status:
+    'ready' (feature_impacts filled in), 'pending' or 'failed'.
+    """
+    explanation = credit_service.get_explanation(assessment_id)
+    if explanation is None:
+        raise HTTPException(status_code=404, detail="Assessment not found")
+    return explanation
+
+
+@router.post("/batch", response_model=BatchPredictionResult)
+async def predict_batch(batch: BatchCreditApplication):
+    """
+    Scores many applicants in one call. Preprocessing, the model and the SHAP
+    explainer run once over the whole batch, and one result is returned per
+    applicant in request order. Nothing is stored in the database.
+    """
+    metrics.observe_since_request_start("validation")
+    try:
+        user_ids = []
+        features_list = []
+        for application in batch.applications:
+            application_dict = application.model_dump(exclude={"full_name", "email", "phone"})
+            user_ids.append(application_dict.pop("user_id"))
+            features_list.append(application_dict)
+
+        predictions = await credit_service.score_batch(features_list)
+
+        return {
+            "results": [
+                {"user_id": user_id, **prediction}
+                for user_id, prediction in zip(user_ids, predictions)
+            ]
+        }
+
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"An internal error occurred: {str(e)}")
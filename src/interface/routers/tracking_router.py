@@ -6,7 +6,7 @@ from typing import List, Optional
 
 from src.interface.database import crud
 from src.interface.database.connection import get_database
-from src.interface.services import credit_service
+from src.interface.services import credit_service, metrics
 
 router = APIRouter(prefix="/track", tags=["Tracking"])
 templates = Jinja2Templates(directory="src/interface/templates")
@@ -78,6 +78,8 @@ def get_user_details(user_id: str, db: Session = Depends(get_database)):
             },
             "current_features": feature_dict,
             "latest_assessment": {
+                "assessment_id": latest_assessment.assessment_id,
+                "explanation_status": "ready" if latest_assessment.feature_impacts is not None else "pending",
                 "prediction_probability": latest_assessment.prediction_probability,
                 "risk_category": latest_assessment.risk_category.value,
                 "assessed_at": latest_assessment.assessed_at.strftime('%Y-%m-%d %H:%M:%S'),
@@ -96,10 +98,11 @@ def get_user_details(user_id: str, db: Session = Depends(get_database)):
 
 
 @router.put("/users/{user_id}")
-def update_user_data(user_id: str, updated_data: dict, db: Session = Depends(get_database)):
+async def update_user_data(user_id: str, updated_data: dict, db: Session = Depends(get_database)):
     """Updates a user's data, re-runs prediction, and stores the new assessment."""
+    metrics.observe_since_request_start("validation")
     try:
-        new_probability = credit_service.update_and_reevaluate(
+        new_probability = await credit_service.update_and_reevaluate_async(
             user_id=user_id,
             updated_features=updated_data,
             changed_by="admin_interface"
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Optional
 
 class CreditApplication(BaseModel):
     # --- New User Identification Fields ---
@@ -58,3 +58,8 @@ class CreditApplication(BaseModel):
                 "UTILITY_BIL": 12000.0,
             }
         }
+
+
+class BatchCreditApplication(BaseModel):
+    # A batch of applications scored together in one vectorized pass.
+    applications: List[CreditApplication] = Field(..., min_length=1, max_length=10000)
@@ -1,9 +1,31 @@
 # In: src/interface/schemas/prediction_result.py
 
 from pydantic import BaseModel
-from typing import Dict
+from typing import Dict, List, Optional
 
 class PredictionResult(BaseModel):
     base_value: float
     prediction_probability: float
-    feature_impacts: Dict[str, float]
\ No newline at end of file
+    feature_impacts: Dict[str, float]
+    model_version: Optional[str] = None
+
+class ApplicantPredictionResult(PredictionResult):
+    user_id: str
+
+class BatchPredictionResult(BaseModel):
+    results: List[ApplicantPredictionResult]
+
+class DeferredPredictionResult(BaseModel):
+    user_id: str
+    assessment_id: int
+    prediction_probability: float
+    risk_category: str
+    explanation_status: str
+    model_version: Optional[str] = None
+
+class ExplanationResult(BaseModel):
+    assessment_id: int
+    status: str
+    base_value: Optional[float] = None
+    feature_impacts: Optional[Dict[str, float]] = None
+    error: Optional[str] = None
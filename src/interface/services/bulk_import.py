@@ -0,0 +1,217 @@
+# src/interface/services/bulk_import.py
+
+"""
+Streaming bulk import of new applicants from JSONL or CSV files.
+
+The file is read in chunks. Each chunk is validated column by column against
+the `CreditApplication` schema, scored with one vectorized model call and
+written with one bulk insert per table, in one transaction per chunk. Rows
+that fail validation or clash with existing users are skipped and reported.
+
+Usage:
+    python -m src.interface.services.bulk_import applicants.jsonl --chunk-size 1000
+"""
+
+import argparse
+import json
+import time
+import typing
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ..database.connection import get_db_session
+from ..database.crud import BulkCRUD
+from ..schemas.credit_application import CreditApplication
+from . import credit_service
+
+USER_FIELDS = ["user_id", "full_name", "email", "phone"]
+REQUIRED_FIELDS = ["user_id", "full_name"]
+
+
+def _field_types() -> Dict[str, type]:
+    """Base type (str, int or float) of every CreditApplication field."""
+    types = {}
+    for name, field in CreditApplication.model_fields.items():
+        annotation = field.annotation
+        if typing.get_origin(annotation) is typing.Union:
+            annotation = next(arg for arg in typing.get_args(annotation) if arg is not type(None))
+        types[name] = annotation
+    return types
+
+
+FIELD_TYPES = _field_types()
+FIELD_DEFAULTS = {
+    name: field.default
+    for name, field in CreditApplication.model_fields.items()
+    if not field.is_required()
+}
+FEATURE_FIELDS = [name for name in CreditApplication.model_fields if name not in USER_FIELDS]
+
+
+def read_chunks(path: Path, chunk_size: int) -> Iterator[pd.DataFrame]:
+    """
+    Stream the file as DataFrames of up to `chunk_size` rows. Like the HTTP
+    endpoint, fields missing from a record take the schema's default.
+    """
+    path = Path(path)
+    if path.suffix.lower() == ".csv":
+        for chunk in pd.read_csv(path, chunksize=chunk_size, dtype=str, keep_default_na=True):
+            for name, default in FIELD_DEFAULTS.items():
+                if name not in chunk.columns:
+                    chunk[name] = default
+            yield chunk
+    elif path.suffix.lower() in (".jsonl", ".ndjson"):
+        records = []
+        with open(path, "r") as file:
+            for line in file:
+                if line.strip():
+                    records.append({**FIELD_DEFAULTS, **json.loads(line)})
+                if len(records) == chunk_size:
+                    yield pd.DataFrame(records)
+                    records = []
+        if records:
+            yield pd.DataFrame(records)
+    else:
+        raise ValueError(f"Unsupported file type '{path.suffix}'. Use .jsonl or .csv")
+
+
+def validate_chunk(chunk: pd.DataFrame) -> Tuple[pd.DataFrame, List[Tuple[int, str]]]:
+    """
+    Validate and coerce a chunk one column at a time.
+
+    Returns:
+        The valid rows with typed columns (None for missing values), and an
+        (index, reason) pair for every rejected row
+    """
+    valid = pd.Series(True, index=chunk.index)
+    reasons = pd.Series("", index=chunk.index, dtype=object)
+    columns = {}
+
+    def reject(mask, reason):
+        new = mask & valid
+        reasons[new] = reason
+        valid[new] = False
+
+    for name in REQUIRED_FIELDS:
+        if name not in chunk.columns:
+            reject(valid, f"missing column '{name}'")
+            columns[name] = pd.Series(None, index=chunk.index, dtype=object)
+            continue
+        values = chunk[name]
+        reject(values.isna() | (values.astype(str).str.strip() == ""), f"'{name}' is required")
+        columns[name] = values.map(lambda v: v if pd.isna(v) else str(v))
+
+    for name in USER_FIELDS + FEATURE_FIELDS:
+        if name in REQUIRED_FIELDS:
+            continue
+        values = chunk[name] if name in chunk.columns else pd.Series(None, index=chunk.index, dtype=object)
+        present = values.notna()
+
+        if FIELD_TYPES[name] in (int, float):
+            numbers = pd.to_numeric(values, errors="coerce")
+            reject(present & numbers.isna(), f"'{name}' is not a number")
+            if FIELD_TYPES[name] is int:
+                reject(present & numbers.notna() & (numbers % 1 != 0), f"'{name}' is not an integer")
+            columns[name] = numbers
+        else:
+            columns[name] = values.where(present, None).map(lambda v: v if v is None else str(v))
+
+    typed = pd.DataFrame(columns).loc[valid]
+    typed = typed.astype(object).where(typed.notna(), None)
+    for name, field_type in FIELD_TYPES.items():
+        if field_type is int:
+            typed[name] = typed[name].map(lambda v: v if v is None else int(v))
+
+    rejected = [(index, reasons[index]) for index in chunk.index[~valid]]
+    return typed, rejected
+
+
+def _drop_conflicts(db, rows: pd.DataFrame) -> Tuple[pd.DataFrame, List[Tuple[int, str]]]:
+    """Skip rows whose user_id or email is taken, in the database or earlier in the chunk."""
+    duplicate_id = rows["user_id"].duplicated()
+    existing_ids = BulkCRUD.get_existing_user_ids(db, rows["user_id"].tolist())
+    taken_id = rows["user_id"].isin(existing_ids) | duplicate_id
+
+    emails = rows["email"]
+    has_email = emails.notna()
+    existing_emails = BulkCRUD.get_existing_emails(db, emails[has_email].tolist())
+    taken_email = has_email & (emails.isin(existing_emails) | (emails.duplicated() & has_email))
+
+    rejected = [(index, "user_id already exists") for index in rows.index[taken_id]]
+    rejected += [(index, "email already exists") for index in rows.index[taken_email & ~taken_id]]
+    return rows.loc[~(taken_id | taken_email)], rejected
+
+
+def import_file(path: Path, chunk_size: int = 1000, explain: bool = True,
+                rejects_path: Optional[Path] = None) -> Dict:
+    """
+    Import every applicant in `path`, printing progress after each chunk.
+
+    Args:
+        path: .jsonl or .csv file with one applicant per record, using the
+              field names of the /predict/new_applicant request
+        chunk_size: Rows validated, scored and committed together
+        explain: Store SHAP explanations (False leaves them to be computed
+                 on demand, like the deferred endpoint)
+        rejects_path: Optional .jsonl file receiving every skipped row and why
+
+    Returns:
+        Dictionary with the number of rows read, imported and rejected, and the elapsed time
+    """
+    service = credit_service.get_service()
+    print(f"Importing {path} ({service.readiness()['prediction_mode']} predictions, chunks of {chunk_size})")
+
+    totals = {"read": 0, "imported": 0, "rejected": 0}
+    started = time.perf_counter()
+    rejects_file = open(rejects_path, "w") if rejects_path else None
+
+    try:
+        for chunk_number, chunk in enumerate(read_chunks(path, chunk_size), start=1):
+            chunk = chunk.reset_index(drop=True)
+            offset = totals["read"]
+            totals["read"] += len(chunk)
+
+            rows, rejected = validate_chunk(chunk)
+
+            with get_db_session() as db:
+                rows, conflicts = _drop_conflicts(db, rows)
+                rejected += conflicts
+
+                if len(rows):
+                    users = rows[USER_FIELDS].to_dict("records")
+                    features = rows[FEATURE_FIELDS].to_dict("records")
+                    predictions = service.predict_batch_with_explanation(features, explain=explain)
+                    BulkCRUD.create_applicants(db, users, features, predictions)
+
+            totals["imported"] += len(rows)
+            totals["rejected"] += len(rejected)
+            if rejects_file:
+                for index, reason in rejected:
+                    record = chunk.loc[index].replace({np.nan: None}).to_dict()
+                    rejects_file.write(json.dumps({"row": offset + index + 1, "reason": reason,
+                                                   "record": record}, default=str) + "\n")
+
+            elapsed = time.perf_counter() - started
+            print(f"Chunk {chunk_number}: {totals['read']} read, {totals['imported']} imported, "
+                  f"{totals['rejected']} rejected ({totals['read'] / elapsed:.0f} rows/s)")
+    finally:
+        if rejects_file:
+            rejects_file.close()
+
+    totals["seconds"] = time.perf_counter() - started
+    print(f"Import complete: {totals['imported']} of {totals['read']} rows imported in {totals['seconds']:.1f}s")
+    return totals
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bulk import new applicants from a JSONL or CSV file.")
+    parser.add_argument("path", type=Path, help=".jsonl or .csv file, one applicant per record")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="rows per validation, scoring and commit")
+    parser.add_argument("--no-explain", action="store_true", help="skip SHAP explanations (computed on demand)")
+    parser.add_argument("--rejects", type=Path, default=None, help="write skipped rows and reasons to this .jsonl")
+    args = parser.parse_args()
+
+    import_file(args.path, args.chunk_size, explain=not args.no_explain, rejects_path=args.rejects)
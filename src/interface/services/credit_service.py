@@ -8,26 +8,57 @@ including predictions, explanations, and database operations.
 """
 
 import logging
+import threading
+import time
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 import pandas as pd
 import numpy as np
-import joblib
-import shap
 from datetime import datetime
+from decimal import Decimal
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
 
 # Import database modules
-from ..database.connection import get_db_session, create_tables
-from ..database.crud import UserCRUD, FeatureCRUD, AssessmentCRUD, PortfolioCRUD
+from ..database.connection import get_db_session, create_tables, missing_columns
+from ..database.crud import UserCRUD, FeatureCRUD, AssessmentCRUD, PortfolioCRUD, ShadowCRUD, UNREGISTERED_MODEL_VERSION
 from ..database.models import User, UserFeature, RiskAssessment
 
-# Import the prediction module
-from src.model.predict import make_prediction
+from . import metrics, model_registry, profiling
+from .explanation_worker import ExplanationWorker
+from .micro_batcher import MicroBatcher
+from .prediction_cache import PredictionCache
+from .row_encoder import RowEncoder
+from .scoring_pool import ScoringPool
+from .shadow_scorer import ShadowScorer
+from src.model import backends, explain
+from src.utils import artifacts, get_config
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+config = get_config.read_yaml()
+
+
+class ModelBundle:
+    """
+    Everything one model version needs to score: the model, its preprocessor,
+    explainer and single-row encoder. A bundle is never modified after it is
+    built; requests read `CreditRiskService.bundle` once, so each is scored
+    entirely by one version even while a new one is swapped in.
+    """
+
+    def __init__(self, model, preprocessor, model_version: str, artifact_version: str):
+        self.model = model
+        self.preprocessor = preprocessor
+        self.model_version = model_version
+        # Also identifies a retrained model saved over the same files
+        self.artifact_version = artifact_version
+        self.explainer = None
+        self.row_encoder = None
+        self.is_initialized = False
+
 
 class CreditRiskService:
     """
@@ -35,12 +66,69 @@ class CreditRiskService:
     Handles ML model predictions, SHAP explanations, and database operations.
     """
 
-    def __init__(self):
-        """Initialize the credit risk service with ML artifacts."""
-        self.model = None
-        self.preprocessor = None
-        self.explainer = None
-        self.is_initialized = False
+    def __init__(self, worker_process: bool = False, artifacts: Optional[Tuple[Path, Path, str]] = None):
+        """
+        Initialize the credit risk service with ML artifacts.
+
+        Args:
+            worker_process: True inside a scoring pool worker, which only needs
+                            the ML artifacts (no database, model registry,
+                            batcher, nested pool or background threads)
+            artifacts: Model path, preprocessor path and model version a
+                       worker process serves, as resolved by its API process
+        """
+        self.worker_process = worker_process
+        self.bundle = None
+        # Model path, preprocessor path and model version being served
+        self.artifacts = artifacts
+        self._swap_lock = threading.Lock()
+
+        # Startup timings reported by the readiness endpoint
+        self.load_seconds = None
+        self.warmup_seconds = None
+        self.warmup_error = None
+        self.warm_latency_ms = {}
+        # Set when the database predates the models and must be migrated
+        self.schema_error = None
+
+        # Optional scheduler grouping concurrent requests into one model call
+        self.batcher = None
+        batching = config['serving']['batching']
+        if batching['enabled'] and not worker_process:
+            self.batcher = MicroBatcher(
+                self._predict_micro_batch,
+                max_batch_size=batching['max_batch_size'],
+                max_wait_ms=batching['max_wait_ms']
+            )
+
+        # Recent results, keyed by the canonical feature vector and artifact version
+        self.prediction_cache = None
+        cache_config = config['serving']['prediction_cache']
+        if cache_config['max_size'] > 0 and not worker_process:
+            self.prediction_cache = PredictionCache(
+                max_size=cache_config['max_size'],
+                ttl_seconds=cache_config['ttl_seconds']
+            )
+
+        # Optional challenger model scoring live traffic off the request path
+        self.challenger = None
+        self.shadow_scorer = None
+        shadow_config = config['serving']['shadow']
+        if shadow_config['challenger'] and not worker_process:
+            self.shadow_scorer = ShadowScorer(
+                self._score_challenger,
+                max_queue=shadow_config['max_queue'],
+                batch_size=shadow_config['batch_size'],
+                flush_seconds=shadow_config['flush_seconds']
+            )
+
+        # Background pool filling in explanations of deferred assessments
+        self.explanation_worker = None
+        if not worker_process:
+            self.explanation_worker = ExplanationWorker(
+                self._explain_assessment,
+                max_workers=config['serving']['explanation_workers']
+            )
 
         # Define paths
         try:
@@ -53,14 +141,148 @@ class CreditRiskService:
         self.preprocessor_path = self.model_dir / "preprocessor.joblib"
 
         # Initialize components
-        self._initialize_database()
+        started = time.perf_counter()
+        if not worker_process:
+            self._initialize_database()
         self._load_ml_artifacts()
+        self.load_seconds = time.perf_counter() - started
+        logger.info(backends.format_import_report())
+
+        # Optional worker processes scoring off the API process, with the artifacts it resolved
+        self.scoring_pool = None
+        if config['serving']['scoring_workers'] > 0 and not worker_process:
+            self.scoring_pool = ScoringPool(config['serving']['scoring_workers'], self.artifacts)
+
+        # Background check for a newly activated or retrained model; workers
+        # are replaced by the API process instead of swapping on their own
+        self._watch_stop = threading.Event()
+        poll_seconds = config['serving']['model_poll_seconds']
+        if poll_seconds > 0 and not worker_process:
+            threading.Thread(target=self._watch_models, args=(poll_seconds,), daemon=True,
+                             name="model-watcher").start()
+
+    @property
+    def is_initialized(self) -> bool:
+        return self.bundle is not None and self.bundle.is_initialized
+
+    @property
+    def model(self):
+        return self.bundle.model if self.bundle is not None else None
+
+    @property
+    def preprocessor(self):
+        return self.bundle.preprocessor if self.bundle is not None else None
+
+    @property
+    def explainer(self):
+        return self.bundle.explainer if self.bundle is not None else None
+
+    @property
+    def row_encoder(self):
+        return self.bundle.row_encoder if self.bundle is not None else None
+
+    @property
+    def artifact_version(self) -> Optional[str]:
+        return self.bundle.artifact_version if self.bundle is not None else None
+
+    @property
+    def model_version(self) -> str:
+        """Version recorded on assessments scored now ('mock' without a model)."""
+        return self.bundle.model_version if self.is_initialized else "mock"
+
+    @staticmethod
+    def _sample_features() -> Dict:
+        """A realistic application used to warm up models."""
+        return {key.lower(): value for key, value in MOCK_DB["USR001_John_Doe"].items()}
+
+    def warm_up(self, rounds: int = 3):
+        """
+        Run dummy scores through the single-row, score-only and batch paths
+        (and once through every scoring worker) so that the first real request
+        does not pay for lazy initialization. The latency of the last round is
+        kept as the warm latency of each path. A failure is kept in
+        `warmup_error`, and the service is then reported as not ready.
+
+        Warm-up scores are kept out of the metrics, so they are run in this
+        thread rather than through the micro-batcher (which scores a lone
+        request with the same direct path).
+        """
+        sample = self._sample_features()
+        paths = {
+            "single": lambda: self._predict_direct(sample),
+            "score_only": lambda: self._predict_direct(sample, explain=False),
+            "batch": lambda: self.predict_batch_with_explanation([sample, sample]),
+        }
+
+        started = time.perf_counter()
+        try:
+            with metrics.warm_up():
+                for _ in range(rounds):
+                    for name, score in paths.items():
+                        path_started = time.perf_counter()
+                        score()
+                        self.warm_latency_ms[name] = (time.perf_counter() - path_started) * 1000
+            if self.scoring_pool is not None:
+                self.scoring_pool.warm_up(sample)
+        except Exception as e:
+            self.warmup_error = f"{type(e).__name__}: {e}"
+            logger.error(f"❌ Warm-up failed: {e}")
+        self.warmup_seconds = time.perf_counter() - started
+        if self.warmup_error is None:
+            logger.info(f"✅ Service warmed up in {self.warmup_seconds:.2f}s")
+
+    def readiness(self) -> Dict:
+        """Startup report: load and warm-up timings and which predictions are served."""
+        if self.schema_error is not None:
+            status = "schema_outdated"
+        elif self.warmup_error is not None:
+            status = "warmup_failed"
+        else:
+            status = "ready" if self.warmup_seconds is not None else "warming_up"
+        return {
+            "status": status,
+            "prediction_mode": "model" if self.is_initialized else "mock",
+            "model_version": self.model_version,
+            "artifact_version": self.artifact_version if self.is_initialized else None,
+            "explainer": type(self.explainer).__name__ if self.explainer is not None else None,
+            "scoring_workers": self.scoring_pool.workers if self.scoring_pool is not None else 0,
+            "load_seconds": self.load_seconds,
+            "warmup_seconds": self.warmup_seconds,
+            "warmup_error": self.warmup_error,
+            "schema_error": self.schema_error,
+            "warm_latency_ms": self.warm_latency_ms,
+            "backend_imports": backends.import_report(),
+            "prediction_cache": self.prediction_cache.stats() if self.prediction_cache is not None else None,
+            "shadow": self.shadow_scorer.stats() if self.shadow_scorer is not None else None
+        }
+
+    def shutdown(self):
+        """Stop the model watcher, the batcher, the scoring pool and the background workers."""
+        self._watch_stop.set()
+        if self.shadow_scorer is not None:
+            self.shadow_scorer.shutdown()
+        if self.batcher is not None:
+            self.batcher.shutdown()
+        if self.scoring_pool is not None:
+            self.scoring_pool.shutdown()
+        if self.explanation_worker is not None:
+            self.explanation_worker.shutdown(wait=False)
 
     def _initialize_database(self):
-        """Initialize database tables and seed data if needed."""
+        """
+        Initialize database tables and seed data if needed. A database created
+        before columns were added to the models gets no new columns from
+        create_tables(); the service then reports not ready until it is migrated.
+        """
         try:
             create_tables()
-            logger.info("✅ Database tables initialized successfully")
+            missing = missing_columns()
+            if missing:
+                columns = ", ".join(f"{table}.{column}" for table, names in missing.items() for column in names)
+                self.schema_error = f"Database schema is out of date (missing {columns}); run `alembic upgrade head`"
+                logger.error(f"❌ {self.schema_error}")
+            else:
+                logger.info("✅ Database tables initialized successfully")
 
             # Check if we need to add sample data
             with get_db_session() as db:
@@ -75,40 +297,185 @@ class CreditRiskService:
     def _load_ml_artifacts(self):
         """Load ML model, preprocessor, and initialize SHAP explainer."""
         try:
-            # Load model and preprocessor
-            if self.model_path.exists() and self.preprocessor_path.exists():
-                self.model = joblib.load(self.model_path)
-                self.preprocessor = joblib.load(self.preprocessor_path)
-
-                # Initialize SHAP explainer with a small background dataset
-                try:
-                    self.explainer = shap.TreeExplainer(self.model.model)
-                    self.is_initialized = True
-                    logger.info("✅ ML artifacts loaded successfully")
-                except Exception as e:
-                    logger.warning(f"⚠️ SHAP explainer initialization failed: {e}")
-                    self.explainer = None
+            self.artifacts = self._resolve_artifacts()
+            model_path, preprocessor_path, model_version = self.artifacts
+            if model_path.exists() and preprocessor_path.exists():
+                self.bundle = self._load_bundle(model_path, preprocessor_path, model_version)
             else:
                 logger.warning("⚠️ ML artifacts not found. Service will use fallback predictions.")
 
         except Exception as e:
             logger.error(f"❌ Failed to load ML artifacts: {e}")
-            self.is_initialized = False
 
-    def _prepare_features_for_model(self, features_dict: Dict) -> pd.DataFrame:
+    def _resolve_artifacts(self) -> Tuple[Path, Path, str]:
         """
-        Prepare feature dictionary for model input.
-        Converts database column names to model expected format.
+        Model and preprocessor paths and version to serve: the active version
+        of the model registry, or the files in models/ if none is active. A
+        worker process serves the artifacts its API process resolved.
+        """
+        if self.worker_process:
+            return self.artifacts
+
+        try:
+            active = model_registry.get_active_model()
+        except Exception as e:
+            # e.g. a database without the model_metadata table yet
+            logger.debug(f"Model registry unavailable: {e}")
+            active = None
+
+        if active is not None:
+            return Path(active['model_path']), Path(active['preprocessor_path']), active['model_version']
+        return self.model_path, self.preprocessor_path, UNREGISTERED_MODEL_VERSION
+
+    @staticmethod
+    def _artifact_version(model_path: Path, preprocessor_path: Path, model_version: str) -> str:
+        return "{}/{}/{}".format(
+            model_version,
+            artifacts.registry.fingerprint(model_path),
+            artifacts.registry.fingerprint(preprocessor_path)
+        )
+
+    def _load_bundle(self, model_path: Path, preprocessor_path: Path, model_version: str) -> ModelBundle:
+        """Load a model version with its preprocessor and build its explainer and row encoder."""
+        bundle = ModelBundle(
+            artifacts.registry.get(model_path),
+            artifacts.registry.get(preprocessor_path),
+            model_version,
+            self._artifact_version(model_path, preprocessor_path, model_version)
+        )
+        bundle.row_encoder = self._build_row_encoder(bundle.model, bundle.preprocessor)
+
+        # Initialize the SHAP explainer for the configured backend
+        try:
+            bundle.explainer = explain.build_explainer(bundle.model.model, config['serving']['explainer'])
+            bundle.is_initialized = True
+            logger.info(f"✅ ML artifacts of model {model_version} loaded successfully")
+        except Exception as e:
+            logger.warning(f"⚠️ SHAP explainer initialization failed: {e}")
+        return bundle
+
+    def check_for_new_model(self) -> bool:
         """
-        # Map database column names to model expected names (uppercase)
-        model_features = {}
-        for key, value in features_dict.items():
-            # Convert snake_case to UPPERCASE
-            model_key = key.upper()
-            model_features[model_key] = value
+        Switch to the active registry version, or to a model retrained over the
+        served files, if it is not the one being served. The new bundle is
+        loaded and warmed up while the current one keeps serving, then swapped
+        in with a single assignment. With a scoring pool, a new pool loads the
+        new artifacts the same way and replaces the current one, which stops
+        once its queued jobs are done.
 
-        # Create DataFrame with single row
-        return pd.DataFrame([model_features])
+        Returns:
+            True if a new model was swapped in
+        """
+        with self._swap_lock:
+            artifacts = self._resolve_artifacts()
+            model_path, preprocessor_path, model_version = artifacts
+            if not (model_path.exists() and preprocessor_path.exists()):
+                return False
+
+            current = self.bundle
+            if current is not None and current.artifact_version == self._artifact_version(
+                    model_path, preprocessor_path, model_version):
+                return False
+
+            started = time.perf_counter()
+            bundle = self._load_bundle(model_path, preprocessor_path, model_version)
+            sample = self._sample_features()
+            if bundle.is_initialized:
+                # Lazy initialization happens here rather than in the first requests
+                with metrics.warm_up():
+                    if bundle.row_encoder is not None:
+                        self._predict_single_fast(sample, True, bundle)
+                    self.predict_batch_with_explanation([sample, sample], bundle=bundle)
+
+            previous_pool = self.scoring_pool
+            if previous_pool is not None:
+                pool = ScoringPool(previous_pool.workers, artifacts)
+                try:
+                    pool.warm_up(sample)
+                except Exception:
+                    pool.shutdown(wait=False)
+                    raise
+                self.scoring_pool = pool
+
+            self.bundle = bundle
+            self.artifacts = artifacts
+            # Results of the previous artifacts must not be served any more
+            if self.prediction_cache is not None:
+                self.prediction_cache.clear()
+            if previous_pool is not None:
+                previous_pool.shutdown(wait=False)
+
+            previous = current.model_version if current is not None else "none"
+            logger.info(f"🔄 Swapped model {previous} for {model_version} "
+                        f"(loaded in {time.perf_counter() - started:.2f}s)")
+            return True
+
+    def _watch_models(self, interval_seconds: float):
+        """Model watcher thread: check for a new model every `interval_seconds`."""
+        while not self._watch_stop.wait(interval_seconds):
+            try:
+                self.check_for_new_model()
+            except Exception as e:
+                logger.error(f"❌ Model swap failed, still serving {self.model_version}: {e}")
+
+    def shadow(self, features_list: List[Dict], results: List[Dict]):
+        """Hand served requests to the challenger; a no-op unless shadow scoring is enabled."""
+        if self.shadow_scorer is not None:
+            self.shadow_scorer.submit(features_list, results)
+
+    def _score_challenger(self, features_list: List[Dict], champion_results: List[Dict]):
+        """Shadow scorer job: score a batch with the challenger and store both scores."""
+        if self.challenger is None:
+            # Loaded by the shadow thread on first use, not at startup
+            model_id = config['serving']['shadow']['challenger']
+            metadata = model_registry.get_model(model_id)
+            if metadata is None:
+                raise ValueError(f"Challenger model {model_id} is not registered")
+            self.challenger = self._load_bundle(
+                Path(metadata['model_path']), Path(metadata['preprocessor_path']), metadata['model_version']
+            )
+        if not self.challenger.is_initialized:
+            raise ValueError(f"Challenger model {self.challenger.model_version} could not be loaded")
+
+        # Mock results are not comparable
+        pairs = [
+            (features_dict, result)
+            for features_dict, result in zip(features_list, champion_results)
+            if result.get('model_version') != "mock"
+        ]
+        if not pairs:
+            return
+
+        features_list = [features_dict for features_dict, _ in pairs]
+        challenger_results = self.predict_batch_with_explanation(features_list, explain=False, bundle=self.challenger)
+        if challenger_results[0]['model_version'] == "mock":
+            raise ValueError("Challenger prediction failed")
+
+        with get_db_session() as db:
+            ShadowCRUD.create_shadow_predictions(db, features_list, [result for _, result in pairs], challenger_results)
+
+    @staticmethod
+    def _build_row_encoder(model, preprocessor) -> Optional[RowEncoder]:
+        """Precompute the single-record fast path for this model and preprocessor."""
+        try:
+            if hasattr(model.model, 'feature_name_'):
+                return RowEncoder(preprocessor, model.model.feature_name_)
+        except Exception as e:
+            logger.warning(f"⚠️ Single-row fast path unavailable: {e}")
+        return None
+
+    def _prepare_features_for_model(self, features_list: List[Dict]) -> pd.DataFrame:
+        """
+        Prepare feature dictionaries for model input.
+        Converts database column names to model expected format.
+        """
+        # Map database column names to model expected names (uppercase),
+        # one row per applicant
+        rows = [
+            {key.upper(): value for key, value in features_dict.items()}
+            for features_dict in features_list
+        ]
+        return pd.DataFrame(rows)
 
     def _generate_mock_prediction(self, features_dict: Dict) -> Dict:
         """
@@ -121,6 +488,7 @@ class CreditRiskService:
         return {
             "base_value": 0.3,
             "prediction_probability": risk_score,
+            "model_version": "mock",
             "feature_impacts": {
                 "utility_bil": 0.15 if utility_bill > 15000 else -0.05,
                 "region_rating_client": -0.08,
@@ -130,123 +498,292 @@ class CreditRiskService:
             }
         }
 
-    def predict_with_explanation(self, features_dict: Dict) -> Dict:
+    def predict_with_explanation(self, features_dict: Dict, explain: bool = True) -> Dict:
         """
         Generate prediction with SHAP explanations.
 
         Args:
             features_dict: Dictionary of features with database column names
+            explain: If False, skip SHAP and return base_value and feature_impacts as None
 
         Returns:
             Dictionary containing base_value, prediction_probability, and feature_impacts
         """
+        cache_key = self._cache_key(features_dict, explain)
+        if cache_key is not None:
+            cached = self.prediction_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        result = self._predict_uncached(features_dict, explain)
+        self._cache_result(features_dict, explain, result)
+        return result
+
+    def _predict_uncached(self, features_dict: Dict, explain: bool = True) -> Dict:
+        """Score one applicant, bypassing the prediction cache."""
+        if self.batcher is not None:
+            # Grouped with concurrent requests into one vectorized call
+            return self.batcher.submit(features_dict, explain).result()
+        return self._predict_direct(features_dict, explain)
+
+    def _cache_key(self, features_dict: Dict, explain: bool) -> Optional[str]:
+        """Prediction cache key of a request, or None when results are not cached (e.g. mock predictions)."""
+        bundle = self.bundle
+        if self.prediction_cache is None or bundle is None or not bundle.is_initialized:
+            return None
+        return self.prediction_cache.make_key(features_dict, explain, bundle.artifact_version)
+
+    def _cache_result(self, features_dict: Dict, explain: bool, result: Dict):
+        """
+        Cache a result under the artifact version that produced it, which may
+        not be the one served by the time it returns (e.g. a scoring worker
+        during a swap). Mock predictions no model produced are not cached.
+        """
+        artifact_version = result.get('artifact_version')
+        if self.prediction_cache is None or artifact_version is None or result.get('model_version') == "mock":
+            return
+        self.prediction_cache.put(self.prediction_cache.make_key(features_dict, explain, artifact_version), result)
+
+    def _predict_direct(self, features_dict: Dict, explain: bool = True) -> Dict:
+        """Score one applicant in the calling thread."""
+        bundle = self.bundle
+        if bundle is not None and bundle.is_initialized and bundle.row_encoder is not None:
+            try:
+                return self._predict_single_fast(features_dict, explain, bundle)
+            except Exception as e:
+                logger.warning(f"Single-row fast path failed, using batch path: {e}")
+
+        return self.predict_batch_with_explanation([features_dict], explain, bundle)[0]
+
+    def _predict_micro_batch(self, features_list: List[Dict], explain: bool) -> List[Dict]:
+        """Scoring function of the micro-batcher; a lone request takes the single-row fast path."""
+        if len(features_list) == 1:
+            return [self._predict_direct(features_list[0], explain)]
+        return self.predict_batch_with_explanation(features_list, explain)
+
+    def _predict_single_fast(self, features_dict: Dict, explain: bool = True,
+                             bundle: Optional[ModelBundle] = None) -> Dict:
+        """
+        Score one applicant without building any DataFrame: the request is
+        encoded into a preallocated row that goes straight to the booster and
+        the explainer.
+        """
+        bundle = bundle or self.bundle
+        metrics.count(metrics.PREDICTIONS, "single")
+        with metrics.stage("preprocess"), profiling.span("row_encoder"):
+            row = bundle.row_encoder.encode(features_dict)
+
+        booster = getattr(bundle.model.model, 'booster_', None)
+        with metrics.stage("predict_proba"):
+            if booster is not None:
+                probability = float(booster.predict(row)[0])
+            else:
+                probability = float(bundle.model.predict_proba(row)[0, 1])
+
+        if not explain:
+            return {"base_value": None, "prediction_probability": probability, "feature_impacts": None,
+                    "model_version": bundle.model_version, "artifact_version": bundle.artifact_version}
+
+        feature_impacts = None
+        base_value = 0.3  # Default base value
+
+        if bundle.explainer is not None:
+            try:
+                with metrics.stage("shap"):
+                    base_value, shap_matrix = self._explain(row, bundle.explainer)
+                feature_impacts = {
+                    col: float(value)
+                    for col, value in zip(bundle.row_encoder.feature_names, shap_matrix[0])
+                }
+            except Exception as e:
+                logger.warning(f"SHAP explanation failed: {e}")
+
+        if feature_impacts is None:
+            feature_impacts = self._generate_simple_impacts(features_dict, probability)
+
+        return {
+            "base_value": base_value,
+            "prediction_probability": probability,
+            "feature_impacts": feature_impacts,
+            "model_version": bundle.model_version,
+            "artifact_version": bundle.artifact_version
+        }
+
+    def predict_batch_with_explanation(self, features_list: List[Dict], explain: bool = True,
+                                       bundle: Optional[ModelBundle] = None) -> List[Dict]:
+        """
+        Generate predictions with SHAP explanations for many applicants at once.
+        Preprocessing, the model call and the SHAP explainer each run once over
+        the whole batch instead of once per applicant.
+
+        Args:
+            features_list: List of feature dictionaries with database column names
+            explain: If False, skip SHAP and return base_value and feature_impacts as None
+            bundle: Model version to score with (default: the one being served)
+
+        Returns:
+            One dictionary per applicant, in input order, containing base_value,
+            prediction_probability, feature_impacts, model_version and artifact_version
+
+        Raises:
+            Exception: If the batch cannot be scored; mock predictions are only
+                       returned when no model is loaded
+        """
+        bundle = bundle or self.bundle
         try:
             # If ML artifacts are not loaded, use mock prediction
-            if not self.is_initialized:
+            if bundle is None or not bundle.is_initialized:
                 logger.warning("Using mock prediction as ML artifacts are not loaded")
-                return self._generate_mock_prediction(features_dict)
+                metrics.count(metrics.MOCK_PREDICTIONS, "no_model", len(features_list))
+                return [self._generate_mock_prediction(features_dict) for features_dict in features_list]
+
+            metrics.count(metrics.PREDICTIONS, "batch", len(features_list))
 
             # Prepare features for model
-            input_df = self._prepare_features_for_model(features_dict)
+            with metrics.stage("preprocess"):
+                with profiling.span("build_dataframe", rows=len(features_list)):
+                    input_df = self._prepare_features_for_model(features_list)
 
-            # Use the existing make_prediction function
-            prediction_proba = make_prediction(input_df)
+                # Score the same preprocessed matrix that SHAP explains, so batch
+                # results agree with the single-row fast path
+                processed_df = self._apply_preprocessor(input_df, bundle)
+            with metrics.stage("predict_proba"):
+                prediction_proba = bundle.model.predict_proba(processed_df)
 
             # Extract probability for positive class
             if len(prediction_proba.shape) > 1:
-                probability = float(prediction_proba[0, 1])
+                probabilities = prediction_proba[:, 1]
             else:
-                probability = float(prediction_proba[0])
+                probabilities = prediction_proba
 
             # Generate SHAP explanations if available
-            feature_impacts = {}
+            impacts_per_row = None
             base_value = 0.3  # Default base value
 
-            if self.explainer is not None:
-                try:
-                    # Process input through preprocessor for SHAP
-                    processed_df = self._apply_preprocessor(input_df)
-                    shap_values = self.explainer.shap_values(processed_df)
-
-                    # Handle different SHAP output formats
-                    if isinstance(self.explainer.expected_value, list):
-                        base_value = float(self.explainer.expected_value[1])
-                    else:
-                        base_value = float(self.explainer.expected_value)
+            if not explain:
+                return [
+                    {"base_value": None, "prediction_probability": float(probability), "feature_impacts": None,
+                     "model_version": bundle.model_version, "artifact_version": bundle.artifact_version}
+                    for probability in probabilities
+                ]
 
-                    if isinstance(shap_values, list):
-                        shap_values_class1 = shap_values[1][0]
-                    else:
-                        shap_values_class1 = shap_values[0]
+            if bundle.explainer is not None:
+                try:
+                    with metrics.stage("shap"):
+                        base_value, shap_matrix = self._explain(processed_df, bundle.explainer)
 
                     # Map SHAP values to feature names
-                    for idx, col in enumerate(processed_df.columns):
-                        feature_impacts[col] = float(shap_values_class1[idx])
+                    columns = list(processed_df.columns)
+                    impacts_per_row = [
+                        {col: float(value) for col, value in zip(columns, row)}
+                        for row in shap_matrix
+                    ]
 
                 except Exception as e:
                     logger.warning(f"SHAP explanation failed: {e}")
+
+            results = []
+            for idx, features_dict in enumerate(features_list):
+                probability = float(probabilities[idx])
+                if impacts_per_row is not None:
+                    feature_impacts = impacts_per_row[idx]
+                else:
                     # Use simplified feature impacts
                     feature_impacts = self._generate_simple_impacts(features_dict, probability)
-            else:
-                feature_impacts = self._generate_simple_impacts(features_dict, probability)
 
-            return {
-                "base_value": base_value,
-                "prediction_probability": probability,
-                "feature_impacts": feature_impacts
-            }
+                results.append({
+                    "base_value": base_value,
+                    "prediction_probability": probability,
+                    "feature_impacts": feature_impacts,
+                    "model_version": bundle.model_version,
+                    "artifact_version": bundle.artifact_version
+                })
+            return results
 
         except Exception as e:
-            logger.error(f"Prediction failed: {e}")
-            # Return mock prediction as fallback
-            return self._generate_mock_prediction(features_dict)
+            # Raised rather than answered with mock scores, which callers would
+            # serve and store as if the model had produced them
+            logger.error(f"Prediction of {len(features_list)} applicants failed: {e}")
+            metrics.count(metrics.PREDICTION_ERRORS, "batch", len(features_list))
+            raise
+
+    @staticmethod
+    def _explain(processed_df: pd.DataFrame, explainer) -> Tuple[float, np.ndarray]:
+        """
+        Run the SHAP explainer once over a preprocessed batch.
+
+        Returns:
+            The base value and a (n_rows, n_features) matrix of SHAP values
+            for the positive class
+        """
+        shap_values = explainer.shap_values(processed_df)
+
+        # Handle different SHAP output formats
+        if isinstance(explainer.expected_value, list):
+            base_value = float(explainer.expected_value[1])
+        else:
+            base_value = float(explainer.expected_value)
+
+        if isinstance(shap_values, list):
+            shap_values_class1 = shap_values[1]
+        else:
+            shap_values_class1 = np.asarray(shap_values)
+            if shap_values_class1.ndim == 3:
+                shap_values_class1 = shap_values_class1[:, :, 1]
 
-    def _apply_preprocessor(self, input_df: pd.DataFrame) -> pd.DataFrame:
+        return base_value, shap_values_class1
+
+    def _apply_preprocessor(self, input_df: pd.DataFrame, bundle: Optional[ModelBundle] = None) -> pd.DataFrame:
         """Apply preprocessing pipeline to input data."""
-        if not self.preprocessor:
+        bundle = bundle or self.bundle
+        if bundle is None or not bundle.preprocessor:
             return input_df
 
         try:
-            numerical_cols = self.preprocessor.get('numerical_cols', [])
-            categorical_cols = self.preprocessor.get('categorical_cols', [])
-            encoder = self.preprocessor.get('encoder')
-            scaler = self.preprocessor.get('scaler')
+            numerical_cols = bundle.preprocessor.get('numerical_cols', [])
+            categorical_cols = bundle.preprocessor.get('categorical_cols', [])
+            encoder = bundle.preprocessor.get('encoder')
+            scaler = bundle.preprocessor.get('scaler')
 
             # Prepare full dataframe with all expected columns
-            full_df = pd.DataFrame(columns=numerical_cols + categorical_cols)
-            for col in input_df.columns:
-                if col in full_df.columns:
-                    full_df[col] = input_df[col]
+            with profiling.span("fill_missing"):
+                full_df = pd.DataFrame(columns=numerical_cols + categorical_cols)
+                for col in input_df.columns:
+                    if col in full_df.columns:
+                        full_df[col] = input_df[col]
 
-            # Process numerical and categorical features
-            num_df = full_df[numerical_cols].fillna(0)
-            cat_df = full_df[categorical_cols].fillna("Missing")
+                # Process numerical and categorical features
+                num_df = full_df[numerical_cols].fillna(0)
+                cat_df = full_df[categorical_cols].fillna("Missing")
 
             # Apply transformations
-            if encoder:
-                encoded = encoder.transform(cat_df)
-                encoded_df = pd.DataFrame(
-                    encoded,
-                    columns=encoder.get_feature_names_out(categorical_cols)
-                )
-            else:
-                encoded_df = pd.DataFrame()
+            with profiling.span("encode_categorical"):
+                if encoder:
+                    encoded = encoder.transform(cat_df)
+                    encoded_df = pd.DataFrame(
+                        encoded,
+                        columns=encoder.get_feature_names_out(categorical_cols)
+                    )
+                else:
+                    encoded_df = pd.DataFrame()
 
-            if scaler:
-                scaled = scaler.transform(num_df)
-                scaled_df = pd.DataFrame(scaled, columns=numerical_cols)
-            else:
-                scaled_df = num_df
+            with profiling.span("scale_numerical"):
+                if scaler:
+                    scaled = scaler.transform(num_df)
+                    scaled_df = pd.DataFrame(scaled, columns=numerical_cols)
+                else:
+                    scaled_df = num_df
 
             # Combine processed features
-            processed_df = pd.concat([scaled_df, encoded_df], axis=1)
+            with profiling.span("align_columns"):
+                processed_df = pd.concat([scaled_df, encoded_df], axis=1)
 
-            # Ensure we have all expected model features
-            if self.model and hasattr(self.model.model, 'feature_name_'):
-                expected_cols = self.model.model.feature_name_
-                final_df = pd.DataFrame(columns=expected_cols)
-                final_df = pd.concat([final_df, processed_df], ignore_index=True).fillna(0)
-                return final_df[expected_cols]
+                # Ensure we have all expected model features
+                if bundle.model and hasattr(bundle.model.model, 'feature_name_'):
+                    expected_cols = bundle.model.model.feature_name_
+                    final_df = pd.DataFrame(columns=expected_cols)
+                    final_df = pd.concat([final_df, processed_df], ignore_index=True).fillna(0)
+                    return final_df[expected_cols]
 
             return processed_df
 
@@ -277,46 +814,85 @@ class CreditRiskService:
 
         return impacts
 
-    def create_new_user(self, user_data: Dict, features_data: Dict) -> str:
+    def create_new_user(self, user_data: Dict, features_data: Dict,
+                        prediction_result: Optional[Dict] = None) -> str:
         """
         Create a new user with initial assessment.
 
         Args:
             user_data: Dictionary containing user information (user_id, full_name, email, phone)
             features_data: Dictionary containing feature values
+            prediction_result: Prediction already computed for features_data
+                               (e.g. by the scoring pool); scored here if None
 
         Returns:
             user_id of the created user
         """
-        try:
-            with get_db_session() as db:
-                # Check if user already exists
-                existing_user = UserCRUD.get_user(db, user_data['user_id'])
-                if existing_user:
-                    raise ValueError(f"User {user_data['user_id']} already exists")
+        return self._create_user_with_assessment(
+            user_data, features_data, explain=True, prediction_result=prediction_result
+        )['user_id']
 
-                # Create user
-                user = UserCRUD.create_user(db, user_data)
-                logger.info(f"Created user: {user.user_id}")
+    def create_new_user_with_assessment(self, user_data: Dict, features_data: Dict,
+                                        prediction_result: Optional[Dict] = None,
+                                        db: Optional[Session] = None) -> Dict:
+        """
+        Create a new user with initial assessment and return what was stored.
 
-                # Create features
-                features = FeatureCRUD.create_user_features(db, user.user_id, features_data)
-                logger.info(f"Created features for user: {user.user_id}")
+        Args:
+            user_data: Dictionary containing user information (user_id, full_name, email, phone)
+            features_data: Dictionary containing feature values
+            prediction_result: Prediction already computed for features_data; scored here if None
+            db: Session to do all the writes in, committed once; a new one is opened if None
 
-                # Generate initial assessment
-                prediction_result = self.predict_with_explanation(features_data)
+        Returns:
+            Dictionary with user_id, assessment_id, base_value, prediction_probability,
+            feature_impacts, risk_category and explanation_status
+        """
+        return self._create_user_with_assessment(
+            user_data, features_data, explain=True, prediction_result=prediction_result, db=db
+        )
 
-                # Store assessment
-                assessment = AssessmentCRUD.create_assessment(
-                    db,
-                    user.user_id,
-                    features.feature_id,
-                    prediction_result,
-                    "initial"
-                )
-                logger.info(f"Created initial assessment for user: {user.user_id}")
+    def create_new_user_with_deferred_explanation(self, user_data: Dict, features_data: Dict,
+                                                  prediction_result: Optional[Dict] = None,
+                                                  db: Optional[Session] = None) -> Dict:
+        """
+        Create a new user and store the initial assessment with its probability only.
+        The SHAP explanation is computed by the background explanation worker and
+        can be fetched later with `get_explanation`.
 
-                return user.user_id
+        Returns:
+            Dictionary with user_id, assessment_id, prediction_probability,
+            risk_category and explanation_status
+        """
+        created = self._create_user_with_assessment(
+            user_data, features_data, explain=False, prediction_result=prediction_result, db=db
+        )
+        if created['explanation_status'] == "pending":
+            self.explanation_worker.submit(created['assessment_id'], features_data)
+        return created
+
+    def _create_user_with_assessment(self, user_data: Dict, features_data: Dict, explain: bool,
+                                     prediction_result: Optional[Dict] = None,
+                                     db: Optional[Session] = None) -> Dict:
+        """
+        Store the user, their features and the initial assessment in one transaction.
+
+        Args:
+            db: Session to work in (e.g. the request's); a new one is opened if None
+        """
+        try:
+            with metrics.stage("db_write"):
+                if db is None:
+                    with get_db_session() as session:
+                        return self._store_new_user(session, user_data, features_data, explain, prediction_result)
+
+                try:
+                    created = self._store_new_user(db, user_data, features_data, explain, prediction_result)
+                    db.commit()
+                except Exception:
+                    db.rollback()
+                    raise
+                return created
 
         except ValueError as ve:
             logger.error(f"User creation validation error: {ve}")
@@ -325,11 +901,165 @@ class CreditRiskService:
             logger.error(f"Failed to create user: {e}")
             raise ValueError(f"Could not create user: {str(e)}")
 
+    def _store_new_user(self, db: Session, user_data: Dict, features_data: Dict, explain: bool,
+                        prediction_result: Optional[Dict]) -> Dict:
+        """Add the new user's rows to the session's transaction without committing it."""
+        # Check if user already exists
+        existing_user = UserCRUD.get_user(db, user_data['user_id'])
+        if existing_user:
+            raise ValueError(f"User {user_data['user_id']} already exists")
+
+        # Create user
+        user = UserCRUD.create_user(db, user_data, commit=False)
+        logger.info(f"Created user: {user.user_id}")
+
+        # Create features
+        features = FeatureCRUD.create_user_features(db, user.user_id, features_data, commit=False)
+        logger.info(f"Created features for user: {user.user_id}")
+
+        # Generate initial assessment
+        if prediction_result is None:
+            prediction_result = self.predict_with_explanation(features_data, explain=explain)
+
+        # Store assessment
+        assessment = AssessmentCRUD.create_assessment(
+            db,
+            user.user_id,
+            features.feature_id,
+            prediction_result,
+            "initial",
+            commit=False
+        )
+        logger.info(f"Created initial assessment for user: {user.user_id}")
+
+        return {
+            "user_id": user.user_id,
+            "assessment_id": assessment.assessment_id,
+            "base_value": assessment.base_value,
+            "prediction_probability": float(assessment.prediction_probability),
+            "feature_impacts": assessment.feature_impacts,
+            "risk_category": assessment.risk_category.value,
+            "explanation_status": "ready" if assessment.feature_impacts is not None else "pending",
+            "model_version": assessment.model_version
+        }
+
+    def _explain_assessment(self, assessment_id: int, features_dict: Dict):
+        """
+        Background job: compute the SHAP explanation of a stored assessment.
+
+        Only the model artifact that scored the assessment may explain it; if
+        another one is served now (including a model retrained under the same
+        version label), the score was a mock or the artifact was not recorded,
+        the job fails rather than storing impacts that do not belong to the
+        stored probability.
+        """
+        bundle = self.bundle
+        with get_db_session() as db:
+            assessment = AssessmentCRUD.get_assessment(db, assessment_id)
+            if assessment is None:
+                raise ValueError(f"Assessment {assessment_id} not found")
+            artifact_version = assessment.artifact_version
+
+        if bundle is None or not bundle.is_initialized or bundle.artifact_version != artifact_version:
+            raise ValueError(f"Assessment {assessment_id} was scored by model artifact {artifact_version}, "
+                             f"which is not the one being served")
+        if bundle.explainer is None:
+            raise ValueError(f"No SHAP explainer for model {bundle.model_version}")
+
+        with metrics.stage("shap"):
+            if bundle.row_encoder is not None:
+                row = bundle.row_encoder.encode(features_dict)
+                feature_names = bundle.row_encoder.feature_names
+            else:
+                row = self._apply_preprocessor(self._prepare_features_for_model([features_dict]), bundle)
+                feature_names = list(row.columns)
+            base_value, shap_matrix = self._explain(row, bundle.explainer)
+
+        with get_db_session() as db:
+            AssessmentCRUD.update_assessment_explanation(
+                db,
+                assessment_id,
+                base_value,
+                {col: float(value) for col, value in zip(feature_names, shap_matrix[0])}
+            )
+        logger.info(f"Stored deferred explanation for assessment: {assessment_id}")
+
+    def get_explanation(self, assessment_id: int) -> Optional[Dict]:
+        """
+        Get the explanation of an assessment and its status: 'ready', 'pending' or 'failed'.
+        An assessment still missing its explanation that no worker is processing
+        (e.g. after a restart) is queued again.
+
+        Returns:
+            None if the assessment does not exist
+        """
+        with get_db_session() as db:
+            assessment = AssessmentCRUD.get_assessment(db, assessment_id)
+            if not assessment:
+                return None
+
+            result = {
+                "assessment_id": assessment.assessment_id,
+                "status": "ready",
+                "base_value": float(assessment.base_value) if assessment.base_value is not None else None,
+                "feature_impacts": assessment.feature_impacts,
+                "error": None
+            }
+            if assessment.feature_impacts is not None:
+                return result
+
+            status = self.explanation_worker.status(assessment_id)
+            if status is None:
+                self.explanation_worker.submit(assessment_id, self._features_to_dict(assessment.features))
+                status = "pending"
+
+            result["status"] = status
+            result["error"] = self.explanation_worker.error(assessment_id)
+            return result
+
+    @staticmethod
+    def _features_to_dict(features: UserFeature) -> Dict:
+        """
+        Convert a stored UserFeature row into a feature dictionary for prediction.
+        DECIMAL columns come back as floats, like the values of a JSON request,
+        so the dictionary compares equal to the request it was stored from.
+        """
+        values = {
+            column.name: getattr(features, column.name)
+            for column in features.__table__.columns
+            if column.name not in ['feature_id', 'user_id', 'created_at', 'updated_at', 'is_current']
+        }
+        return {
+            name: float(value) if isinstance(value, Decimal) else value
+            for name, value in values.items()
+            if value is not None
+        }
+
+    def get_updated_features(self, user_id: str, updated_features: Dict) -> Dict:
+        """
+        Preview the feature dictionary `update_user_and_reassess` will score,
+        so that it can be scored ahead of the update (e.g. by the scoring pool).
+        """
+        with metrics.stage("db_read"), get_db_session() as db:
+            current_features = FeatureCRUD.get_current_features(db, user_id)
+            if not current_features:
+                raise ValueError(f"No current features found for user {user_id}")
+
+            feature_dict = self._features_to_dict(current_features)
+            for field, value in updated_features.items():
+                if value is None:
+                    feature_dict.pop(field.lower(), None)
+                else:
+                    feature_dict[field.lower()] = value
+            return feature_dict
+
     def update_user_and_reassess(
             self,
             user_id: str,
             updated_features: Dict,
-            changed_by: str = "system"
+            changed_by: str = "system",
+            scored_features: Optional[Dict] = None,
+            prediction_result: Optional[Dict] = None
     ) -> float:
         """
         Update user features and perform reassessment.
@@ -338,12 +1068,15 @@ class CreditRiskService:
             user_id: User identifier
             updated_features: Dictionary of features to update
             changed_by: Who made the change
+            scored_features: Feature dictionary prediction_result was computed for
+            prediction_result: Prediction computed ahead of the update; it is only
+                               used if the stored features still match scored_features
 
         Returns:
             New probability of default
         """
         try:
-            with get_db_session() as db:
+            with metrics.stage("db_write"), get_db_session() as db:
                 # Check user exists
                 user = UserCRUD.get_user(db, user_id)
                 if not user:
@@ -358,15 +1091,11 @@ class CreditRiskService:
                 )
 
                 # Convert features to dictionary for prediction
-                feature_dict = {
-                    column.name: getattr(new_features, column.name)
-                    for column in new_features.__table__.columns
-                    if column.name not in ['feature_id', 'user_id', 'created_at', 'updated_at', 'is_current']
-                       and getattr(new_features, column.name) is not None
-                }
+                feature_dict = self._features_to_dict(new_features)
 
-                # Generate new prediction
-                prediction_result = self.predict_with_explanation(feature_dict)
+                # Generate new prediction, unless it was computed for these exact features
+                if prediction_result is None or feature_dict != scored_features:
+                    prediction_result = self.predict_with_explanation(feature_dict)
 
                 # Store new assessment
                 assessment = AssessmentCRUD.create_assessment(
@@ -438,6 +1167,22 @@ class CreditRiskService:
 # Create singleton instance
 _service_instance = None
 
+# Counters the cache and the shadow scorer keep anyway, read when /metrics is scraped
+metrics.register_stats(
+    "credit_prediction_cache", "Prediction cache",
+    lambda: _service_instance.prediction_cache.stats()
+    if _service_instance is not None and _service_instance.prediction_cache is not None else None,
+    counters=("hits", "misses", "evictions", "expirations"),
+    gauges=("size", "hit_rate")
+)
+metrics.register_stats(
+    "credit_shadow", "Shadow scoring",
+    lambda: _service_instance.shadow_scorer.stats()
+    if _service_instance is not None and _service_instance.shadow_scorer is not None else None,
+    counters=("submitted", "scored", "dropped", "failed"),
+    gauges=("queued",)
+)
+
 
 def get_service() -> CreditRiskService:
     """Get or create the singleton service instance."""
@@ -447,6 +1192,36 @@ def get_service() -> CreditRiskService:
     return _service_instance
 
 
+def start_service() -> Dict:
+    """Create the service and warm it up; called once at application startup."""
+    service = get_service()
+    service.warm_up(config['serving']['warmup_rounds'])
+    return service.readiness()
+
+
+def stop_service():
+    """Release the service's background threads and processes at shutdown."""
+    global _service_instance
+    if _service_instance is not None:
+        _service_instance.shutdown()
+        _service_instance = None
+
+
+def get_cache_stats() -> Optional[Dict]:
+    """Prediction cache counters, or None if the cache is disabled."""
+    service = get_service()
+    if service.prediction_cache is None:
+        return None
+    return service.prediction_cache.stats()
+
+
+def get_readiness() -> Optional[Dict]:
+    """Readiness report of the service, or None if it has not been created yet."""
+    if _service_instance is None:
+        return None
+    return _service_instance.readiness()
+
+
 # --- Public API Functions ---
 # These functions provide a simple interface for the routers
 
@@ -483,10 +1258,70 @@ def predict_and_explain(application_data: Dict, store_in_db: bool = False, user_
     return result
 
 
-def create_new_user(user_data: Dict, features_data: Dict) -> str:
+def predict_and_explain_batch(applications_data: List[Dict]) -> List[Dict]:
+    """Generate predictions with explanations for many applicants in one pass."""
+    service = get_service()
+    return service.predict_batch_with_explanation(applications_data)
+
+
+async def score(features_data: Dict, explain: bool = True) -> Dict:
+    """
+    Score one applicant without blocking the event loop: in the scoring pool
+    when worker processes are configured, otherwise in the threadpool.
+    """
+    service = get_service()
+    with metrics.stage("score"):
+        if service.scoring_pool is None:
+            result = await run_in_threadpool(service.predict_with_explanation, features_data, explain)
+        else:
+            # The pool's workers have no cache, so look it up here first
+            cache_key = service._cache_key(features_data, explain)
+            result = service.prediction_cache.get(cache_key) if cache_key is not None else None
+            if result is None:
+                result = await service.scoring_pool.score(features_data, explain)
+                service._cache_result(features_data, explain, result)
+
+    service.shadow([features_data], [result])
+    return result
+
+
+async def score_batch(applications_data: List[Dict], explain: bool = True) -> List[Dict]:
+    """Batch counterpart of `score`."""
+    service = get_service()
+    if service.scoring_pool is not None:
+        results = await service.scoring_pool.score_batch(applications_data, explain)
+    else:
+        results = await run_in_threadpool(service.predict_batch_with_explanation, applications_data, explain)
+
+    service.shadow(applications_data, results)
+    return results
+
+
+def create_new_user(user_data: Dict, features_data: Dict, prediction_result: Optional[Dict] = None) -> str:
     """Create a new user with initial assessment."""
     service = get_service()
-    return service.create_new_user(user_data, features_data)
+    return service.create_new_user(user_data, features_data, prediction_result)
+
+
+def create_new_user_with_assessment(user_data: Dict, features_data: Dict, prediction_result: Optional[Dict] = None,
+                                    db: Optional[Session] = None) -> Dict:
+    """Create a new user in one transaction and return the stored initial assessment."""
+    service = get_service()
+    return service.create_new_user_with_assessment(user_data, features_data, prediction_result, db)
+
+
+def create_new_user_with_deferred_explanation(user_data: Dict, features_data: Dict,
+                                              prediction_result: Optional[Dict] = None,
+                                              db: Optional[Session] = None) -> Dict:
+    """Create a new user, returning the probability before the explanation is computed."""
+    service = get_service()
+    return service.create_new_user_with_deferred_explanation(user_data, features_data, prediction_result, db)
+
+
+def get_explanation(assessment_id: int) -> Optional[Dict]:
+    """Get a stored explanation and its status."""
+    service = get_service()
+    return service.get_explanation(assessment_id)
 
 
 def update_and_reevaluate(user_id: str, updated_features: Dict, changed_by: str = "system") -> float:
@@ -495,6 +1330,19 @@ def update_and_reevaluate(user_id: str, updated_features: Dict, changed_by: str
     return service.update_user_and_reassess(user_id, updated_features, changed_by)
 
 
+async def update_and_reevaluate_async(user_id: str, updated_features: Dict, changed_by: str = "system") -> float:
+    """
+    Same as `update_and_reevaluate`, with the new prediction computed by `score`
+    before the update is written.
+    """
+    service = get_service()
+    feature_dict = await run_in_threadpool(service.get_updated_features, user_id, updated_features)
+    prediction_result = await score(feature_dict)
+    return await run_in_threadpool(
+        service.update_user_and_reassess, user_id, updated_features, changed_by, feature_dict, prediction_result
+    )
+
+
 def get_full_portfolio_data(filters: Optional[Dict] = None) -> List[Dict]:
     """Get portfolio data with optional filtering."""
     service = get_service()
@@ -0,0 +1,76 @@
+# src/interface/services/explanation_worker.py
+
+"""
+Background worker pool for deferred SHAP explanations.
+
+Assessments created in deferred mode are stored with only the probability;
+this pool computes their feature impacts off the request path and writes
+them back to the stored `RiskAssessment` row.
+"""
+
+import logging
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import threading
+from typing import Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ExplanationWorker:
+    """
+    Runs `explain_fn(assessment_id, features_dict)` on a thread pool and keeps
+    track of the jobs still in flight and of the ones that failed.
+    """
+
+    MAX_TRACKED_FAILURES = 1000
+
+    def __init__(self, explain_fn: Callable[[int, Dict], None], max_workers: int = 2):
+        self._explain_fn = explain_fn
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="explanation")
+        self._pending = set()
+        self._failures = OrderedDict()
+        self._lock = threading.Lock()
+
+    def submit(self, assessment_id: int, features_dict: Dict):
+        """Queue the explanation of one stored assessment."""
+        with self._lock:
+            if assessment_id in self._pending:
+                return
+            self._pending.add(assessment_id)
+            self._failures.pop(assessment_id, None)
+        self._executor.submit(self._run, assessment_id, features_dict)
+
+    def _run(self, assessment_id: int, features_dict: Dict):
+        try:
+            self._explain_fn(assessment_id, features_dict)
+        except Exception as e:
+            logger.error(f"Deferred explanation failed for assessment {assessment_id}: {e}")
+            with self._lock:
+                self._failures[assessment_id] = str(e)
+                if len(self._failures) > self.MAX_TRACKED_FAILURES:
+                    self._failures.popitem(last=False)
+        finally:
+            with self._lock:
+                self._pending.discard(assessment_id)
+
+    def status(self, assessment_id: int) -> Optional[str]:
+        """
+        Returns 'pending' or 'failed' for jobs this process knows about,
+        or None if the assessment was never queued here.
+        """
+        with self._lock:
+            if assessment_id in self._pending:
+                return "pending"
+            if assessment_id in self._failures:
+                return "failed"
+        return None
+
+    def error(self, assessment_id: int) -> Optional[str]:
+        """Returns the error message of a failed job, if any."""
+        with self._lock:
+            return self._failures.get(assessment_id)
+
+    def shutdown(self, wait: bool = True):
+        """Stop accepting jobs and, by default, wait for the queued ones."""
+        self._executor.shutdown(wait=wait)
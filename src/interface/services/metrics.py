@@ -0,0 +1,187 @@
+# src/interface/services/metrics.py
+
+"""
+Prometheus metrics of the serving path.
+
+Stage timers wrap the expensive steps of a prediction (validation, the
+preprocessor, the model call, SHAP, database writes), a middleware counts
+and times every HTTP request by route, and counters that services already
+keep (prediction cache, shadow scorer) are read only when /metrics is
+scraped. Recording a stage costs a histogram observation (a few
+microseconds), so instrumentation stays on in production. In a request
+being profiled, stages are also spans of its timing tree (see `profiling`).
+Warm-up scores run inside `warm_up()` and are not recorded, so the metrics
+only describe real traffic.
+"""
+
+import time
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterable, Optional
+
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, Counter, Histogram, generate_latest
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+
+from . import profiling
+
+STAGES = ["validation", "score", "preprocess", "predict_proba", "shap", "db_write", "db_read"]
+
+# From 100µs to 10s: single-row scoring sits at the low end, bulk work at the high end
+BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+STAGE_SECONDS = Histogram(
+    "credit_stage_seconds", "Time spent in each stage of the serving path", ["stage"], buckets=BUCKETS
+)
+REQUEST_SECONDS = Histogram(
+    "credit_http_request_seconds", "HTTP request latency by route", ["method", "route"], buckets=BUCKETS
+)
+REQUESTS = Counter(
+    "credit_http_requests", "HTTP requests by route and status code", ["method", "route", "status"]
+)
+PREDICTIONS = Counter(
+    "credit_predictions", "Applicants scored, by code path", ["path"]
+)
+MOCK_PREDICTIONS = Counter(
+    "credit_mock_predictions", "Applicants given a mock prediction, by reason", ["reason"]
+)
+PREDICTION_ERRORS = Counter(
+    "credit_prediction_errors", "Applicants whose scoring raised an error, by code path", ["path"]
+)
+
+# Label children bound once, so recording skips the label lookup
+_stage_histograms = {stage: STAGE_SECONDS.labels(stage) for stage in STAGES}
+
+# perf_counter() at which the current HTTP request entered the application
+_request_started: ContextVar[Optional[float]] = ContextVar("request_started", default=None)
+# True while the current thread scores warm-up samples rather than requests
+_warming_up: ContextVar[bool] = ContextVar("warming_up", default=False)
+
+_NOT_RECORDED = nullcontext()
+
+
+class _StageTimer:
+    __slots__ = ("histogram", "name", "started", "span")
+
+    def __init__(self, histogram, name):
+        self.histogram = histogram
+        self.name = name
+
+    def __enter__(self):
+        self.span = profiling.start_span(self.name)
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.histogram.observe(time.perf_counter() - self.started)
+        if self.span is not None:
+            profiling.end_span(self.span)
+
+
+def stage(name: str):
+    """Context manager recording the duration of a stage."""
+    if _warming_up.get():
+        return _NOT_RECORDED
+    return _StageTimer(_stage_histograms[name], name)
+
+
+def count(counter: Counter, label: str, amount: float = 1):
+    """Increment the `label` series of `counter`, unless warm-up scores are running."""
+    if not _warming_up.get():
+        counter.labels(label).inc(amount)
+
+
+@contextmanager
+def warm_up():
+    """
+    Scores run in this block (in the calling thread) record no stages or
+    counters. Other threads, e.g. the micro-batcher's, do not see the flag,
+    so warm-up must score in the calling thread.
+    """
+    token = _warming_up.set(True)
+    try:
+        yield
+    finally:
+        _warming_up.reset(token)
+
+
+def observe_since_request_start(name: str):
+    """
+    Record the time from the start of the current HTTP request until now as
+    stage `name`. Called first thing in a handler, it measures how long body
+    parsing and pydantic validation took.
+    """
+    started = _request_started.get()
+    if started is not None:
+        elapsed = time.perf_counter() - started
+        _stage_histograms[name].observe(elapsed)
+        profiling.add_span(name, started, elapsed)
+
+
+def render():
+    """The /metrics payload and its content type."""
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware counting and timing HTTP requests. Requests are labelled
+    with the route template (e.g. /tracking/user/{user_id}), never the raw
+    path, so the number of series stays bounded.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        token = _request_started.set(started)
+        status = {"code": 500}
+
+        async def send_with_status(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            _request_started.reset(token)
+            route = scope.get("route")
+            route = getattr(route, "path", None) or "unmatched"
+            REQUEST_SECONDS.labels(scope["method"], route).observe(time.perf_counter() - started)
+            REQUESTS.labels(scope["method"], route, str(status["code"])).inc()
+
+
+class StatsCollector:
+    """
+    Exports the counters an object already maintains (e.g. `PredictionCache.stats()`)
+    at scrape time, so the hot path does no extra bookkeeping for them.
+    """
+
+    def __init__(self, prefix: str, documentation: str, stats_fn: Callable[[], Optional[Dict]],
+                 counters: Iterable[str] = (), gauges: Iterable[str] = ()):
+        self.prefix = prefix
+        self.documentation = documentation
+        self.stats_fn = stats_fn
+        self.counters = list(counters)
+        self.gauges = list(gauges)
+
+    def collect(self):
+        stats = self.stats_fn()
+        if stats is None:
+            return
+        for key in self.counters:
+            yield CounterMetricFamily(f"{self.prefix}_{key}", f"{self.documentation}: {key}", value=stats[key])
+        for key in self.gauges:
+            if stats[key] is not None:
+                yield GaugeMetricFamily(f"{self.prefix}_{key}", f"{self.documentation}: {key}", value=stats[key])
+
+
+def register_stats(prefix: str, documentation: str, stats_fn: Callable[[], Optional[Dict]],
+                   counters: Iterable[str] = (), gauges: Iterable[str] = ()):
+    """Expose the stats dictionary returned by `stats_fn` (None skips it) on /metrics."""
+    REGISTRY.register(StatsCollector(prefix, documentation, stats_fn, counters, gauges))
@@ -0,0 +1,98 @@
+# src/interface/services/micro_batcher.py
+
+"""
+Micro-batching scheduler for concurrent scoring requests.
+
+Tree boosters pay a high fixed cost per call, so instead of every request
+calling the model on its own one-row frame, requests arriving within a short
+window are grouped and scored with one vectorized call. Each caller blocks
+on a future and receives only its own row.
+"""
+
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Dict, List
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class MicroBatcher:
+    """
+    Collects submitted items for up to `max_wait_ms` after the first one
+    arrives, or until `max_batch_size` items are waiting, then hands the
+    group to `batch_fn(items, explain)` on a single scheduler thread.
+    Requests with and without explanations are scored as separate groups.
+    If a group fails, its requests are scored one by one, so only the
+    failing ones receive the exception.
+    """
+
+    def __init__(self, batch_fn: Callable[[List[Dict], bool], List[Dict]],
+                 max_batch_size: int = 64, max_wait_ms: float = 5.0):
+        self._batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._loop, name="micro-batcher", daemon=True)
+        self._thread.start()
+
+    def submit(self, features_dict: Dict, explain: bool = True) -> Future:
+        """Queue one record for scoring; the future resolves to its result dictionary."""
+        future = Future()
+        self._queue.put((features_dict, explain, future))
+        return future
+
+    def _loop(self):
+        while True:
+            first = self._queue.get()
+            if first is _STOP:
+                return
+
+            batch = [first]
+            stopping = False
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            for explain in (True, False):
+                group = [item for item in batch if item[1] == explain]
+                if group:
+                    self._run(group, explain)
+
+            if stopping:
+                return
+
+    def _run(self, group, explain: bool):
+        try:
+            results = self._batch_fn([features_dict for features_dict, _, _ in group], explain)
+        except Exception as e:
+            if len(group) == 1:
+                group[0][2].set_exception(e)
+                return
+            # One bad request must not fail the others it was grouped with
+            logger.warning(f"Micro-batch of {len(group)} failed, scoring its requests one by one: {e}")
+            for item in group:
+                self._run([item], explain)
+            return
+
+        for (_, _, future), result in zip(group, results):
+            future.set_result(result)
+
+    def shutdown(self):
+        """Score what is already queued, then stop the scheduler thread."""
+        self._queue.put(_STOP)
+        self._thread.join()
@@ -0,0 +1,166 @@
+# src/interface/services/model_registry.py
+
+"""
+Versioned model registry backed by the `model_metadata` table.
+
+Registering a trained model copies its artifact and the fitted preprocessor
+into `models/registry/<model_id>/`, where they are never overwritten, and
+records the version in `ModelMetadata`. Activating a version marks it as
+the one to serve. Running services poll the active version and swap the
+new model in without a restart (see `CreditRiskService.check_for_new_model`).
+
+Usage:
+    python -m src.interface.services.model_registry register models/lightgbm_model.joblib --activate
+    python -m src.interface.services.model_registry activate lightgbm-20250101.120000
+    python -m src.interface.services.model_registry list
+    python -m src.interface.services.model_registry compare --challenger 20250101.120000
+"""
+
+import argparse
+import json
+import shutil
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from ..database.connection import get_db_session, create_tables
+from ..database.crud import ModelCRUD, ShadowCRUD
+from src.utils import artifacts
+
+REGISTRY_DIR = artifacts.model_path("registry")
+MODEL_FILE = "model.joblib"
+PREPROCESSOR_FILE = "preprocessor.joblib"
+
+
+def artifact_paths(model_id: str) -> Dict[str, Path]:
+    """Where the registered model and preprocessor of `model_id` are stored."""
+    directory = REGISTRY_DIR / model_id
+    return {"model": directory / MODEL_FILE, "preprocessor": directory / PREPROCESSOR_FILE}
+
+
+def _to_dict(metadata) -> Dict:
+    return {
+        "model_id": metadata.model_id,
+        "model_name": metadata.model_name,
+        "model_version": metadata.model_version,
+        "model_type": metadata.model_type,
+        "performance_metrics": metadata.performance_metrics,
+        "is_active": metadata.is_active,
+        "deployed_at": metadata.deployed_at.isoformat() if metadata.deployed_at else None,
+        "created_at": metadata.created_at.isoformat() if metadata.created_at else None,
+        **{f"{name}_path": str(path) for name, path in artifact_paths(metadata.model_id).items()}
+    }
+
+
+def register_model(model_path: Path, preprocessor_path: Optional[Path] = None, model_name: str = "lightgbm",
+                   version: Optional[str] = None, performance_metrics: Optional[Dict] = None,
+                   activate: bool = False) -> Dict:
+    """
+    Copy a trained model and its preprocessor into the registry and record them.
+
+    Args:
+        model_path: Saved model wrapper (e.g. models/lightgbm_model.joblib)
+        preprocessor_path: Fitted preprocessor it was trained with (default models/preprocessor.joblib)
+        model_name: Name of the model family, used in the model ID
+        version: Version label; defaults to a UTC timestamp
+        performance_metrics: Evaluation results to keep with the version
+        activate: Serve this version right away
+
+    Returns:
+        The recorded metadata
+    """
+    preprocessor_path = preprocessor_path or artifacts.model_path("preprocessor.joblib")
+    version = version or datetime.utcnow().strftime("%Y%m%d.%H%M%S")
+    model_id = f"{model_name}-{version}"
+
+    paths = artifact_paths(model_id)
+    if paths["model"].parent.exists():
+        raise ValueError(f"Model {model_id} is already registered")
+
+    # Loaded once to check the artifact and record its type
+    model = artifacts.registry.get(model_path)
+
+    paths["model"].parent.mkdir(parents=True)
+    shutil.copy2(model_path, paths["model"])
+    shutil.copy2(preprocessor_path, paths["preprocessor"])
+
+    create_tables()
+    with get_db_session() as db:
+        metadata = ModelCRUD.create_model(db, {
+            "model_id": model_id,
+            "model_name": model_name,
+            "model_version": version,
+            "model_type": type(model).__name__,
+            "performance_metrics": performance_metrics
+        })
+        if activate:
+            ModelCRUD.activate_model(db, model_id)
+            db.refresh(metadata)
+        return _to_dict(metadata)
+
+
+def activate_model(model_id: str) -> Dict:
+    """Mark `model_id` as the version to serve; running services switch to it on their next poll."""
+    with get_db_session() as db:
+        if not ModelCRUD.activate_model(db, model_id):
+            raise ValueError(f"Model {model_id} is not registered")
+        return _to_dict(ModelCRUD.get_model(db, model_id))
+
+
+def get_model(model_id: str) -> Optional[Dict]:
+    """Metadata of a registered version, or None if `model_id` is unknown."""
+    with get_db_session() as db:
+        metadata = ModelCRUD.get_model(db, model_id)
+        return _to_dict(metadata) if metadata else None
+
+
+def get_active_model() -> Optional[Dict]:
+    """Metadata of the active version, or None when no registered model is active."""
+    with get_db_session() as db:
+        metadata = ModelCRUD.get_active_model(db)
+        return _to_dict(metadata) if metadata else None
+
+
+def list_models() -> List[Dict]:
+    """Metadata of every registered version, newest first."""
+    with get_db_session() as db:
+        return [_to_dict(metadata) for metadata in ModelCRUD.list_models(db)]
+
+
+def shadow_summary(challenger_version: Optional[str] = None) -> Dict:
+    """How closely a challenger's shadow scores (see `serving.shadow`) agree with the served model."""
+    with get_db_session() as db:
+        return ShadowCRUD.get_shadow_summary(db, challenger_version)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Manage the versioned model registry.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    register = commands.add_parser("register", help="record a trained model artifact")
+    register.add_argument("model_path", type=Path)
+    register.add_argument("--preprocessor", type=Path, default=None, help="default: models/preprocessor.joblib")
+    register.add_argument("--name", default="lightgbm", help="model family used in the model ID")
+    register.add_argument("--version", default=None, help="version label (default: UTC timestamp)")
+    register.add_argument("--metrics", type=json.loads, default=None, help="performance metrics as JSON")
+    register.add_argument("--activate", action="store_true", help="serve this version right away")
+
+    activate = commands.add_parser("activate", help="serve a registered version")
+    activate.add_argument("model_id")
+
+    commands.add_parser("list", help="show registered versions")
+
+    compare = commands.add_parser("compare", help="summarize shadow scores of a challenger")
+    compare.add_argument("--challenger", default=None, help="challenger model_version (default: all)")
+    args = parser.parse_args()
+
+    if args.command == "register":
+        result = register_model(args.model_path, args.preprocessor, args.name, args.version,
+                                args.metrics, activate=args.activate)
+    elif args.command == "activate":
+        result = activate_model(args.model_id)
+    elif args.command == "compare":
+        result = shadow_summary(args.challenger)
+    else:
+        result = list_models()
+    print(json.dumps(result, indent=2))
@@ -0,0 +1,113 @@
+# src/interface/services/prediction_cache.py
+
+"""
+Bounded LRU cache of prediction results.
+
+The tracking UI and API clients often rescore feature sets that were already
+scored: updates that change nothing, retries and duplicate submissions. The
+cache keys a result by a hash of the normalized feature vector, the explain
+flag and the version of the model artifacts, so a retrained model never
+serves stale results.
+"""
+
+import hashlib
+import json
+import math
+import threading
+import time
+from collections import OrderedDict
+from decimal import Decimal
+from typing import Dict, Optional
+
+
+class PredictionCache:
+    """
+    Thread-safe LRU cache with an optional time-to-live per entry.
+    Counts hits, misses, evictions (entries pushed out by the size bound)
+    and expirations (entries dropped because they outlived the TTL).
+    """
+
+    def __init__(self, max_size: int = 10000, ttl_seconds: Optional[float] = None):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @staticmethod
+    def make_key(features_dict: Dict, explain: bool, model_version: str) -> str:
+        """
+        Hash of the canonical form of a request: feature names uppercased as the
+        model sees them, missing values dropped (they score like absent fields),
+        numbers as floats, items sorted by name.
+        """
+        canonical = []
+        for key, value in features_dict.items():
+            if value is None or value != value:
+                continue
+            if isinstance(value, (bool, int, float, Decimal)):
+                value = float(value)
+                if math.isinf(value):
+                    value = repr(value)
+            canonical.append((key.upper(), value))
+        canonical.sort()
+
+        payload = json.dumps([model_version, bool(explain), canonical], separators=(',', ':'))
+        return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+    @staticmethod
+    def _copy(result: Dict) -> Dict:
+        # Callers own what they get back, so they can't alter the cached entry
+        copied = dict(result)
+        if copied.get('feature_impacts') is not None:
+            copied['feature_impacts'] = dict(copied['feature_impacts'])
+        return copied
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Returns a copy of the cached result, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl_seconds is not None and time.monotonic() - entry[0] > self.ttl_seconds:
+                del self._entries[key]
+                self.expirations += 1
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._copy(entry[1])
+
+    def put(self, key: str, result: Dict):
+        """Stores a copy of `result`, evicting the least recently used entries if full."""
+        with self._lock:
+            self._entries[key] = (time.monotonic(), self._copy(result))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """Drops every entry (the counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict:
+        """Current size and counters."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "hit_rate": self.hits / lookups if lookups else 0.0
+            }
@@ -0,0 +1,216 @@
+# src/interface/services/profiling.py
+
+"""
+On-demand profiling of a single request.
+
+An admin sends a request with the header `X-Profile: 1` (or the query
+parameter `?profile=1`) and `X-Admin-Token` set to the ADMIN_TOKEN
+environment variable. That request alone is traced: every metrics stage,
+every preprocessing step and every SQL statement becomes a node of a timing
+tree. The response carries `X-Profile-Id` and a `Server-Timing` summary, and
+the full tree is kept in memory for GET /health/profiles/{profile_id}.
+
+Requests without the header are not traced; a span outside a traced request
+is a single context variable lookup.
+"""
+
+import hmac
+import itertools
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from typing import Dict, Optional
+
+PROFILE_HEADER = b"x-profile"
+TOKEN_HEADER = b"x-admin-token"
+MAX_STORED_TRACES = 100
+
+# Trace of the current request, and the span new spans are nested under
+_trace: ContextVar[Optional["Trace"]] = ContextVar("profile_trace", default=None)
+_parent: ContextVar[Optional["Span"]] = ContextVar("profile_span", default=None)
+
+_NOT_PROFILING = nullcontext()
+_ids = itertools.count(1)
+_traces = OrderedDict()
+_lock = threading.Lock()
+_sql_hooks_installed = False
+
+
+class Span:
+    __slots__ = ("name", "attributes", "started", "duration", "children", "token")
+
+    def __init__(self, name: str, attributes: Dict):
+        self.name = name
+        self.attributes = attributes
+        self.started = time.perf_counter()
+        self.duration = None
+        self.children = []
+        self.token = None
+
+    def to_dict(self, origin: float) -> Dict:
+        node = {
+            "name": self.name,
+            "start_ms": round((self.started - origin) * 1000, 3),
+            "duration_ms": round(self.duration * 1000, 3) if self.duration is not None else None
+        }
+        if self.attributes:
+            node["attributes"] = self.attributes
+        if self.children:
+            node["children"] = [child.to_dict(origin) for child in self.children]
+        return node
+
+
+class Trace:
+    """Timing tree of one request."""
+
+    def __init__(self, name: str):
+        self.profile_id = f"{os.getpid()}-{next(_ids)}"
+        self.root = Span(name, {})
+
+    def to_dict(self) -> Dict:
+        return {"profile_id": self.profile_id, **self.root.to_dict(self.root.started)}
+
+    def server_timing(self) -> str:
+        """Total time per span name directly under the root, in Server-Timing format."""
+        totals = {}
+        for child in self.root.children:
+            totals[child.name] = totals.get(child.name, 0.0) + (child.duration or 0.0)
+        entries = [f"{name.replace(' ', '_')};dur={seconds * 1000:.3f}" for name, seconds in totals.items()]
+        entries.append(f"total;dur={self.root.duration * 1000:.3f}")
+        return ", ".join(entries)
+
+
+def start_span(name: str, **attributes) -> Optional[Span]:
+    """Open a span under the current one; returns None (and does nothing) outside a traced request."""
+    trace = _trace.get()
+    if trace is None:
+        return None
+    span = Span(name, attributes)
+    (_parent.get() or trace.root).children.append(span)
+    span.token = _parent.set(span)
+    return span
+
+
+def end_span(span: Span):
+    span.duration = time.perf_counter() - span.started
+    _parent.reset(span.token)
+
+
+def add_span(name: str, started: float, duration: float):
+    """Record an already finished span (e.g. request validation, timed before the handler ran)."""
+    trace = _trace.get()
+    if trace is None:
+        return
+    span = Span(name, {})
+    span.started = started
+    span.duration = duration
+    (_parent.get() or trace.root).children.append(span)
+
+
+@contextmanager
+def _span(name: str, attributes: Dict):
+    span = start_span(name, **attributes)
+    try:
+        yield span
+    finally:
+        end_span(span)
+
+
+def span(name: str, **attributes):
+    """Context manager tracing a block when the current request is profiled."""
+    if _trace.get() is None:
+        return _NOT_PROFILING
+    return _span(name, attributes)
+
+
+def is_admin(token: Optional[str]) -> bool:
+    """Whether `token` matches ADMIN_TOKEN; always False when ADMIN_TOKEN is not set."""
+    admin_token = os.getenv("ADMIN_TOKEN")
+    if not admin_token or not token:
+        return False
+    return hmac.compare_digest(token.encode(), admin_token.encode())
+
+
+def get_trace(profile_id: str) -> Optional[Dict]:
+    """A stored timing tree, or None if unknown or already evicted."""
+    with _lock:
+        return _traces.get(profile_id)
+
+
+def _store(trace: Trace):
+    with _lock:
+        _traces[trace.profile_id] = trace.to_dict()
+        while len(_traces) > MAX_STORED_TRACES:
+            _traces.popitem(last=False)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    # Installed for the whole process once anything is profiled, so the
+    # statement is only formatted for a traced request
+    if _trace.get() is None:
+        return
+    context._profile_span = start_span("sql", statement=" ".join(statement.split())[:500])
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    span = getattr(context, "_profile_span", None)
+    if span is not None:
+        end_span(span)
+
+
+def _install_sql_hooks():
+    """Trace SQL statements; installed on the first profiled request only."""
+    global _sql_hooks_installed
+    with _lock:
+        if _sql_hooks_installed:
+            return
+        from sqlalchemy import event
+        from sqlalchemy.engine import Engine
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+        _sql_hooks_installed = True
+
+
+def _profiling_requested(scope) -> bool:
+    headers = dict(scope["headers"])
+    if headers.get(PROFILE_HEADER, b"") not in (b"1", b"true"):
+        query = scope.get("query_string", b"")
+        if b"profile=1" not in query.split(b"&"):
+            return False
+    return is_admin(headers.get(TOKEN_HEADER, b"").decode(errors="ignore"))
+
+
+class ProfilingMiddleware:
+    """ASGI middleware tracing the requests an admin asks to profile."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not _profiling_requested(scope):
+            await self.app(scope, receive, send)
+            return
+
+        _install_sql_hooks()
+        trace = Trace(f"{scope['method']} {scope['path']}")
+        trace_token = _trace.set(trace)
+
+        async def send_with_profile(message):
+            if message["type"] == "http.response.start":
+                # The handler is done by now; later spans (e.g. streaming) are not included
+                trace.root.duration = time.perf_counter() - trace.root.started
+                _store(trace)
+                message = dict(message)
+                message["headers"] = list(message.get("headers", [])) + [
+                    (b"x-profile-id", trace.profile_id.encode()),
+                    (b"server-timing", trace.server_timing().encode()),
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_profile)
+        finally:
+            _trace.reset(trace_token)
@@ -0,0 +1,187 @@
+# src/interface/services/rescoring.py
+
+"""
+Periodic rescoring of the active portfolio.
+
+Current feature rows of active users are streamed in keyset-paginated chunks
+(feature_id order), scored in parallel by a pool of scoring processes and
+stored as `periodic` assessments with one bulk insert and one commit per
+chunk. After every commit the last feature_id is written to a checkpoint
+file, so an interrupted run resumes where it stopped. Users whose latest
+assessment already scored the same feature row with the same model artifact
+(model version and file fingerprints, so a model retrained in place counts
+as new) are skipped.
+
+Usage:
+    python -m src.interface.services.rescoring --workers 4 --chunk-size 2000
+"""
+
+import argparse
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Dict, Optional
+
+from ..database.connection import get_db_session
+from ..database.crud import BulkCRUD
+from . import credit_service
+from .credit_service import CreditRiskService
+from .scoring_pool import ScoringPool
+
+DEFAULT_CHECKPOINT = Path("rescoring_checkpoint.json")
+
+
+def _load_checkpoint(path: Path, artifact_version: str) -> Optional[Dict]:
+    """The checkpoint of an unfinished run with the same model artifact, if any."""
+    if not path.exists():
+        return None
+    with open(path, "r") as file:
+        checkpoint = json.load(file)
+    if checkpoint.get("completed") or checkpoint.get("artifact_version") != artifact_version:
+        return None
+    return checkpoint
+
+
+def _save_checkpoint(path: Path, checkpoint: Dict):
+    # Written next to the target and renamed, so a crash never leaves half a file
+    temporary = path.with_suffix(path.suffix + ".tmp")
+    with open(temporary, "w") as file:
+        json.dump(checkpoint, file, indent=2)
+    os.replace(temporary, path)
+
+
+def _read_chunk(after_feature_id: int, chunk_size: int, artifact_version: str):
+    """
+    Read the next page of current features and keep the users that need a new score.
+
+    Returns:
+        The last feature_id of the page (None once the portfolio is exhausted),
+        the number of users skipped, and (user_ids, feature_ids, features) of
+        the users to score
+    """
+    with get_db_session() as db:
+        page = BulkCRUD.get_current_features_page(db, after_feature_id, chunk_size)
+        if not page:
+            return None, 0, ([], [], [])
+
+        latest = BulkCRUD.get_latest_assessments(db, [row.user_id for row in page])
+        user_ids, feature_ids, features = [], [], []
+        for row in page:
+            if latest.get(row.user_id) == (row.feature_id, artifact_version):
+                continue
+            user_ids.append(row.user_id)
+            feature_ids.append(row.feature_id)
+            features.append(CreditRiskService._features_to_dict(row))
+
+        return page[-1].feature_id, len(page) - len(user_ids), (user_ids, feature_ids, features)
+
+
+def rescore_portfolio(workers: int = 0, chunk_size: int = 1000, explain: bool = False,
+                      checkpoint_path: Path = DEFAULT_CHECKPOINT, resume: bool = True) -> Dict:
+    """
+    Store a `periodic` assessment for every active user whose current
+    features or model artifact changed since their latest assessment.
+
+    Args:
+        workers: Scoring processes (0 scores in this process)
+        chunk_size: Users read, scored and committed together
+        explain: Store SHAP explanations (False leaves them to be computed on demand)
+        checkpoint_path: JSON file recording the progress of the run
+        resume: Continue an unfinished run with the same model artifact from its checkpoint
+
+    Returns:
+        The final checkpoint: counts of users scored and skipped, last feature_id and timings
+    """
+    service = credit_service.get_service()
+    if not service.is_initialized:
+        raise ValueError("No model is loaded; refusing to store mock predictions as periodic assessments")
+    model_version = service.model_version
+    artifact_version = service.artifact_version
+    checkpoint_path = Path(checkpoint_path)
+
+    checkpoint = _load_checkpoint(checkpoint_path, artifact_version) if resume else None
+    if checkpoint is not None:
+        print(f"Resuming rescoring after feature_id {checkpoint['last_feature_id']}")
+    else:
+        checkpoint = {
+            "model_version": model_version,
+            "artifact_version": artifact_version,
+            "started_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "last_feature_id": 0,
+            "scored": 0,
+            "skipped": 0,
+            "completed": False
+        }
+    print(f"Rescoring portfolio with model {model_version} ({workers or 'no'} worker processes, chunks of {chunk_size})")
+
+    # Workers score with the artifacts this process resolved, i.e. the recorded artifact_version
+    pool = ScoringPool(workers, service.artifacts) if workers > 0 else None
+    # Chunks read and queued for scoring, committed strictly in order
+    pending = deque()
+    started = time.perf_counter()
+
+    def commit_oldest():
+        last_feature_id, skipped, (user_ids, feature_ids, _), predictions = pending.popleft()
+        if isinstance(predictions, Future):
+            predictions = predictions.result()
+        with get_db_session() as db:
+            BulkCRUD.create_assessments(db, user_ids, feature_ids, predictions, "periodic")
+
+        checkpoint["last_feature_id"] = last_feature_id
+        checkpoint["scored"] += len(user_ids)
+        checkpoint["skipped"] += skipped
+        _save_checkpoint(checkpoint_path, checkpoint)
+
+        elapsed = time.perf_counter() - started
+        print(f"Up to feature_id {last_feature_id}: {checkpoint['scored']} scored, "
+              f"{checkpoint['skipped']} skipped ({checkpoint['scored'] / elapsed:.0f} users/s)")
+
+    try:
+        after_feature_id = checkpoint["last_feature_id"]
+        while True:
+            last_feature_id, skipped, chunk = _read_chunk(after_feature_id, chunk_size, artifact_version)
+            if last_feature_id is None:
+                break
+            after_feature_id = last_feature_id
+
+            features = chunk[2]
+            if not features:
+                predictions = []
+            elif pool is not None:
+                predictions = pool.submit_batch(features, explain)
+            else:
+                predictions = service.predict_batch_with_explanation(features, explain)
+            pending.append((last_feature_id, skipped, chunk, predictions))
+
+            # Keep every worker busy while bounding how much is held in memory
+            while len(pending) > max(workers, 1) * 2 - 1:
+                commit_oldest()
+
+        while pending:
+            commit_oldest()
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=False)
+
+    checkpoint["completed"] = True
+    checkpoint["seconds"] = time.perf_counter() - started
+    _save_checkpoint(checkpoint_path, checkpoint)
+    print(f"Rescoring complete: {checkpoint['scored']} scored, {checkpoint['skipped']} skipped "
+          f"in {checkpoint['seconds']:.1f}s")
+    return checkpoint
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rescore the active portfolio as periodic assessments.")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="scoring processes (0 scores in-process)")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="users per read, score and commit")
+    parser.add_argument("--explain", action="store_true", help="store SHAP explanations (default: on demand)")
+    parser.add_argument("--checkpoint", type=Path, default=DEFAULT_CHECKPOINT, help="progress file of the run")
+    parser.add_argument("--restart", action="store_true", help="ignore the checkpoint of an unfinished run")
+    args = parser.parse_args()
+
+    rescore_portfolio(args.workers, args.chunk_size, explain=args.explain,
+                      checkpoint_path=args.checkpoint, resume=not args.restart)
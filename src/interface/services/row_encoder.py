@@ -0,0 +1,120 @@
+# src/interface/services/row_encoder.py
+
+"""
+Single-record encoder for the scoring fast path.
+
+Maps one request dictionary straight into a NumPy row laid out like the
+model's training matrix, reproducing what
+`CreditRiskService._apply_preprocessor` does for a one-row DataFrame:
+missing numerical values become 0 before scaling, missing categories become
+"Missing", and model features that are not produced stay at 0.
+"""
+
+import threading
+from typing import Dict, List
+import numpy as np
+from sklearn.preprocessing import StandardScaler, MinMaxScaler
+
+
+class RowEncoder:
+    """
+    Precomputes, for every request field, where its value lands in the model
+    row and how it is scaled. Encoding a record then only copies a template
+    row into a per-thread buffer and overwrites the fields that were sent.
+    """
+
+    def __init__(self, preprocessor: Dict, feature_names: List[str]):
+        self.feature_names = list(feature_names)
+        self.n_features = len(self.feature_names)
+        feature_index = {name: idx for idx, name in enumerate(self.feature_names)}
+
+        numerical_cols = preprocessor.get('numerical_cols', [])
+        categorical_cols = preprocessor.get('categorical_cols', [])
+        encoder = preprocessor.get('encoder')
+        scaler = preprocessor.get('scaler')
+
+        # Scaling as an affine map: scaled = value * factor + offset
+        if scaler is None:
+            factors = np.ones(len(numerical_cols))
+            offsets = np.zeros(len(numerical_cols))
+        elif isinstance(scaler, StandardScaler):
+            mean = scaler.mean_ if scaler.mean_ is not None else np.zeros(len(numerical_cols))
+            scale = scaler.scale_ if scaler.scale_ is not None else np.ones(len(numerical_cols))
+            factors = 1.0 / scale
+            offsets = -mean / scale
+        elif isinstance(scaler, MinMaxScaler):
+            factors = scaler.scale_
+            offsets = scaler.min_
+        else:
+            raise ValueError(f"Scaler '{scaler.__class__.__name__}' is not supported by the fast path.")
+
+        # Template row: what an empty request encodes to
+        self._template = np.zeros((1, self.n_features), dtype=np.float64)
+
+        # UPPERCASE field name -> (row position, factor, offset)
+        self._numerical = {}
+        for col, factor, offset in zip(numerical_cols, factors, offsets):
+            if col in feature_index:
+                position = feature_index[col]
+                self._numerical[col] = (position, float(factor), float(offset))
+                self._template[0, position] = offset  # a missing value is filled with 0, then scaled
+
+        # UPPERCASE field name -> ({category: row position}, position of "Missing")
+        self._categorical = {}
+        if encoder is not None and categorical_cols:
+            encoded_names = encoder.get_feature_names_out(categorical_cols)
+            name_idx = 0
+            for col, categories in zip(categorical_cols, encoder.categories_):
+                lookup = {}
+                for category in categories:
+                    encoded_name = encoded_names[name_idx]
+                    name_idx += 1
+                    if encoded_name in feature_index:
+                        lookup[category] = feature_index[encoded_name]
+                missing_position = lookup.get("Missing")
+                if missing_position is not None:
+                    self._template[0, missing_position] = 1.0
+                self._categorical[col] = (lookup, missing_position)
+
+        self._local = threading.local()
+
+    def _buffer(self) -> np.ndarray:
+        """Per-thread preallocated row, so concurrent requests never share it."""
+        buffer = getattr(self._local, 'buffer', None)
+        if buffer is None:
+            buffer = np.empty((1, self.n_features), dtype=np.float64)
+            self._local.buffer = buffer
+        return buffer
+
+    def encode(self, features_dict: Dict) -> np.ndarray:
+        """
+        Encode one request dictionary (database or model column names) into
+        the reusable row buffer of the calling thread.
+
+        The returned array is overwritten by the next call on the same thread,
+        so it must be consumed before encoding another record.
+        """
+        row = self._buffer()
+        np.copyto(row, self._template)
+
+        for key, value in features_dict.items():
+            if value is None or value != value:  # None or NaN: keep the template value
+                continue
+            name = key.upper()
+
+            numerical = self._numerical.get(name)
+            if numerical is not None:
+                position, factor, offset = numerical
+                row[0, position] = float(value) * factor + offset
+                continue
+
+            categorical = self._categorical.get(name)
+            if categorical is not None:
+                lookup, missing_position = categorical
+                if missing_position is not None:
+                    row[0, missing_position] = 0.0
+                position = lookup.get(value)
+                if position is not None:
+                    row[0, position] = 1.0
+
+        return row
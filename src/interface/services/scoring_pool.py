@@ -0,0 +1,87 @@
+# src/interface/services/scoring_pool.py
+
+"""
+Dedicated worker processes for CPU-bound scoring.
+
+The model, preprocessor and explainer are loaded once in every worker, so a
+request only ships its feature dictionary over and gets the result
+dictionary back. Scoring then runs on as many cores as there are workers
+instead of competing for the API process's GIL with request parsing and
+database I/O.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Service instance of the current worker process, built by `_init_worker`
+_worker_service = None
+
+
+def _init_worker(artifacts: Tuple[Path, Path, str]):
+    """Load the ML artifacts once per worker process."""
+    global _worker_service
+    from .credit_service import CreditRiskService
+    _worker_service = CreditRiskService(worker_process=True, artifacts=artifacts)
+
+
+def _score(features_dict: Dict, explain: bool) -> Dict:
+    return _worker_service._predict_direct(features_dict, explain)
+
+
+def _score_batch(features_list: List[Dict], explain: bool) -> List[Dict]:
+    return _worker_service.predict_batch_with_explanation(features_list, explain)
+
+
+class ScoringPool:
+    """
+    Pool of long-lived scoring processes. Handlers await `score` or
+    `score_batch`, which leave the event loop free while a worker computes.
+
+    Workers serve the `artifacts` (model path, preprocessor path, model
+    version) resolved by the parent process: they never consult the model
+    registry or swap models, the parent replaces the pool instead.
+    """
+
+    def __init__(self, workers: int, artifacts: Tuple[Path, Path, str]):
+        self.workers = workers
+        # Spawned rather than forked: the API process already runs threads
+        self._executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(artifacts,)
+        )
+        logger.info(f"Scoring pool started with {workers} worker processes")
+
+    async def score(self, features_dict: Dict, explain: bool = True) -> Dict:
+        """Score one applicant in a worker process."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, _score, features_dict, explain)
+
+    async def score_batch(self, features_list: List[Dict], explain: bool = True) -> List[Dict]:
+        """Score many applicants with one vectorized call in a worker process."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, _score_batch, features_list, explain)
+
+    def submit_batch(self, features_list: List[Dict], explain: bool = True) -> Future:
+        """Queue a vectorized batch score from synchronous code, e.g. a batch job."""
+        return self._executor.submit(_score_batch, features_list, explain)
+
+    def warm_up(self, sample: Dict):
+        """
+        Start every worker and score `sample` once in each. The jobs are all
+        queued before any can finish, so each one starts its own process.
+        """
+        futures = [self._executor.submit(_score, sample, True) for _ in range(self.workers)]
+        for future in futures:
+            future.result()
+
+    def shutdown(self, wait: bool = True):
+        """Stop the worker processes, by default after the queued jobs."""
+        self._executor.shutdown(wait=wait)
@@ -0,0 +1,103 @@
+# src/interface/services/shadow_scorer.py
+
+"""
+Champion/challenger shadow scoring.
+
+Requests scored by the served (champion) model are handed to a background
+thread together with their result. The thread collects them for up to
+`flush_seconds`, scores each batch with one vectorized call of the challenger
+model and stores both scores for offline comparison with one insert. Handing a request over is a non-blocking
+queue put; when the queue is full the request is simply not shadowed, so a
+slow challenger can never hold up the caller.
+"""
+
+import logging
+import queue
+import threading
+import time
+from typing import Callable, Dict, List
+
+logger = logging.getLogger(__name__)
+
+
+class ShadowScorer:
+    """
+    Background worker feeding live requests to `score_batch(features_list,
+    champion_results)`, which scores them with the challenger and stores the
+    comparison.
+    """
+
+    def __init__(self, score_batch: Callable[[List[Dict], List[Dict]], None],
+                 max_queue: int = 10000, batch_size: int = 256, flush_seconds: float = 1.0):
+        self._score_batch = score_batch
+        self._batch_size = batch_size
+        self._flush_seconds = flush_seconds
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._lock = threading.Lock()
+        self._stopping = threading.Event()
+        self.submitted = 0
+        self.scored = 0
+        self.dropped = 0
+        self.failed = 0
+        self._thread = threading.Thread(target=self._run, daemon=True, name="shadow-scorer")
+        self._thread.start()
+
+    def submit(self, features_list: List[Dict], champion_results: List[Dict]):
+        """Queue requests and their served results; never blocks."""
+        for features_dict, result in zip(features_list, champion_results):
+            try:
+                self._queue.put_nowait((features_dict, result))
+                submitted, dropped = 1, 0
+            except queue.Full:
+                submitted, dropped = 0, 1
+            with self._lock:
+                self.submitted += submitted
+                self.dropped += dropped
+
+    def _run(self):
+        while True:
+            try:
+                item = self._queue.get(timeout=0.2)
+            except queue.Empty:
+                if self._stopping.is_set():
+                    return
+                continue
+
+            # Requests arriving within flush_seconds share one challenger call,
+            # which keeps the shadow thread's share of the CPU small
+            batch = [item]
+            deadline = time.monotonic() + self._flush_seconds
+            while len(batch) < self._batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or self._stopping.is_set():
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            try:
+                self._score_batch([features for features, _ in batch], [result for _, result in batch])
+                with self._lock:
+                    self.scored += len(batch)
+            except Exception as e:
+                logger.warning(f"Shadow scoring of {len(batch)} requests failed: {e}")
+                with self._lock:
+                    self.failed += len(batch)
+
+    def stats(self) -> Dict:
+        """Counters of requests shadowed, dropped (queue full) and failed."""
+        with self._lock:
+            return {
+                "queued": self._queue.qsize(),
+                "submitted": self.submitted,
+                "scored": self.scored,
+                "dropped": self.dropped,
+                "failed": self.failed
+            }
+
+    def shutdown(self, wait: bool = False):
+        """Stop after the requests already queued."""
+        self._stopping.set()
+        if wait:
+            self._thread.join()
@@ -134,6 +134,8 @@ document.addEventListener('DOMContentLoaded', function () {
 
         const positiveImpacts = Object.entries(data.latest_assessment.feature_impacts || {}).filter(([_, val]) => val > 0).slice(0, 5);
         const negativeImpacts = Object.entries(data.latest_assessment.feature_impacts || {}).filter(([_, val]) => val < 0).slice(0, 5);
+        const explanationPending = data.latest_assessment.explanation_status === 'pending';
+        const noImpacts = explanationPending ? '<li>Computing explanation...</li>' : '<li>None</li>';
 
         contentEl.innerHTML = `
             <div class="grid grid-cols-1 md:grid-cols-3 gap-6">
@@ -155,11 +157,11 @@ document.addEventListener('DOMContentLoaded', function () {
                 <div class="grid grid-cols-1 md:grid-cols-2 gap-6 mt-4">
                     <div>
                         <h5 class="font-medium text-red-600 mb-2">Factors Increasing Risk ↑</h5>
-                        <ul class="space-y-1 text-sm text-gray-700">${positiveImpacts.map(([key, val]) => `<li>${key}: <span class="font-semibold">${val.toFixed(3)}</span></li>`).join('') || '<li>None</li>'}</ul>
+                        <ul class="space-y-1 text-sm text-gray-700">${positiveImpacts.map(([key, val]) => `<li>${key}: <span class="font-semibold">${val.toFixed(3)}</span></li>`).join('') || noImpacts}</ul>
                     </div>
                      <div>
                         <h5 class="font-medium text-green-600 mb-2">Factors Decreasing Risk ↓</h5>
-                        <ul class="space-y-1 text-sm text-gray-700">${negativeImpacts.map(([key, val]) => `<li>${key}: <span class="font-semibold">${val.toFixed(3)}</span></li>`).join('') || '<li>None</li>'}</ul>
+                        <ul class="space-y-1 text-sm text-gray-700">${negativeImpacts.map(([key, val]) => `<li>${key}: <span class="font-semibold">${val.toFixed(3)}</span></li>`).join('') || noImpacts}</ul>
                     </div>
                 </div>
             </div>
@@ -182,6 +184,34 @@ document.addEventListener('DOMContentLoaded', function () {
             },
             options: { scales: { y: { beginAtZero: true, max: 100, ticks: { callback: value => value + '%' } } } }
         });
+
+        if (explanationPending) loadDeferredExplanation(data);
+    }
+
+    // --- LAZY EXPLANATIONS ---
+    // Assessments stored in deferred mode get their feature impacts in the background.
+    // Poll until they are ready, then re-render the details with them.
+    async function loadDeferredExplanation(data, attempt = 0) {
+        const assessment = data.latest_assessment;
+        if (attempt >= 30) return;
+        try {
+            const response = await fetch(`/predict/explanations/${assessment.assessment_id}`);
+            if (!response.ok) return;
+            const explanation = await response.json();
+            if (currentUserId !== data.user_info.id) return; // modal now shows another user
+
+            if (explanation.status === 'ready') {
+                assessment.feature_impacts = Object.fromEntries(
+                    Object.entries(explanation.feature_impacts || {}).sort(([, a], [, b]) => Math.abs(b) - Math.abs(a))
+                );
+                assessment.explanation_status = 'ready';
+                renderUserDetails(data);
+            } else if (explanation.status === 'pending') {
+                window.setTimeout(() => loadDeferredExplanation(data, attempt + 1), 1000);
+            }
+        } catch (error) {
+            console.error("Error loading explanation:", error);
+        }
     }
 
     window.closeUserModal = () => userModal.classList.add('hidden');
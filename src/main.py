@@ -1,3 +1,4 @@
+from contextlib import nullcontext
 from pathlib import Path
 
 from src.data_processing import download_data, merge, fabricate, preprocess, split, feature_engineer
@@ -5,42 +6,65 @@ from src.model import model, train, test
 from src.utils import get_config, read_file
 
 
-def generate_pipeline():
-    config = get_config.read_yaml_from_main()
-
-    print("Successfully read metadata!")
-
-    print("Do you want to reprocess the data? [y/n]")
-    choice = input().lower()
+def process_data(download=True, stage=None):
+    """
+    Runs the data stages of the pipeline: download, merge, fabricate,
+    engineer, split and clean.
 
-    if choice == "y":
+    Args:
+        download (bool): Download the Kaggle data first.
+        stage (callable, optional): `stage(name)` returns a context manager
+            wrapped around each stage, e.g. to time it.
+    """
+    stage = stage or (lambda name: nullcontext())
 
-        download_data.download_and_unzip_kaggle_dataset()
+    if download:
+        with stage("download"):
+            download_data.download_and_unzip_kaggle_dataset()
 
         print("Data downloading successful!")
 
+    with stage("merge_data"):
         merged_df = merge.merge_data()
 
-        print("Data merging successful!")
+    print("Data merging successful!")
 
+    with stage("fabricate_features"):
         fabricated_merged_df = fabricate.fabricate_features(merged_df)
 
-        print("Fabrication successful!")
+    print("Fabrication successful!")
 
+    with stage("engineer_features"):
         engineered_df = feature_engineer.engineer_features(fabricated_merged_df)
-        print("Feature engineering successful!")
-        # ---------------------
+    print("Feature engineering successful!")
+    # ---------------------
 
-        # Pass the engineered dataframe to the split function
+    # Pass the engineered dataframe to the split function
+    with stage("split_data"):
         train_df, val_df, test_df = split.split_data(engineered_df)
-        print("Splitting successful!")
-
+    print("Splitting successful!")
 
+    with stage("clean_train"):
         train_df = preprocess.clean(train_df, name="clean_train_data.csv")
+    with stage("clean_val"):
         val_df = preprocess.clean(val_df, name="clean_val_data.csv", use_saved=True)
+    with stage("clean_test"):
         test_df = preprocess.clean(test_df, name="clean_test_data.csv", use_saved=True)
 
-        print("Cleaning successful!")
+    print("Cleaning successful!")
+    return train_df, val_df, test_df
+
+
+def generate_pipeline():
+    config = get_config.read_yaml_from_main()
+
+    print("Successfully read metadata!")
+
+    print("Do you want to reprocess the data? [y/n]")
+    choice = input().lower()
+
+    if choice == "y":
+        process_data()
 
     print("Do you want to retrain the model? [y/n]")
     choice = input().lower()
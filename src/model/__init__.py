@@ -1,11 +1,30 @@
 """
 Model package for training and prediction.
+
+The exports below are resolved on first access, so importing one submodule
+(e.g. `src.model.explain` from the API) does not pull in the training code
+and every ML framework with it.
 """
 
-from .train import train_model
-from .predict import make_prediction
-from .model import LightGBMModel, XGBoostModel, CatBoostModel, LogisticRegressionModel # If you have a model class
-from .test import test_model
+import importlib
+
+# exported name -> submodule defining it
+_exports = {
+    "train_model": ".train",
+    "make_prediction": ".predict",
+    "LightGBMModel": ".model",
+    "XGBoostModel": ".model",
+    "CatBoostModel": ".model",
+    "LogisticRegressionModel": ".model",
+    "test_model": ".test",
+}
+
+
+def __getattr__(name):
+    if name in _exports:
+        return getattr(importlib.import_module(_exports[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "train_model",
@@ -14,4 +33,4 @@ __all__ = [
     "XGBoostModel",
     "CatBoostModel",
     "LogisticRegressionModel"
-]
\ No newline at end of file
+]
@@ -0,0 +1,92 @@
+import importlib
+import sys
+import threading
+import time
+
+# Heavy frameworks, imported only when a wrapper needing them is built or unpickled
+BACKENDS = {
+    'lightgbm': 'lightgbm',
+    'xgboost': 'xgboost',
+    'catboost': 'catboost',
+    'tabnet': 'pytorch_tabnet.tab_model',   # pulls in torch
+    'torch': 'torch',
+    'shap': 'shap',
+    'optuna': 'optuna',
+}
+
+# backend name -> seconds its first import took, in import order
+_import_times = {}
+_lock = threading.Lock()
+
+
+def import_backend(name):
+    """
+    Imports the module of a registered backend on first use and records how
+    long the import took. Later calls return the already-imported module.
+    """
+    if name not in BACKENDS:
+        raise ValueError(f"Backend '{name}' not recognized. Available backends: {list(BACKENDS.keys())}")
+
+    module_name = BACKENDS[name]
+    if name not in _import_times:
+        with _lock:
+            if name not in _import_times:
+                already_loaded = module_name in sys.modules
+                start = time.perf_counter()
+                importlib.import_module(module_name)
+                # A module some other import already pulled in costs nothing here
+                _import_times[name] = 0.0 if already_loaded else time.perf_counter() - start
+    return sys.modules[module_name]
+
+
+def import_report():
+    """
+    Lists every registered backend with whether it is loaded in this process
+    and, for those loaded through `import_backend`, how long the import took.
+    """
+    report = []
+    for name, module_name in BACKENDS.items():
+        report.append({
+            'backend': name,
+            'module': module_name,
+            'imported': module_name in sys.modules,
+            'import_seconds': _import_times.get(name),
+        })
+    return report
+
+
+def format_import_report():
+    """Human-readable version of `import_report`, one backend per line."""
+    lines = ["Backend imports:"]
+    for entry in import_report():
+        if entry['import_seconds'] is not None:
+            status = f"imported in {entry['import_seconds']:.3f}s"
+        elif entry['imported']:
+            status = "imported (untracked)"
+        else:
+            status = "not imported"
+        lines.append(f"  {entry['backend']:<10} {entry['module']:<26} {status}")
+    return "\n".join(lines)
+
+
+def _restore(cls):
+    """Unpickling hook of `Model`: imports the wrapper's backends before its state is loaded."""
+    for name in cls.required_backends:
+        import_backend(name)
+    return cls.__new__(cls)
+
+
+if __name__ == '__main__':
+    # Startup report of the API: what importing the app and loading the service pull in
+    start = time.perf_counter()
+    import src.interface.app  # noqa: F401
+    print(f"Imported src.interface.app in {time.perf_counter() - start:.3f}s")
+
+    from src.interface.services import credit_service
+    start = time.perf_counter()
+    credit_service.get_service()
+    print(f"Created the scoring service in {time.perf_counter() - start:.3f}s")
+
+    # The registry the app used, not this __main__ copy of the module
+    from src.model import backends
+    print(backends.format_import_report())
@@ -1,12 +1,8 @@
 import joblib
 import numpy as np
-import torch
-from pytorch_tabnet.tab_model import TabNetClassifier
 from sklearn.linear_model import LogisticRegression
-import lightgbm as lgb
-import xgboost as xgb
-import catboost as cb
 
+from src.model import backends
 from src.utils import get_config
 
 config = get_config.read_yaml_from_package()
@@ -15,11 +11,21 @@ class Model:
     """
     Abstract base class for all models.
     Defines the standard interface for training, prediction, and saving.
+
+    `required_backends` lists the frameworks a wrapper needs; they are imported
+    when the wrapper is built or unpickled, never when this module is imported.
     """
 
+    required_backends = ()
+
     def __init__(self, model):
         self.model = model
 
+    def __reduce_ex__(self, protocol):
+        # Unpickle through the backend registry, so loading a saved model imports
+        # (and times) its framework before the framework objects are restored
+        return backends._restore, (type(self),), self.__dict__
+
     def fit(self, X, y):
         """Fits the model to the training data."""
         print(f"--- Fitting {self.__class__.__name__} ---")
@@ -39,14 +45,20 @@ class Model:
 # --- Individual Model Wrappers (CORRECTED) ---
 
 class LightGBMModel(Model):
+    required_backends = ('lightgbm',)
+
     def __init__(self, **kwargs):
+        lgb = backends.import_backend('lightgbm')
         params = {'random_state': 42, 'class_weight': 'balanced'}
         params.update(kwargs) # Merge tuned params with defaults
         super().__init__(lgb.LGBMClassifier(**params))
 
 
 class XGBoostModel(Model):
+    required_backends = ('xgboost',)
+
     def __init__(self, **kwargs):
+        xgb = backends.import_backend('xgboost')
         ratio = config['data']['zero_to_one_ratio']
         params = {'random_state': 42, 'eval_metric': 'logloss', 'scale_pos_weight': ratio}
         params.update(kwargs) # Merge tuned params with defaults
@@ -54,7 +66,10 @@ class XGBoostModel(Model):
 
 
 class CatBoostModel(Model):
+    required_backends = ('catboost',)
+
     def __init__(self, **kwargs):
+        cb = backends.import_backend('catboost')
         params = {'random_state': 42, 'verbose': 0, 'auto_class_weights': 'Balanced'}
         params.update(kwargs) # Merge tuned params with defaults
         super().__init__(cb.CatBoostClassifier(**params))
@@ -180,14 +195,17 @@ class TabNetModel(Model):
     """
     Wrapper for the TabNet model.
     """
+    required_backends = ('tabnet',)
+
     def __init__(self, params=None):
+        tabnet = backends.import_backend('tabnet')
         if params is None:
             params = {
                 'verbose': 0,
                 'seed': 42,
             }
         # TabNetClassifier is not from sklearn, so we handle it slightly differently
-        super().__init__(TabNetClassifier(**params))
+        super().__init__(tabnet.TabNetClassifier(**params))
 
     def fit(self, X, y):
         """Fits the model to the training data."""
@@ -196,6 +214,8 @@ class TabNetModel(Model):
         X_np = X.to_numpy()
         y_np = y.to_numpy()
 
+        torch = backends.import_backend('torch')
+
         # CORRECTED: Define the weighted loss function here
         loss_fn = torch.nn.CrossEntropyLoss(
             weight=torch.tensor([1.0, config['data']['zero_to_one_ratio']], dtype=torch.float32)
@@ -221,6 +241,8 @@ class LightGBMZIBerModel(Model):
     A stacked model that first trains a LightGBM model and then uses its
     predictions as an additional feature for a ZIBer model.
     """
+    required_backends = ('lightgbm',)
+
     def __init__(self, lgbm_params=None, ziber_params=None):
         # Initialize the base models that will be used internally
         self.lgbm = LightGBMModel(**(lgbm_params or {})).model
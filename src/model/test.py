@@ -1,11 +1,11 @@
 from sklearn.metrics import roc_auc_score, average_precision_score, accuracy_score
 
-from src.utils import get_config, read_file
+from src.utils import artifacts, get_config, read_file
 
 config = get_config.read_yaml_from_package()
 
 def test_model(model):
-    model = read_file.read_model_data(model+'_model.joblib')
+    model = artifacts.load_model(model+'_model.joblib')
 
     test_df = read_file.read_processed_data('clean_test_data.csv')
 
@@ -1,11 +1,9 @@
+from pathlib import Path
+
 import pandas as pd
 from sklearn.metrics import roc_auc_score, average_precision_score, accuracy_score
-import optuna
-import lightgbm as lgb
-import xgboost as xgb
-import catboost as cb
-
 # Import your new model classes
+from src.model import backends
 from src.model.model import (
     LightGBMModel,
     XGBoostModel,
@@ -17,21 +15,23 @@ from src.utils import get_config, read_file
 
 config = get_config.read_yaml_from_package()
 
+# Model names accepted by get_model
+MODELS = {
+    'lightgbm': LightGBMModel,
+    'xgboost': XGBoostModel,
+    'catboost': CatBoostModel,
+    'logistic_regression': LogisticRegressionModel,
+    'ziber': ZIBerModel,
+    'tabnet': TabNetModel,
+    'ensemble': StackingEnsemble,
+    'lightgbm-ziber': LightGBMZIBerModel
+}
+
+
 def get_model(model_name, params):
     """Factory function to get a model instance by name."""
-    models = {
-        'lightgbm': LightGBMModel,
-        'xgboost': XGBoostModel,
-        'catboost': CatBoostModel,
-        'logistic_regression': LogisticRegressionModel,
-        'ziber': ZIBerModel,
-        'tabnet': TabNetModel,
-        'ensemble': StackingEnsemble,
-        'lightgbm-ziber': LightGBMZIBerModel
-    }
-
-    if model_name not in models:
-        raise ValueError(f"Model '{model_name}' not recognized. Available models: {list(models.keys())}")
+    if model_name not in MODELS:
+        raise ValueError(f"Model '{model_name}' not recognized. Available models: {list(MODELS.keys())}")
 
     if model_name == 'ensemble':
         # Define the base models for the ensemble here
@@ -44,9 +44,9 @@ def get_model(model_name, params):
         return StackingEnsemble(base_models=base_models)
 
     if params is None:
-        return models[model_name]()
+        return MODELS[model_name]()
     else:
-        return models[model_name](**params)
+        return MODELS[model_name](**params)
 
 def objective(trial, model_name):
     """Defines the search space for Optuna and returns the PR AUC score."""
@@ -76,7 +76,7 @@ def objective(trial, model_name):
             'random_state': 42,
             'verbose': -1
         }
-        model = lgb.LGBMClassifier(**params)
+        model = backends.import_backend('lightgbm').LGBMClassifier(**params)
     elif model_name == 'catboost':
         params = {
             'iterations': trial.suggest_int('iterations', 500, 2000),
@@ -87,7 +87,7 @@ def objective(trial, model_name):
             'random_state': 42,
             'verbose': 0
         }
-        model = cb.CatBoostClassifier(**params)
+        model = backends.import_backend('catboost').CatBoostClassifier(**params)
     else:
         raise ValueError(f"Tuning for model '{model_name}' is not defined.")
 
@@ -101,6 +101,7 @@ def tune_model_with_optuna(model_name, n_trials=10):
     Runs an Optuna study to find the best hyperparameters for a given model.
     """
     print(f"--- Starting Hyperparameter Tuning for {model_name} ---")
+    optuna = backends.import_backend('optuna')
     study = optuna.create_study(direction='maximize')
     study.optimize(lambda trial: objective(trial, model_name), n_trials=n_trials)
 
@@ -116,7 +117,18 @@ def tune_model_with_optuna(model_name, n_trials=10):
 
     return study.best_params
 
-def train_model(model_name, model_path, params=None):
+def train_model(model_name, model_path, params=None, register=True, activate=False):
+    """
+    Train, evaluate and save a model, then record it in the model registry.
+
+    Args:
+        model_name (str): Name accepted by `get_model`.
+        model_path: Where the trained model is saved.
+        params (dict, optional): Model parameters; the model's defaults if None.
+        register (bool): Record the saved artifact (with its preprocessor and
+                         validation metrics) as a new version in the registry.
+        activate (bool): Also make the new version the one running services serve.
+    """
     print(f"--- Preparing to Train Model: {model_name} ---")
 
     train_df = read_file.read_processed_data('clean_train_data.csv')
@@ -150,4 +162,17 @@ def train_model(model_name, model_path, params=None):
     print(f"Validation PR AUC (AUC-PR): {pr_auc:.4f}")
 
     # 6. Save Model (uses the .save() method from our base class)
-    model.save(model_path)
\ No newline at end of file
+    model.save(model_path)
+
+    # 7. Record the version in the model registry
+    if register:
+        # Imported here: the registry needs the web application's database
+        from src.interface.services import model_registry
+
+        metadata = model_registry.register_model(
+            Path(model_path),
+            model_name=model_name,
+            performance_metrics={"accuracy": float(acc), "roc_auc": float(auc), "pr_auc": float(pr_auc)},
+            activate=activate
+        )
+        print(f"Registered as {metadata['model_id']}" + (" (active)" if activate else ""))
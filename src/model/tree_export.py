@@ -0,0 +1,374 @@
+import json
+from collections import deque
+import numpy as np
+
+from src.utils import artifacts, get_config
+
+config = get_config.read_yaml_from_package()
+
+# Per-node missing value handling (LightGBM's MissingType; XGBoost always uses NAN)
+MISSING_NONE, MISSING_ZERO, MISSING_NAN = 0, 1, 2
+
+# LightGBM's kZeroThreshold: values this close to 0 count as zero for MISSING_ZERO
+_ZERO_THRESHOLD = 1e-35
+
+
+class TreeEnsemble:
+    """
+    Array-based copy of a trained binary gradient boosted tree ensemble,
+    scored with NumPy alone (no LightGBM or XGBoost import).
+
+    Every node of every tree is a position in the flat arrays below, and the
+    right child of a split always sits right after its left child. A row goes
+    left when `value <= threshold` (strict `<` splits are stored with the next
+    lower threshold) and leaves are their own left child with an infinite
+    threshold, so walking `max_depth` steps from the roots lands every row on
+    a leaf without any per-row branching.
+
+    Attributes:
+        feature (int32): Feature index tested by each node (0 for leaves).
+        threshold: Split threshold of each node (+inf for leaves).
+        left (int32): Position of the left child (the right child is left + 1).
+        default_left (bool): Side taken by missing values.
+        missing_type (int8): MISSING_NONE, MISSING_ZERO or MISSING_NAN.
+        value: Leaf output (0 for internal nodes).
+        roots (int32): Position of each tree's root.
+        max_depth (int): Steps needed to reach a leaf from any root.
+        base_margin (float): Raw score added to the sum of the leaves.
+        sigmoid (float): Raw scores are scaled by this before the sigmoid.
+        dtype: Precision the framework compares features in.
+        feature_names (list): Column order the model was trained on.
+        source (str): Framework the ensemble was exported from.
+    """
+
+    _ARRAYS = ('feature', 'threshold', 'left', 'default_left', 'missing_type', 'value', 'roots')
+
+    def __init__(self, feature, threshold, left, default_left, missing_type, value, roots,
+                 base_margin=0.0, sigmoid=1.0, dtype='float64', feature_names=None, source=None):
+        self.dtype = np.dtype(dtype)
+        self.feature = np.asarray(feature, dtype=np.int32)
+        self.threshold = np.asarray(threshold, dtype=self.dtype)
+        self.left = np.asarray(left, dtype=np.int32)
+        self.default_left = np.asarray(default_left, dtype=bool)
+        self.missing_type = np.asarray(missing_type, dtype=np.int8)
+        self.value = np.asarray(value, dtype=np.float64)
+        self.roots = np.asarray(roots, dtype=np.int32)
+        self.base_margin = float(base_margin)
+        self.sigmoid = float(sigmoid)
+        self.feature_names = list(feature_names) if feature_names is not None else None
+        self.source = source
+
+        self.max_depth = self._compute_max_depth()
+        # Without zero-as-missing splits, NaN-free rows can skip the missing value logic
+        self._has_zero_missing = bool((self.missing_type == MISSING_ZERO).any())
+
+    @property
+    def n_trees(self):
+        return len(self.roots)
+
+    @property
+    def n_nodes(self):
+        return len(self.feature)
+
+    def _compute_max_depth(self):
+        depth = 0
+        nodes = self.roots
+        is_leaf = self.left == np.arange(self.n_nodes)
+        while not is_leaf[nodes].all():
+            internal = nodes[~is_leaf[nodes]]
+            nodes = np.unique(np.concatenate([nodes[is_leaf[nodes]], self.left[internal], self.left[internal] + 1]))
+            depth += 1
+        return depth
+
+    def _as_matrix(self, X):
+        if hasattr(X, 'columns'):
+            if self.feature_names is not None and list(X.columns) != self.feature_names:
+                X = X[self.feature_names]
+            X = X.to_numpy(dtype=np.float64, na_value=np.nan)
+        return np.ascontiguousarray(X, dtype=self.dtype)
+
+    def predict_raw(self, X, chunk_size=None):
+        """
+        Sum of the leaf outputs plus the base margin for every row of X.
+
+        Args:
+            X (np.ndarray | pd.DataFrame): Rows laid out like the training matrix.
+            chunk_size (int, optional): Rows walked through all trees at once. The
+                                        working set is chunk_size * n_trees node
+                                        positions; by default about 64k of them,
+                                        which keeps it in cache.
+
+        Returns:
+            np.ndarray: Raw scores (log-odds), shape (n_rows,).
+        """
+        X = self._as_matrix(X)
+        n_rows = X.shape[0]
+        if chunk_size is None:
+            chunk_size = max(1, (1 << 16) // max(self.n_trees, 1))
+
+        raw = np.empty(n_rows, dtype=np.float64)
+        for start in range(0, n_rows, chunk_size):
+            raw[start:start + chunk_size] = self._walk(X[start:start + chunk_size])
+        return raw + self.base_margin
+
+    def _walk(self, X):
+        n_rows, n_features = X.shape
+        nodes = np.broadcast_to(self.roots, (n_rows, self.n_trees)).copy()
+        # Offset of each row in the flattened matrix, so one np.take fetches all values
+        row_offsets = (np.arange(n_rows, dtype=np.intp) * n_features)[:, None]
+        X_flat = X.ravel()
+        check_missing = self._has_zero_missing or np.isnan(X).any()
+
+        for _ in range(self.max_depth):
+            values = np.take(X_flat, row_offsets + self.feature[nodes])
+            threshold = self.threshold[nodes]
+
+            if check_missing:
+                missing_type = self.missing_type[nodes]
+                is_nan = np.isnan(values)
+                # LightGBM compares a NaN as 0 unless the node routes NaNs explicitly
+                values = np.where(is_nan & (missing_type != MISSING_NAN), 0, values)
+                is_missing = ((missing_type == MISSING_NAN) & is_nan) | \
+                             ((missing_type == MISSING_ZERO) & (np.abs(values) <= _ZERO_THRESHOLD))
+                go_right = np.where(is_missing, ~self.default_left[nodes], values > threshold)
+            else:
+                go_right = values > threshold
+
+            nodes = self.left[nodes] + go_right
+
+        return self.value[nodes].sum(axis=1)
+
+    def predict_proba(self, X, chunk_size=None):
+        """Class probabilities in the same (n_rows, 2) layout as the sklearn wrappers."""
+        proba = 1.0 / (1.0 + np.exp(-self.sigmoid * self.predict_raw(X, chunk_size)))
+        return np.column_stack([1.0 - proba, proba])
+
+    def save(self, path):
+        """Saves the arrays and settings to a single .npz file."""
+        meta = {
+            'base_margin': self.base_margin,
+            'sigmoid': self.sigmoid,
+            'dtype': self.dtype.name,
+            'feature_names': self.feature_names,
+            'source': self.source,
+        }
+        np.savez_compressed(path, meta=json.dumps(meta), **{name: getattr(self, name) for name in self._ARRAYS})
+        print(f"Tree ensemble saved to {path}")
+
+    @classmethod
+    def load(cls, path):
+        """Loads an ensemble written by `save`."""
+        with np.load(path) as data:
+            meta = json.loads(str(data['meta']))
+            return cls(**{name: data[name] for name in cls._ARRAYS}, **meta)
+
+
+class _TreeBuilder:
+    """
+    Collects the trees of a model dump, then lays their nodes out in the
+    `TreeEnsemble` format: breadth first, with each right child right after
+    its left sibling.
+    """
+
+    def __init__(self, dtype, strict):
+        self.dtype = np.dtype(dtype)
+        self.strict = strict
+        self._nodes = []
+        self._roots = []
+
+    def add_leaf(self, value):
+        self._nodes.append({'value': value})
+        return len(self._nodes) - 1
+
+    def add_split(self, feature, threshold, default_left, missing_type):
+        """Returns the id of the new split; its children are given with `set_children`."""
+        if self.strict:
+            # value < t  <=>  value <= the largest representable number below t
+            threshold = np.nextafter(self.dtype.type(threshold), self.dtype.type(-np.inf))
+        self._nodes.append({'feature': feature, 'threshold': threshold,
+                            'default_left': default_left, 'missing_type': missing_type})
+        return len(self._nodes) - 1
+
+    def set_children(self, node_id, left_id, right_id):
+        self._nodes[node_id]['children'] = (left_id, right_id)
+
+    def add_tree(self, root_id):
+        self._roots.append(root_id)
+
+    def build(self, **kwargs):
+        """Returns the `TreeEnsemble`; keyword arguments are passed through to it."""
+        arrays = {name: [] for name in ('feature', 'threshold', 'left', 'default_left', 'missing_type', 'value')}
+
+        def allocate():
+            # Leaf defaults: loop on itself whatever the value
+            position = len(arrays['left'])
+            arrays['feature'].append(0)
+            arrays['threshold'].append(np.inf)
+            arrays['left'].append(position)
+            arrays['default_left'].append(True)
+            arrays['missing_type'].append(MISSING_NAN)
+            arrays['value'].append(0.0)
+            return position
+
+        roots = []
+        for root_id in self._roots:
+            roots.append(allocate())
+            queue = deque([(root_id, roots[-1])])
+            while queue:
+                node_id, position = queue.popleft()
+                node = self._nodes[node_id]
+                if 'value' in node:
+                    arrays['value'][position] = node['value']
+                    continue
+                for name in ('feature', 'threshold', 'default_left', 'missing_type'):
+                    arrays[name][position] = node[name]
+                left_position = allocate()
+                allocate()
+                arrays['left'][position] = left_position
+                left_id, right_id = node['children']
+                queue.append((left_id, left_position))
+                queue.append((right_id, left_position + 1))
+
+        return TreeEnsemble(roots=roots, dtype=self.dtype.name, **arrays, **kwargs)
+
+
+def _export_lightgbm(estimator):
+    booster = estimator.booster_
+    dump = booster.dump_model()
+
+    if dump['num_class'] != 1 or not dump['objective'].startswith('binary'):
+        raise ValueError(f"Only binary LightGBM models can be exported, got objective '{dump['objective']}'.")
+    if dump.get('average_output'):
+        raise ValueError("Random forest mode LightGBM models cannot be exported.")
+
+    sigmoid = 1.0
+    for token in dump['objective'].split()[1:]:
+        if token.startswith('sigmoid:'):
+            sigmoid = float(token.split(':', 1)[1])
+
+    missing_types = {'None': MISSING_NONE, 'Zero': MISSING_ZERO, 'NaN': MISSING_NAN}
+    builder = _TreeBuilder(dtype='float64', strict=False)
+
+    def add_node(node):
+        if 'leaf_value' in node:
+            return builder.add_leaf(node['leaf_value'])
+        if node['decision_type'] != '<=':
+            raise ValueError("Categorical splits cannot be exported.")
+        node_id = builder.add_split(
+            node['split_feature'],
+            node['threshold'],
+            node['default_left'],
+            missing_types[node['missing_type']]
+        )
+        builder.set_children(node_id, add_node(node['left_child']), add_node(node['right_child']))
+        return node_id
+
+    for tree in dump['tree_info']:
+        builder.add_tree(add_node(tree['tree_structure']))
+
+    return builder.build(sigmoid=sigmoid, feature_names=dump['feature_names'], source='lightgbm')
+
+
+def _export_xgboost(estimator):
+    booster = estimator.get_booster()
+    dump = json.loads(booster.save_raw(raw_format='json'))
+    learner = dump['learner']
+
+    objective = learner['objective']['name']
+    if objective != 'binary:logistic':
+        raise ValueError(f"Only binary:logistic XGBoost models can be exported, got '{objective}'.")
+    if learner['gradient_booster']['name'] != 'gbtree':
+        raise ValueError(f"Booster '{learner['gradient_booster']['name']}' cannot be exported.")
+
+    # base_score is a probability (a one element list in recent versions);
+    # the trees add to its log-odds
+    base_score = float(learner['learner_model_param']['base_score'].strip('[]'))
+    base_margin = float(np.log(base_score / (1.0 - base_score)))
+
+    # XGBoost compares features as float32 and sends a row left when value < threshold
+    builder = _TreeBuilder(dtype='float32', strict=True)
+    for tree in learner['gradient_booster']['model']['trees']:
+        if tree.get('categories_nodes'):
+            raise ValueError("Categorical splits cannot be exported.")
+        node_ids = []
+        for node, left in enumerate(tree['left_children']):
+            if left == -1:
+                node_ids.append(builder.add_leaf(tree['split_conditions'][node]))
+            else:
+                node_ids.append(builder.add_split(
+                    tree['split_indices'][node],
+                    tree['split_conditions'][node],
+                    bool(tree['default_left'][node]),
+                    MISSING_NAN
+                ))
+        for node, (left, right) in enumerate(zip(tree['left_children'], tree['right_children'])):
+            if left != -1:
+                builder.set_children(node_ids[node], node_ids[left], node_ids[right])
+        builder.add_tree(node_ids[0])
+
+    return builder.build(base_margin=base_margin, feature_names=booster.feature_names, source='xgboost')
+
+
+EXPORTERS = {
+    'lightgbm': _export_lightgbm,
+    'xgboost': _export_xgboost,
+}
+
+
+def export_model(model):
+    """
+    Converts a trained `LightGBMModel` or `XGBoostModel` into a `TreeEnsemble`.
+
+    Args:
+        model (Model): The trained wrapper (its `.model` is the framework estimator).
+
+    Returns:
+        TreeEnsemble: The exported ensemble.
+    """
+    framework = type(model.model).__module__.split('.')[0]
+    if framework not in EXPORTERS:
+        raise ValueError(f"Cannot export '{type(model).__name__}'. Supported frameworks: {list(EXPORTERS.keys())}")
+    return EXPORTERS[framework](model.model)
+
+
+def max_abs_difference(model, ensemble, X):
+    """Largest absolute gap between the wrapper's and the ensemble's positive class probability."""
+    expected = model.predict_proba(X)[:, 1]
+    actual = ensemble.predict_proba(X)[:, 1]
+    return float(np.max(np.abs(expected - actual))) if len(expected) else 0.0
+
+
+def export_and_verify(model_name, X, tolerance=1e-5):
+    """
+    Exports `models/<model_name>_model.joblib` next to it as
+    `<model_name>_model.trees.npz` after checking it against `predict_proba`.
+
+    Args:
+        model_name (str): e.g. 'lightgbm' or 'xgboost'.
+        X (pd.DataFrame): Rows to compare both implementations on.
+        tolerance (float): Largest accepted probability difference.
+
+    Returns:
+        Path: Where the ensemble was saved.
+    """
+    model = artifacts.load_model(f"{model_name}_model.joblib")
+    ensemble = export_model(model)
+
+    difference = max_abs_difference(model, ensemble, X)
+    print(f"{ensemble.n_trees} trees, {ensemble.n_nodes} nodes, max depth {ensemble.max_depth}")
+    print(f"Max probability difference over {len(X)} rows: {difference:.3e}")
+    if difference > tolerance:
+        raise ValueError(f"Exported ensemble differs from the model by {difference:.3e} (tolerance {tolerance:.0e}).")
+
+    path = artifacts.model_path(f"{model_name}_model.trees.npz")
+    ensemble.save(path)
+    return path
+
+
+if __name__ == '__main__':
+    import sys
+    from src.utils import read_file
+
+    test_df = read_file.read_processed_data('clean_test_data.csv')
+    X_test = test_df.drop(columns=config['data']['drop_cols'])
+    export_and_verify(sys.argv[1] if len(sys.argv) > 1 else config['model_name'], X_test)
@@ -5,13 +5,8 @@ This package provides common, reusable functions for Exploratory Data Analysis (
 and for reading data files from specified directories.
 """
 
-from .analyze import (
-    perform_eda,
-    plot_univariate_distributions,
-    plot_heatmap,
-    plot_pairplot,
-    plot_bivariate_analysis
-)
+# The analyze functions are resolved on first access (see __getattr__ below),
+# since seaborn and matplotlib add a second to every import of this package.
 
 from .read_file import (
     read_raw_data,
@@ -37,13 +32,8 @@ This package provides common, reusable functions for Exploratory Data Analysis (
 and for reading data files from specified directories.
 """
 
-from .analyze import (
-    perform_eda,
-    plot_univariate_distributions,
-    plot_heatmap,
-    plot_pairplot,
-    plot_bivariate_analysis
-)
+# The analyze functions are resolved on first access (see __getattr__ below),
+# since seaborn and matplotlib add a second to every import of this package.
 
 from .read_file import (
     read_raw_data,
@@ -61,4 +51,12 @@ _all_ = [
     # Functions from read_file.py
     "read_raw_data",
     "read_processed_data"
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    if name in ("perform_eda", "plot_univariate_distributions", "plot_heatmap",
+                "plot_pairplot", "plot_bivariate_analysis"):
+        from . import analyze
+        return getattr(analyze, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,80 @@
+import os
+import threading
+import joblib
+
+from src.utils import get_config
+
+config = get_config.read_yaml()
+PROJECT_ROOT = get_config.get_project_root()
+
+
+class ArtifactRegistry:
+    """
+    Process-wide cache of deserialized artifacts (models, fitted preprocessors).
+
+    Each artifact is loaded once and shared by every caller. Before handing out
+    a cached object the registry compares the file's modification time and size
+    with the values recorded at load time, so a retrained artifact written to
+    the same path is picked up without restarting the process.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _fingerprint(path):
+        stat = os.stat(path)
+        return stat.st_mtime_ns, stat.st_size
+
+    def get(self, path, loader=joblib.load):
+        """
+        Returns the artifact stored at `path`, loading it with `loader` on first
+        use or when the file on disk has changed since the last load.
+        Objects built by different loaders from the same file are cached separately.
+        """
+        path = str(path)
+        key = (path, loader)
+        fingerprint = self._fingerprint(path)
+
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == fingerprint:
+            return entry[1]
+
+        with self._lock:
+            # Another thread may have reloaded the artifact while we waited.
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == fingerprint:
+                return entry[1]
+
+            print(f"Loading artifact: {path}")
+            artifact = loader(path)
+            self._entries[key] = (fingerprint, artifact)
+            return artifact
+
+    def fingerprint(self, path):
+        """Returns the (mtime_ns, size) pair of the file currently on disk."""
+        return self._fingerprint(str(path))
+
+    def clear(self):
+        """Drops every cached artifact."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Shared instance used by the training, testing and serving code
+registry = ArtifactRegistry()
+
+
+def model_path(filename):
+    return PROJECT_ROOT / config['paths']['model_data_directory'] / filename
+
+
+def load_model(filename):
+    """Returns the cached model artifact stored in the model directory."""
+    return registry.get(model_path(filename))
+
+
+def load_preprocessor():
+    """Returns the cached fitted objects written by `preprocess.preprocess_pipeline`."""
+    return registry.get(model_path("preprocessor.joblib"))